@@ -0,0 +1,136 @@
+from concurrent.futures import ProcessPoolExecutor
+import logging
+import glob
+import time
+import os
+
+from . import Profiler
+from .Parser import FileParser, FileCategoryParser, CSVParser, QIFParser, QFXParser, PDFParser
+from .Defines import Expense, ExpenseBatch, SymbolTable
+
+# Parser for each supported statement extension
+PARSER_MAP = {
+    '.csv' : CSVParser,
+    '.qif' : QIFParser,
+    '.qfx' : QFXParser,
+    '.ofx' : QFXParser,
+    '.qbo' : QFXParser,
+    '.pdf' : PDFParser,
+}
+
+# Characters that make a path a glob pattern
+GLOB_CHARACTERS = '*?['
+
+logger = logging.getLogger('BudgetBuddy.Batch')
+
+def parser_for(file_path : str) -> type:
+    '''Return the parser class for the file extension, None if unsupported'''
+    return PARSER_MAP.get(os.path.splitext(file_path)[1].lower())
+
+def expand_paths(patterns : list[str]) -> list[str]:
+    '''Expand files, directories and globs into a sorted list of supported statements'''
+    file_paths = []
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            for root, _, files in os.walk(pattern):
+                file_paths.extend(sorted(os.path.join(root, name) for name in files
+                                         if parser_for(name) is not None))
+        elif any(char in pattern for char in GLOB_CHARACTERS):
+            file_paths.extend(path for path in sorted(glob.glob(pattern, recursive=True))
+                              if os.path.isfile(path) and parser_for(path) is not None)
+        else:
+            file_paths.append(pattern)
+
+    # Drop duplicates, keep the first occurrence
+    return list(dict.fromkeys(file_paths))
+
+def parse_file(file_path : str, cache_path : str = None, options : dict = None) -> tuple[str, list[Expense], float]:
+    '''Parse a single statement, return its path, expenses and elapsed seconds
+
+    options maps a parser class name to extra keyword arguments for it,
+    for example {'PDFParser' : {'workers' : 4}}.
+    '''
+    start        = time.perf_counter()
+    parser_class = parser_for(file_path)
+    if parser_class is None:
+        raise ValueError(f'Unsupported file type {file_path}')
+    kwargs = dict((options or {}).get(parser_class.__name__, {}))
+
+    with Profiler.stage(parser_class.__name__) as timer:
+        if issubclass(parser_class, FileCategoryParser) and cache_path is not None:
+            cache = FileCategoryParser.open_cache(cache_path)
+            try:
+                parser : FileParser = parser_class(file_path, cache=cache, **kwargs)
+            finally:
+                cache.close()
+        else:
+            parser = parser_class(file_path, **kwargs)
+        timer.rows = len(parser.get_expense_list())
+
+    return file_path, parser.get_expense_list(), time.perf_counter() - start
+
+def parse_file_profiled(file_path : str, cache_path : str = None, options : dict = None) -> tuple[tuple, dict]:
+    '''parse_file under a Profile of its own, returns its result and the profile report'''
+    with Profiler.Profile() as profile:
+        result = parse_file(file_path, cache_path, options)
+    return result, profile.report()
+
+def merge_profiled(profile : Profiler.Profile, future) -> tuple:
+    '''Add a worker's profile report to the active one, return the parse_file result'''
+    result, report = future.result()
+    profile.merge(report)
+    return result
+
+def ingest_each(file_paths : list[str], workers : int = None, cache_path : str = None, options : dict = None):
+    '''Parse every statement across a process pool, yield (path, expenses, seconds) in file order
+
+    Files that fail to parse are logged and left out.
+    '''
+    def parsed(file_path, result):
+        try:
+            result = result()
+        except Exception as ex:
+            logger.error('Failed to parse %s: %s', file_path, ex)
+            return None
+        logger.info('Parsed %s: %d expenses in %.3fs', file_path, len(result[1]), result[2])
+        return result
+
+    if workers == 1 or len(file_paths) <= 1:
+        for file_path in file_paths:
+            result = parsed(file_path, lambda file_path=file_path: parse_file(file_path, cache_path, options))
+            if result is not None:
+                yield result
+    else:
+        # Workers profile themselves when this process is being profiled
+        profile = Profiler.active()
+        task    = parse_file if profile is None else parse_file_profiled
+        initializer = None if profile is None else Profiler.detach
+        with ProcessPoolExecutor(max_workers=workers, initializer=initializer) as executor:
+            futures = [(file_path, executor.submit(task, file_path, cache_path, options))
+                       for file_path in file_paths]
+            for file_path, future in futures:
+                result = parsed(file_path, future.result if profile is None else
+                                           lambda future=future: merge_profiled(profile, future))
+                if result is not None:
+                    yield result
+
+def ingest(file_paths : list[str], workers : int = None, cache_path : str = None,
+           options : dict = None) -> tuple[ExpenseBatch, list[tuple]]:
+    '''Parse every statement across a process pool
+
+    Returns the merged expenses in file order and a (path, expense count,
+    seconds) timing entry per file. The expenses are packed into one
+    ExpenseBatch with a symbol table of this run, so Calculator reduces
+    them on integer codes and the table is freed with the batch.
+    '''
+    batch   = ExpenseBatch(symbols=SymbolTable())
+    timings = []
+    start   = time.perf_counter()
+
+    for file_path, expenses, elapsed in ingest_each(file_paths, workers, cache_path, options):
+        batch.extend(expenses)
+        timings.append((file_path, len(expenses), elapsed))
+
+    logger.info('Parsed %d of %d files, %d expenses in %.3fs',
+                len(timings), len(file_paths), len(batch), time.perf_counter() - start)
+    return batch, timings
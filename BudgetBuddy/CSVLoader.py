@@ -0,0 +1,105 @@
+import polars as pl
+import logging
+import csv
+
+from .Parser import FileParser
+from .Calculator import PolarsCalculator
+
+# Header names of each bank's CSV export. Banks with a single signed amount
+# column list it as 'amount', charges_positive tells which sign a purchase has.
+PRESETS = {
+    'capital_one' : {'date' : 'Transaction Date', 'description' : 'Description', 'category' : 'Category',
+                     'debit' : 'Debit', 'credit' : 'Credit'},
+    'chase'       : {'date' : 'Transaction Date', 'description' : 'Description', 'category' : 'Category',
+                     'amount' : 'Amount', 'charges_positive' : False},
+    'discover'    : {'date' : 'Trans. Date', 'description' : 'Description', 'category' : 'Category',
+                     'amount' : 'Amount', 'charges_positive' : True},
+    'amex'        : {'date' : 'Date', 'description' : 'Description', 'amount' : 'Amount',
+                     'charges_positive' : True},
+}
+
+class CSVLoader:
+    '''Load a bank CSV export into a DataFrame for PolarsCalculator
+
+    Columns are found by header name through a preset, picked from the header
+    when none is given. The file is read by Polars' multithreaded reader and
+    descriptions and amounts are converted as column expressions, giving the
+    same values as CSVParser (amounts may also have thousands separators).
+    Exports without a category column get 'Unknown'.
+    '''
+    # Every character FileParser.clean_description removes, as a regex class
+    CLEAN_PATTERN = '[' + ''.join('\\' + chr(code) if chr(code) in '\\[]^-&~' else chr(code)
+                                  for code in FileParser.CLEAN_TABLE) + ']'
+
+    def __init__(self, file_path : str, preset : str = None):
+        self.logger    = logging.getLogger('BudgetBuddy.CSVLoader')
+        self.file_path = file_path
+        self.preset    = preset
+
+    @staticmethod
+    def read_header(file_path : str) -> list[str]:
+        '''Return the stripped column names of the file'''
+        with open(file_path, newline='', encoding='utf-8-sig') as in_file:
+            return [name.strip() for name in next(csv.reader(in_file), [])]
+
+    @staticmethod
+    def detect_preset(header : list[str]) -> str:
+        '''Return the first preset whose columns are all in the header, None if there is none'''
+        names = set(header)
+        for name, columns in PRESETS.items():
+            if all(column in names for key, column in columns.items() if key != 'charges_positive'):
+                return name
+        return None
+
+    @classmethod
+    def clean_description(cls, column : str) -> pl.Expr:
+        '''Vectorized FileParser.clean_description'''
+        return (pl.col(column).fill_null('')
+                              .str.replace_all(cls.CLEAN_PATTERN, '')
+                              .str.replace_all(r'\s+', ' ')
+                              .str.strip_chars(' '))
+
+    @staticmethod
+    def to_float(column : str) -> pl.Expr:
+        '''Vectorized FileParser.str_to_float, blank cells are 0.0 and anything else not a number raises'''
+        number = pl.col(column).str.replace_all(',', '').str.strip_chars()
+        return pl.when(number != '').then(number).cast(pl.Float64).fill_null(0.0)
+
+    def load(self) -> pl.DataFrame:
+        '''Return the description, category, credit and debit columns, None if the header does not fit a preset'''
+        header = self.read_header(self.file_path)
+        preset = self.preset or self.detect_preset(header)
+        if preset not in PRESETS:
+            self.logger.error('No CSV preset for %s with columns %s', self.file_path, header)
+            return None
+        columns = PRESETS[preset]
+        missing = [column for key, column in columns.items() if key != 'charges_positive' and column not in header]
+        if missing:
+            self.logger.error('%s has no %s columns for the %s preset', self.file_path, missing, preset)
+            return None
+        self.logger.debug('Loading %s with the %s preset', self.file_path, preset)
+
+        # Everything is read as text so the amounts are converted the same way in every file
+        frame = pl.read_csv(self.file_path, infer_schema=False, encoding='utf8-lossy',
+                            new_columns=header, empty_string_is_null=False)
+
+        if 'amount' in columns:
+            amount = self.to_float(columns['amount'])
+            charge = amount if columns['charges_positive'] else -amount
+            debit  = pl.when(charge > 0).then(charge).otherwise(0.0)
+            credit = pl.when(charge < 0).then(-charge).otherwise(0.0)
+        else:
+            debit  = self.to_float(columns['debit'])
+            credit = self.to_float(columns['credit'])
+
+        category = pl.col(columns['category']).fill_null('') if 'category' in columns else pl.lit('Unknown')
+        return frame.select(self.clean_description(columns['description']).alias('description'),
+                            category.alias('category'),
+                            credit.alias('credit'),
+                            debit.alias('debit')).cast(PolarsCalculator.SCHEMA)
+
+def load_csv(file_paths : list[str], preset : str = None) -> pl.DataFrame:
+    '''Load and concatenate several exports, files that cannot be loaded are left out'''
+    frames = [CSVLoader(file_path, preset).load() for file_path in file_paths]
+    frames = [frame for frame in frames if frame is not None]
+    return pl.concat(frames) if frames else pl.DataFrame(schema=PolarsCalculator.SCHEMA)
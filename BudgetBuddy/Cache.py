@@ -0,0 +1,77 @@
+import hashlib
+import logging
+import sqlite3
+import json
+import time
+
+def map_version(category_map : dict) -> str:
+    '''Hash the category map, any change to the map gives a new version'''
+    payload = json.dumps(category_map, sort_keys=True).encode('utf-8')
+    return hashlib.sha256(payload).hexdigest()[:16]
+
+class CategoryCache:
+    '''Persistent SQLite cache of description to category decisions'''
+    def __init__(self, path : str, version : str, max_entries : int = 50000):
+        self.version     = version
+        self.max_entries = max_entries
+        self.pending     = {}
+        self.touched     = {}
+        self.logger      = logging.getLogger('BudgetBuddy.Cache')
+
+        self.connection = sqlite3.connect(path, timeout=30)
+        self.connection.execute('''CREATE TABLE IF NOT EXISTS resolutions (
+                                       version     TEXT NOT NULL,
+                                       description TEXT NOT NULL,
+                                       category    TEXT NOT NULL,
+                                       used        REAL NOT NULL,
+                                       PRIMARY KEY (version, description))''')
+
+        # Entries resolved against another version of the map are stale
+        removed = self.connection.execute('DELETE FROM resolutions WHERE version != ?', (version,)).rowcount
+        self.connection.commit()
+        if removed:
+            self.logger.info('Invalidated %d cached categories from an older category map', removed)
+
+    def get(self, description : str) -> str:
+        '''Return the cached category, None on a miss'''
+        if description in self.pending:
+            return self.pending[description]
+
+        row = self.connection.execute('SELECT category FROM resolutions WHERE version = ? AND description = ?',
+                                      (self.version, description)).fetchone()
+        if row is None:
+            return None
+
+        self.touched[description] = time.time()
+        return row[0]
+
+    def put(self, description : str, category : str):
+        '''Store a decision, written on the next commit'''
+        self.pending[description] = category
+
+    def commit(self):
+        '''Write pending decisions, refresh usage and evict the least recently used entries'''
+        now = time.time()
+        with self.connection:
+            self.connection.executemany('INSERT OR REPLACE INTO resolutions VALUES (?, ?, ?, ?)',
+                                        [(self.version, description, category, now)
+                                         for description, category in self.pending.items()])
+            self.connection.executemany('UPDATE resolutions SET used = ? WHERE version = ? AND description = ?',
+                                        [(used, self.version, description)
+                                         for description, used in self.touched.items()])
+
+            count = self.connection.execute('SELECT COUNT(*) FROM resolutions').fetchone()[0]
+            if count > self.max_entries:
+                self.connection.execute('''DELETE FROM resolutions WHERE rowid IN (
+                                               SELECT rowid FROM resolutions ORDER BY used LIMIT ?)''',
+                                        (count - self.max_entries,))
+                self.logger.debug('Evicted %d cached categories', count - self.max_entries)
+
+        self.logger.debug('Cached %d new categories', len(self.pending))
+        self.pending = {}
+        self.touched = {}
+
+    def close(self):
+        '''Commit and close the database'''
+        self.commit()
+        self.connection.close()
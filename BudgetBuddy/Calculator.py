@@ -1,52 +1,272 @@
+import polars as pl
 import logging
+import heapq
+
+from .Defines import ExpenseBatch
 
 class Calculator:
-    '''Return various calculations on the data'''
+    '''Return various calculations on the data
 
-    def __init__(self, expense_list):
-        self.parsed_budget    = expense_list
+    Accepts any iterable of expenses and reduces it in a single pass. A list
+    or ExpenseBatch is kept for expenses_per_category, other iterables (such
+    as a parser's iter_expenses) are only reduced unless retain=True.
+    '''
+
+    def __init__(self, expense_list, retain : bool = None):
+        self.logger           = logging.getLogger('BudgetBuddy.Calculator')
+        self.parsed_budget    = expense_list if isinstance(expense_list, (list, ExpenseBatch)) else None
         self.expense_category = 0.00
         self.total_expense    = 0.00
+        self.summary, self.summary_expense = self.reduce(expense_list, retain)
         self.category_list    = self.create_category_list()
-        self.logger           = logging.getLogger('BudgetBuddy.Calculator')
+
+    def reduce(self, expenses, retain : bool = None) -> tuple[dict, dict]:
+        '''Walk the expenses once, build the category and expense summaries'''
+        summary         = {}
+        summary_expense = {}
+
+        # Lists are already in memory, streams are only kept when asked to
+        if retain and self.parsed_budget is None:
+            self.parsed_budget = []
+            expenses = self.retained(expenses, self.parsed_budget)
+
+        # Batches are reduced on their integer codes
+        if isinstance(expenses, ExpenseBatch):
+            return self.reduce_batch(expenses)
+
+        try:
+            for expense in expenses:
+                category = expense.category
+                summary.setdefault(category, 0.00)
+                summary[category] += expense.debit
+
+                descriptions = summary_expense.setdefault(category, {})
+                descriptions.setdefault(expense.description, 0.00)
+                descriptions[expense.description] += expense.debit
+        except KeyError as ex:
+            self.logger.error('Failed during reduction: %s', ex.with_traceback)
+            return None, None
+
+        return summary, summary_expense
+
+    @staticmethod
+    def reduce_batch(batch : ExpenseBatch) -> tuple[dict, dict]:
+        '''Group a batch on its integer codes, decode the keys at the end'''
+        width  = len(batch.symbols)
+        totals = {}
+        pairs  = {}
+        for category, description, debit in zip(batch.category_codes, batch.description_codes, batch.debits):
+            totals[category] = totals.get(category, 0.00) + debit
+
+            # One flat int key per (category, description) instead of nested dicts
+            pair = category * width + description
+            pairs[pair] = pairs.get(pair, 0.00) + debit
+
+        return Calculator.decode_reduction(batch.symbols.symbols, width, totals.items(), pairs.items())
+
+    @staticmethod
+    def decode_reduction(symbols : list, width : int, totals, pairs) -> tuple[dict, dict]:
+        '''Turn coded category totals and (category * width + description) totals into summaries'''
+        summary         = {symbols[category] : total for category, total in totals}
+        summary_expense = {}
+        for pair, total in pairs:
+            category, description = divmod(pair, width)
+            summary_expense.setdefault(symbols[category], {})[symbols[description]] = total
+        return summary, summary_expense
+
+    @staticmethod
+    def retained(expenses, kept : list):
+        '''Pass the expenses through, appending each one to kept'''
+        for expense in expenses:
+            kept.append(expense)
+            yield expense
 
     def create_category_list(self) -> list:
-        '''Iterate through the expenses, create a list of categories'''
-        return sorted(set([expense.category for expense in self.parsed_budget]))
+        '''Return the sorted categories of the expenses'''
+        return sorted(self.summary) if self.summary is not None else []
 
     def expenses_per_category(self,  category : str) -> list:
         '''Given a category, return a list of expenses'''
-        return [(expense.description, expense.debit) 
+        if self.parsed_budget is None:
+            self.logger.error('Expenses were streamed without retain, only reductions are available')
+            return None
+
+        if isinstance(self.parsed_budget, ExpenseBatch):
+            batch = self.parsed_budget
+            code  = batch.symbols.codes.get(category)
+            return [(batch.symbols.symbols[description], debit)
+                    for category_code, description, debit in zip(batch.category_codes, batch.description_codes, batch.debits)
+                    if category_code == code]
+
+        return [(expense.description, expense.debit)
                 for expense in self.parsed_budget if expense.category == category]
 
     def category_reduction(self) -> map:
         '''Return a map that contains the summary of all expenses'''
-        summary = {}
-
-        try:
-            for expense in self.parsed_budget:
-                summary.setdefault(expense.category, 0.00)
-                summary[expense.category] += expense.debit
-        except KeyError as ex:
-            self.logger.error('Failed during category reduction: %s', ex.with_traceback)
+        if self.summary is None:
             return None
 
-        self.logger.debug('Completed category reduction %s', summary)
-        return summary
+        self.logger.debug('Completed category reduction %s', self.summary)
+        return dict(self.summary)
 
     def expense_reduction(self):
         '''For expenses within a category reduce and provide percentages'''
-        summary = {}
+        if self.summary_expense is None:
+            return None
 
-        try:
-            for expense in self.parsed_budget:
-                description = expense.description
-                summary.setdefault(expense.category, {})
-                summary[expense.category].setdefault(description, 0.00)
-                summary[expense.category][description] += expense.debit
-        except KeyError as ex:
-            self.logger.error('Failed during expense reduction: %s', ex.with_traceback)
+        self.logger.debug('Completed expense reduction %s', self.summary_expense)
+        return {category : dict(descriptions) for category, descriptions in self.summary_expense.items()}
+
+    def hierarchy_reduction(self) -> tuple[dict, dict, float]:
+        '''Return the category totals, the per description totals and the grand total
+
+        All three come from the single reduction pass and are not copied, so
+        treat them as read only.
+        '''
+        if self.summary is None:
             return None
 
-        self.logger.debug('Completed expense reduction %s', summary)
-        return summary
\ No newline at end of file
+        return self.summary, self.summary_expense, sum(self.summary.values())
+
+    def sunburst_data(self, root : str = 'Total Cost') -> tuple[list, list, list]:
+        '''Return the sunburst labels, parents and values arrays'''
+        reduction = self.hierarchy_reduction()
+        if reduction is None:
+            return None
+        summary, summary_expense, total_cost = reduction
+
+        # Start of list, then the categories under the root
+        labels  = [root, *summary]
+        parents = ['', *([root] * len(summary))]
+        values  = [total_cost, *summary.values()]
+
+        # Finally, the expenses with their category as parent
+        for category, descriptions in summary_expense.items():
+            labels.extend(descriptions)
+            parents.extend([category] * len(descriptions))
+            values.extend(descriptions.values())
+
+        return labels, parents, values
+
+    def sunburst_tree(self, root : str = 'Total Cost', top : int = None, min_share : float = 0.0,
+                      other : str = 'Other') -> tuple[list, list, list, list]:
+        '''Return the sunburst ids, labels, parents and values arrays with the small leaves folded
+
+        Each category keeps at most its top largest descriptions, and only
+        those worth at least min_share of the total cost. The rest add up
+        to one other leaf in that category, so the figure stays the same
+        size however many descriptions there are. Several categories then
+        have a leaf of the same label, so every node gets an id (its path)
+        and parents refer to ids. A description named like the other leaf is
+        added to it when its category is folded, ids must stay unique.
+        '''
+        reduction = self.hierarchy_reduction()
+        if reduction is None:
+            return None
+        summary, summary_expense, total_cost = reduction
+
+        ids     = [root, *summary]
+        labels  = [root, *summary]
+        parents = ['', *([root] * len(summary))]
+        values  = [total_cost, *summary.values()]
+
+        cutoff = min_share * total_cost
+        for category, descriptions in summary_expense.items():
+            kept = descriptions.items()
+            if cutoff > 0:
+                kept = [item for item in kept if item[1] >= cutoff]
+            if top is not None and len(kept) > top:
+                kept = heapq.nlargest(top, kept, key=lambda item: item[1])
+            folded = len(kept) < len(descriptions)
+            if folded and other in descriptions:
+                kept = [item for item in kept if item[0] != other]
+
+            ids.extend(f'{category}/{description}' for description, _ in kept)
+            labels.extend(description for description, _ in kept)
+            parents.extend([category] * len(kept))
+            values.extend(value for _, value in kept)
+
+            # Summed from the folded leaves so no rounding is lost to a subtraction
+            if folded:
+                kept_names = {description for description, _ in kept}
+                ids.append(f'{category}/{other}')
+                labels.append(other)
+                parents.append(category)
+                values.append(sum(value for description, value in descriptions.items()
+                                  if description not in kept_names))
+
+        return ids, labels, parents, values
+
+class PolarsCalculator(Calculator):
+    '''Calculator engine holding the expenses as a Polars DataFrame
+
+    Accepts a DataFrame with description, category, credit and debit columns
+    or any iterable of expenses. Reductions are vectorized group-bys that
+    give the same dicts as Calculator.
+    '''
+    SCHEMA = {'description' : pl.Utf8, 'category' : pl.Utf8, 'credit' : pl.Float64, 'debit' : pl.Float64}
+
+    def __init__(self, expense_list):
+        self.frame      = None
+        self.partitions = None
+        super().__init__(expense_list)
+
+    @classmethod
+    def to_frame(cls, expenses) -> pl.DataFrame:
+        '''Collect the expenses into columns'''
+        if isinstance(expenses, ExpenseBatch):
+            # Decode the string columns with a vectorized gather on the symbol table
+            symbols = pl.Series(expenses.symbols.symbols, dtype=pl.Utf8)
+            return pl.DataFrame({'description' : symbols.gather(list(expenses.description_codes)),
+                                 'category'    : symbols.gather(list(expenses.category_codes)),
+                                 'credit'      : list(expenses.credits),
+                                 'debit'       : list(expenses.debits)}, schema=cls.SCHEMA)
+
+        columns = {name : [] for name in cls.SCHEMA}
+        for expense in expenses:
+            columns['description'].append(expense.description)
+            columns['category'].append(expense.category)
+            columns['credit'].append(expense.credit)
+            columns['debit'].append(expense.debit)
+        return pl.DataFrame(columns, schema=cls.SCHEMA)
+
+    def reduce(self, expenses, retain : bool = None) -> tuple[dict, dict]:
+        '''Group the frame by category and by description within a category'''
+        self.frame         = expenses if isinstance(expenses, pl.DataFrame) else self.to_frame(expenses)
+        self.parsed_budget = None
+
+        # A running sum keeps the row order additions of Calculator, so the floats match exactly
+        debit_total = pl.col('debit').cum_sum().last()
+
+        # Batches group on their integer codes, which is cheaper than hashing strings
+        if isinstance(expenses, ExpenseBatch):
+            width = len(expenses.symbols)
+            codes = pl.DataFrame({'category'    : pl.Series(expenses.category_codes, dtype=pl.UInt64),
+                                  'description' : pl.Series(expenses.description_codes, dtype=pl.UInt64),
+                                  'debit'       : pl.Series(expenses.debits, dtype=pl.Float64)})
+            codes = codes.with_columns(pair=pl.col('category') * width + pl.col('description'))
+
+            totals = codes.group_by('category', maintain_order=True).agg(debit_total)
+            pairs  = codes.group_by('pair', maintain_order=True).agg(debit_total)
+            return self.decode_reduction(expenses.symbols.symbols, width, totals.iter_rows(), pairs.iter_rows())
+
+        categories = self.frame.group_by('category', maintain_order=True).agg(debit_total)
+        summary    = dict(categories.iter_rows())
+
+        summary_expense = {}
+        descriptions    = self.frame.group_by('category', 'description', maintain_order=True).agg(debit_total)
+        for category, description, debit in descriptions.iter_rows():
+            summary_expense.setdefault(category, {})[description] = debit
+
+        return summary, summary_expense
+
+    def expenses_per_category(self, category : str) -> list:
+        '''Given a category, return a list of expenses'''
+        # Split the frame by category once instead of filtering it on every call
+        if self.partitions is None:
+            self.partitions = {key[0] : frame.select('description', 'debit')
+                               for key, frame in self.frame.partition_by('category', as_dict=True).items()}
+
+        if category not in self.partitions:
+            return []
+        return self.partitions[category].rows()
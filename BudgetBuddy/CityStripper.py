@@ -0,0 +1,75 @@
+class CityStripper:
+    '''Remove "<city><state>" locations from descriptions
+
+    Each state keeps a trie of its reversed, normalized city names. Matching
+    finds every occurrence of the state code and walks the trie backwards from
+    it, so the cost depends on the length of the description and the longest
+    city name rather than on how many cities are known.
+    '''
+    END = None
+    ASCII_LOWER = str.maketrans('ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz')
+
+    def __init__(self, cities_by_state : dict = None, normalize = None):
+        self.normalize = normalize
+        self.tries     = {}
+        self.count     = 0
+
+        for state, cities in (cities_by_state or {}).items():
+            self.add_state(state, cities)
+
+    def add_state(self, state : str, cities : list[str]):
+        '''Add the cities of a state, matched when directly followed by the state code'''
+        trie = self.tries.setdefault(state.translate(self.ASCII_LOWER), {})
+
+        for city in cities:
+            name = self.normalize(city) if self.normalize is not None else city
+            node = trie
+            for char in reversed(name.translate(self.ASCII_LOWER)):
+                node = node.setdefault(char, {})
+
+            # The first city added wins when two names end at the same place
+            if self.END not in node:
+                node[self.END] = self.count
+            self.count += 1
+
+    def find(self, description : str) -> list[tuple[int, int]]:
+        '''Return the (start, end) spans to remove, leftmost first and non-overlapping'''
+        text    = description.translate(self.ASCII_LOWER)
+        matches = []
+
+        for state, trie in self.tries.items():
+            anchor = text.find(state)
+            while anchor != -1:
+                node = trie
+                pos  = anchor - 1
+                while pos >= 0:
+                    node = node.get(text[pos])
+                    if node is None:
+                        break
+                    if self.END in node:
+                        matches.append((pos, node[self.END], anchor + len(state)))
+                    pos -= 1
+                anchor = text.find(state, anchor + 1)
+
+        # Same order a regex alternation would pick: leftmost start, then first city added
+        spans = []
+        last  = 0
+        for start, _, end in sorted(matches):
+            if start >= last:
+                spans.append((start, end))
+                last = end
+        return spans
+
+    def strip(self, description : str) -> str:
+        '''Remove every city/state location from the description'''
+        spans = self.find(description)
+        if not spans:
+            return description
+
+        pieces = []
+        last   = 0
+        for start, end in spans:
+            pieces.append(description[last:start])
+            last = end
+        pieces.append(description[last:])
+        return ''.join(pieces)
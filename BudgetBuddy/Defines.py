@@ -1,7 +1,9 @@
-from enum import Enum  
+from array import array
+from enum import Enum
 
 class Types(Enum):
     '''Types to index CSV'''
+    DATE        = 0
     DESCRIPTION = 3
     CATEGORY    = 4
     DEBIT       = 5
@@ -9,14 +11,106 @@ class Types(Enum):
 
 class Expense():
     '''Responsible for storing the data from the CSV'''
+    __slots__ = ('description', 'category', 'credit', 'debit', 'date')
+
     class ExpenseType(Enum):
         '''Expense can either be debit or credit'''
         DEBIT  = 0
         CREDIT = 1
 
-    def __init__(self, description, category, credit, debit):
+    def __init__(self, description, category, credit, debit, date = None):
         self.description = description
         self.category = category
         self.credit = credit
         self.debit = debit
-        self.type = None
\ No newline at end of file
+        self.date = date
+
+class SymbolTable():
+    '''Maps each distinct string to a small integer code'''
+    def __init__(self):
+        self.codes   = {}
+        self.symbols = []
+
+    def encode(self, symbol : str) -> int:
+        '''Return the code of the string, adding it on first sight'''
+        code = self.codes.get(symbol)
+        if code is None:
+            code = self.codes[symbol] = len(self.symbols)
+            self.symbols.append(symbol)
+        return code
+
+    def decode(self, code : int) -> str:
+        '''Return the string for a code'''
+        return self.symbols[code]
+
+    def intern(self, symbol : str) -> str:
+        '''Return the shared copy of the string'''
+        code = self.codes.get(symbol)
+        if code is None:
+            code = self.encode(symbol)
+        return self.symbols[code]
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+class ExpenseBatch():
+    '''Struct of arrays storage for many expenses
+
+    Amounts are packed into array('d'). Descriptions and categories are
+    stored as codes into a SymbolTable, which can be shared between batches.
+    Dates are coded into a table of the batch's own, so sharing the
+    description table does not keep every date ever seen.
+    '''
+    def __init__(self, expenses = (), symbols : SymbolTable = None):
+        self.symbols           = symbols if symbols is not None else SymbolTable()
+        self.dates             = SymbolTable()
+        self.description_codes = array('I')
+        self.category_codes    = array('I')
+        self.date_codes        = array('I')
+        self.credits           = array('d')
+        self.debits            = array('d')
+        self.extend(expenses)
+
+    def append(self, expense : Expense):
+        '''Add a single expense'''
+        self.description_codes.append(self.symbols.encode(expense.description))
+        self.category_codes.append(self.symbols.encode(expense.category))
+        self.date_codes.append(self.dates.encode(expense.date or ''))
+        self.credits.append(expense.credit)
+        self.debits.append(expense.debit)
+
+    def extend(self, expenses):
+        '''Add every expense of an iterable'''
+        for expense in expenses:
+            self.append(expense)
+
+    @property
+    def descriptions(self) -> list[str]:
+        '''Decoded description of every expense'''
+        return [self.symbols.symbols[code] for code in self.description_codes]
+
+    @property
+    def categories(self) -> list[str]:
+        '''Decoded category of every expense'''
+        return [self.symbols.symbols[code] for code in self.category_codes]
+
+    def rows(self):
+        '''Yield (category, description, debit) without building expenses'''
+        symbols = self.symbols.symbols
+        for category, description, debit in zip(self.category_codes, self.description_codes, self.debits):
+            yield symbols[category], symbols[description], debit
+
+    def __len__(self) -> int:
+        return len(self.debits)
+
+    def __getitem__(self, index : int) -> Expense:
+        symbols = self.symbols.symbols
+        return Expense(symbols[self.description_codes[index]], symbols[self.category_codes[index]],
+                       self.credits[index], self.debits[index], self.dates.symbols[self.date_codes[index]] or None)
+
+    def __iter__(self):
+        symbols = self.symbols.symbols
+        dates   = self.dates.symbols
+        for description, category, credit, debit, date in zip(self.description_codes, self.category_codes,
+                                                              self.credits, self.debits, self.date_codes):
+            yield Expense(symbols[description], symbols[category], credit, debit, dates[date] or None)
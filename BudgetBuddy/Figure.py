@@ -0,0 +1,53 @@
+'''Plotly figures built as plain dicts
+
+go.Figure validates and copies every label, parent and value it is given,
+which dominates once a sunburst has thousands of description leaves. The
+builders here return the dict the validated figure serializes to, default
+template included, so it renders the same. Pass it to plotly.io with
+validate=False (show, write_html, to_json) to skip the validation.
+'''
+import numpy as np
+import plotly.io as pio
+
+MARGIN = {'t' : 0, 'l' : 0, 'r' : 0, 'b' : 0}
+
+_templates = {}
+
+def template() -> dict:
+    '''The default template as go.Figure puts it in the layout, None when there is none
+
+    Converted once per template name and shared by every figure, do not modify it.
+    '''
+    name = pio.templates.default
+    if name is None:
+        return None
+    if name not in _templates:
+        _templates[name] = pio.templates[name].to_plotly_json()
+    return _templates[name]
+
+def layout(**properties) -> dict:
+    '''A layout with the default template'''
+    default = template()
+    return properties if default is None else {'template' : default, **properties}
+
+def sunburst(labels : list, parents : list, values, ids : list = None) -> dict:
+    '''The figure of go.Figure(go.Sunburst(...)) with no margins, parents refer to ids when given'''
+    trace = {'type'    : 'sunburst',
+             'labels'  : labels,
+             'parents' : parents,
+             'values'  : np.asarray(values, dtype=np.float64)}
+    if ids is not None:
+        trace['ids'] = ids
+    return {'data' : [trace], 'layout' : layout(margin=dict(MARGIN))}
+
+def pie(summary : dict, title : str) -> dict:
+    '''The figure of px.pie over Category and Cost columns'''
+    trace = {'type'          : 'pie',
+             'domain'        : {'x' : [0.0, 1.0], 'y' : [0.0, 1.0]},
+             'hovertemplate' : 'Category=%{label}<br>Cost=%{value}<extra></extra>',
+             'labels'        : list(summary),
+             'legendgroup'   : '',
+             'name'          : '',
+             'showlegend'    : True,
+             'values'        : np.fromiter(summary.values(), dtype=np.float64, count=len(summary))}
+    return {'data' : [trace], 'layout' : layout(legend={'tracegroupgap' : 0}, title={'text' : title})}
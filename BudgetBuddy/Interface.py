@@ -1,69 +1,123 @@
-import plotly.express as px
-import polars as pl
-from plotly import graph_objects as go
+import plotly.io as pio
 import logging
+import json
+import os
+
+from . import Figure, Profiler
+
+# Version of the JSON report written by write_json
+REPORT_FORMAT = 1
 
 class Interface():
-    '''Display component for the program'''
-    def __init__(self, calculator):
+    '''Display component for the program
+
+    generate_sunburst_data and generate_pie show their chart in a browser.
+    write_html and write_json write a report instead, for servers and batch
+    jobs where nothing can be shown.
+
+    With top or min_share, the sunburst keeps only the largest descriptions
+    of each category and folds the rest into an Other leaf, see
+    Calculator.sunburst_tree. The JSON report always has every description.
+    '''
+    def __init__(self, calculator, top : int = None, min_share : float = 0.0):
         self.calculator = calculator
+        self.top        = top
+        self.min_share  = min_share
         self.logger     = logging.getLogger('BudgetBuddy.Interface')
+        self.charts     = {'sunburst' : self.sunburst_figure, 'pie' : self.pie_figure}
+
+
+    def sunburst_figure(self) -> dict:
+        '''Pull data from the calculator and format for sunburst
+
+        The figure is a plain dict, see Figure, give it to plotly.io with validate=False.
+        '''
+
+        with Profiler.stage('sunburst_data') as timer:
+            if self.top is None and not self.min_share:
+                ids = None
+                labels, parents, values = self.calculator.sunburst_data()
+            else:
+                ids, labels, parents, values = self.calculator.sunburst_tree(top=self.top, min_share=self.min_share)
+            timer.rows = len(labels)
+
+        # Build the sun graph
+        with Profiler.stage('figure', len(labels)):
+            fig = Figure.sunburst(labels, parents, values, ids)
+
+        return fig
 
 
     def generate_sunburst_data(self):
-        '''Pull data from the calculator and format for sunburst'''
+        '''Display the sunburst graph'''
 
-        summary = self.calculator.category_reduction()
-        summary_expense = self.calculator.expense_reduction()
-        total_cost = sum(summary.values())
-
-        # Start of list
-        parent = ["Total Cost",]
-        child  = ["",]
-        values = [total_cost]
-
-        # Next, display categories with cost, parent is total cost
-        for category, cost in summary.items():
-            parent.append(category)
-            child.append(parent[0])
-            values.append(cost)
-
-        # Finally, display expenses with category as parent
-        for category, dic in summary_expense.items():
-            for description, cost in dic.items():
-                parent.append(description)
-                child.append(category)
-                values.append(cost)
-
-        # Display the sun graph
-        fig = go.Figure(go.Sunburst(
-            labels=parent,
-            parents=child,
-            values=values,
-        ))
+        fig = self.sunburst_figure()
 
         self.logger.debug('Displaying Graph!')
-        fig.update_layout(margin = dict(t=0, l=0, r=0, b=0))
-        #fig.show(renderer='iframe')
-        fig.show()
+        with Profiler.stage('show'):
+            #pio.show(fig, renderer='iframe', validate=False)
+            pio.show(fig, validate=False)
 
 
-    def generate_pie(self):
-        '''Given the categories and amounts, generate a pie graph'''
+    def pie_figure(self) -> dict:
+        '''Given the categories and amounts, build a pie graph'''
 
         summary = self.calculator.category_reduction()
+        title   = f'Statement Overview: {sum(summary.values())}'
+
+        return Figure.pie(summary, title)
+
+
+    def generate_pie(self):
+        '''Display the pie graph'''
+
+        pio.show(self.pie_figure(), validate=False)
+
+
+    def write_html(self, file_path : str, include_plotlyjs : str = 'directory', chart : str = 'sunburst') -> str:
+        '''Write a chart to an HTML file without opening a browser, return the path
+
+        With include_plotlyjs='directory' the page loads plotly.min.js from its
+        own directory, which plotly writes there once, so every report in a
+        directory shares one bundle. 'cdn' loads it from the plotly CDN and
+        'inline' puts the whole bundle in the page.
+        '''
+        if chart not in self.charts:
+            self.logger.error('Unknown chart %s, choose from %s', chart, list(self.charts))
+            return None
+
+        fig = self.charts[chart]()
+        os.makedirs(os.path.dirname(os.path.abspath(file_path)), exist_ok=True)
+
+        with Profiler.stage('write_html'):
+            pio.write_html(fig, file_path, include_plotlyjs=include_plotlyjs, full_html=True, validate=False)
+        self.logger.info('Wrote the %s chart to %s', chart, file_path)
+        return file_path
+
+
+    def write_json(self, file_path : str) -> str:
+        '''Write the totals as compact JSON without building a figure, return the path
 
-        category_list = list(summary.keys())
-        cost_list = list(summary.values())
-        title = f'Statement Overview: {sum(summary.values())}'
+        The report holds the grand total, the total of each category and the
+        total of each description within its category, rounded to the cent.
+        '''
+        reduction = self.calculator.hierarchy_reduction()
+        if reduction is None:
+            self.logger.error('Nothing to write to %s, the reduction failed', file_path)
+            return None
+        summary, summary_expense, total_cost = reduction
 
-        # Create the dataframe
-        df = pl.DataFrame(
-            {
-                'Category' : category_list,
-                'Cost'     : cost_list
-            }
-        )
+        report = {
+            'version'    : REPORT_FORMAT,
+            'total'      : round(total_cost, 2),
+            'categories' : {category : round(cost, 2) for category, cost in summary.items()},
+            'expenses'   : {category : {description : round(cost, 2) for description, cost in descriptions.items()}
+                            for category, descriptions in summary_expense.items()},
+        }
 
-        fig = px.pie(df, values='Cost', names='Category', title=title)
-        fig.show()
\ No newline at end of file
+        os.makedirs(os.path.dirname(os.path.abspath(file_path)), exist_ok=True)
+        with Profiler.stage('write_json'):
+            with open(file_path, 'w', encoding='utf-8') as out_file:
+                json.dump(report, out_file, separators=(',', ':'))
+        self.logger.info('Wrote the totals to %s', file_path)
+        return file_path
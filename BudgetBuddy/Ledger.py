@@ -0,0 +1,165 @@
+from collections.abc import Iterator
+import hashlib
+import logging
+import sqlite3
+import time
+import os
+import re
+
+from .Defines import Expense
+from .Parser import PDFParser
+
+class Ledger:
+    '''Local SQLite ledger of imported statements and their transactions
+
+    Statements are keyed by a hash of their contents, so an unchanged file is
+    never parsed twice. Transactions are keyed by a fingerprint of date,
+    amounts, description and how many identical rows came before it in the
+    same file, so overlapping statements only add the rows that are new.
+
+    Dates without a year (PDF statements print "Jan 3") are fingerprinted
+    with their year, so the same charge on the same day of another year is
+    kept. It follows from the month the statement period ends, read from a
+    PDF's summary pages or else from a month and year in the file name
+    (jan2024.pdf, 2024-01.pdf). When neither is known the statement's hash
+    stands in for the year, so those rows only dedupe within their file.
+    '''
+    YEAR       = re.compile(r'(?:19|20)[0-9]{2}')
+    FULL_DATE  = re.compile(r'[0-9]+[/.-][0-9]+[/.-][0-9]+')
+    DATE_MONTH = re.compile(r'\s*(?:(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)|([0-9]{1,2})[/.-])', re.IGNORECASE)
+
+    # A year is only taken from a file name next to its month, a lone 2034 may be a card number
+    NAME_PERIODS = (re.compile(r'(?P<month>jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*[ _.-]?'
+                               r'(?P<year>(?:19|20)[0-9]{2})(?![0-9])'),
+                    re.compile(r'(?<![0-9])(?P<year>(?:19|20)[0-9]{2})[ _.-]?(?P<month>0[1-9]|1[0-2])(?![0-9])'),
+                    re.compile(r'(?<![0-9])(?P<month>0[1-9]|1[0-2])[ _.-]?(?P<year>(?:19|20)[0-9]{2})(?![0-9])'))
+
+    def __init__(self, path : str):
+        self.logger     = logging.getLogger('BudgetBuddy.Ledger')
+        self.connection = sqlite3.connect(path, timeout=30)
+        with self.connection:
+            self.connection.execute('''CREATE TABLE IF NOT EXISTS statements (
+                                           hash         TEXT PRIMARY KEY,
+                                           path         TEXT NOT NULL,
+                                           imported     REAL NOT NULL,
+                                           transactions INTEGER NOT NULL)''')
+            self.connection.execute('''CREATE TABLE IF NOT EXISTS transactions (
+                                           fingerprint TEXT PRIMARY KEY,
+                                           date        TEXT,
+                                           description TEXT NOT NULL,
+                                           category    TEXT NOT NULL,
+                                           credit      REAL NOT NULL,
+                                           debit       REAL NOT NULL,
+                                           statement   TEXT NOT NULL)''')
+
+    @staticmethod
+    def file_hash(file_path : str) -> str:
+        '''Hash the contents of a statement'''
+        digest = hashlib.sha256()
+        with open(file_path, 'rb') as in_file:
+            for chunk in iter(lambda: in_file.read(1 << 20), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    @classmethod
+    def statement_end(cls, file_path : str) -> tuple[int, int]:
+        '''Return the (year, month) the statement period ends, None if it cannot be determined'''
+        if file_path.lower().endswith('.pdf') and os.path.isfile(file_path):
+            end = PDFParser.statement_end(file_path)
+            if end is not None:
+                return end
+
+        name = os.path.basename(file_path).lower()
+        for pattern in cls.NAME_PERIODS:
+            match = pattern.search(name)
+            if match is not None:
+                month = match['month']
+                month = PDFParser.MONTHS.index(month) + 1 if month.isalpha() else int(month)
+                return int(match['year']), month
+        return None
+
+    @classmethod
+    def dated(cls, date : str, end : tuple[int, int]) -> str:
+        '''Add the year to a date that has none, None when it needs one and end is not known
+
+        Months after the month the statement ends are in the year before.
+        '''
+        if date is None or cls.YEAR.search(date) or cls.FULL_DATE.search(date):
+            return date
+        if end is None:
+            return None
+
+        year, end_month = end
+        match = cls.DATE_MONTH.match(date)
+        if match is not None:
+            month = PDFParser.MONTHS.index(match[1].lower()) + 1 if match[1] else int(match[2])
+            if month > end_month:
+                year -= 1
+        return f'{date} {year}'
+
+    @staticmethod
+    def fingerprint(expense : Expense, occurrence : int, date : str = None) -> str:
+        '''Identify a transaction by date, amounts, description and its occurrence within the file
+
+        date replaces the expense's date, see dated.
+        '''
+        date = expense.date if date is None else date
+        key  = f'{date}|{expense.credit:.2f}|{expense.debit:.2f}|{expense.description}|{occurrence}'
+        return hashlib.sha1(key.encode('utf-8')).hexdigest()
+
+    def pending(self, file_paths : list[str]) -> dict[str, str]:
+        '''Return {path : hash} for the statements that have not been imported yet'''
+        pending = {}
+        seen    = set()
+        for file_path in file_paths:
+            file_hash = self.file_hash(file_path)
+            if file_hash in seen:
+                continue
+            seen.add(file_hash)
+
+            known = self.connection.execute('SELECT 1 FROM statements WHERE hash = ?', (file_hash,)).fetchone()
+            if known is None:
+                pending[file_path] = file_hash
+            else:
+                self.logger.info('Skipping %s, already imported', file_path)
+        return pending
+
+    def record(self, file_path : str, file_hash : str, expenses, year : int = None) -> int:
+        '''Add the statement and its new transactions, return how many transactions were added
+
+        year is the year of every date without one, by default it is found
+        through statement_end.
+        '''
+        end         = self.statement_end(file_path) if year is None else (year, 12)
+        occurrences = {}
+        rows        = []
+        for expense in expenses:
+            date = self.dated(expense.date, end)
+            if date is None:
+                # No year to tell this charge from the same one another year, keep it to this statement
+                date = f'{expense.date} {file_hash}'
+            key  = (date, round(expense.credit, 2), round(expense.debit, 2), expense.description)
+            occurrences[key] = occurrences.get(key, -1) + 1
+            rows.append((self.fingerprint(expense, occurrences[key], date), expense.date, expense.description,
+                         expense.category, expense.credit, expense.debit, file_hash))
+
+        with self.connection:
+            before = self.connection.total_changes
+            self.connection.executemany('INSERT OR IGNORE INTO transactions VALUES (?, ?, ?, ?, ?, ?, ?)', rows)
+            added = self.connection.total_changes - before
+            self.connection.execute('INSERT OR REPLACE INTO statements VALUES (?, ?, ?, ?)',
+                                    (file_hash, file_path, time.time(), len(rows)))
+
+        self.logger.info('Recorded %s: %d new of %d transactions', file_path, added, len(rows))
+        return added
+
+    def iter_expenses(self) -> Iterator[Expense]:
+        '''Yield every transaction in the ledger in import order'''
+        cursor = self.connection.execute('''SELECT description, category, credit, debit, date
+                                            FROM transactions ORDER BY rowid''')
+        for row in cursor:
+            yield Expense(*row)
+
+    def close(self):
+        '''Close the database'''
+        self.connection.close()
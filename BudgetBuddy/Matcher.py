@@ -0,0 +1,135 @@
+from difflib import SequenceMatcher as SM
+from collections import Counter
+from abc import ABC, abstractmethod
+
+# Minimum score (0-100) for a fuzzy match to be accepted
+MATCH_THRESHOLD = 70
+
+class Matcher(ABC):
+    ''' Abstract class for fuzzy matching a description against the category map keys '''
+    def __init__(self, names):
+        self.name_list = list(names)
+
+    @abstractmethod
+    def best_match(self, key : str) -> tuple[str, float]:
+        '''Return the most similar name and its score, ('', 0.0) if nothing matches'''
+
+class LinearMatcher(Matcher):
+    '''Score the key against every name (This is expensive ...)'''
+    def best_match(self, key : str) -> tuple[str, float]:
+        '''Return the most similar name and its score'''
+        key   = key.lower()
+        value = ''
+        score = 0.0
+        for name in self.name_list:
+            tmpscore = SM(None, key, name).ratio()*100
+
+            if tmpscore > score:
+                value = name
+                score = tmpscore
+
+        return value, score
+
+class NGramMatcher(Matcher):
+    '''Inverted index of padded bigrams, only candidates sharing enough bigrams are scored
+
+    If SequenceMatcher finds M matching characters between strings of total
+    length T, the padded strings share at least 3M - T + 1 bigrams, so a name
+    scoring ratio r shares at least (1.5r - 1)T + 1 of them. For thresholds
+    above 2/3 this bound is positive and names below it can be skipped without
+    changing the best match.
+
+    Candidates are scored most shared bigrams first. Before the full ratio,
+    each one is checked against upper bounds on M: the shorter length, the
+    shared bigrams and quick_ratio's character counts. A candidate that
+    cannot reach the threshold or beat the best score so far is skipped.
+    Each name keeps its own SequenceMatcher with the name already set as
+    seq2, so its index is built once and only the key changes per query.
+    '''
+    PAD = '\x00'
+
+    def __init__(self, names, threshold : float = MATCH_THRESHOLD):
+        super().__init__(names)
+        self.threshold = threshold
+        self.lengths   = [len(name) for name in self.name_list]
+        self.index     = {}
+        self.matchers  = [None] * len(self.name_list)
+
+        for idx, name in enumerate(self.name_list):
+            for gram, count in Counter(self.ngrams(name)).items():
+                self.index.setdefault(gram, []).append((idx, count))
+
+    def __getstate__(self) -> dict:
+        # The SequenceMatchers are rebuilt on demand rather than pickled to worker processes
+        state = dict(self.__dict__)
+        state['matchers'] = [None] * len(self.name_list)
+        return state
+
+    @classmethod
+    def ngrams(cls, text : str) -> list:
+        '''Split the padded text into overlapping bigrams'''
+        padded = cls.PAD + text + cls.PAD
+        return [padded[i:i + 2] for i in range(len(padded) - 1)]
+
+    def candidates(self, key : str) -> list[tuple[int, int]]:
+        '''Return (index, shared bigrams) of the names that can reach the threshold, most shared first'''
+        shared = {}
+        for gram, count in Counter(self.ngrams(key)).items():
+            for idx, name_count in self.index.get(gram, ()):
+                shared[idx] = shared.get(idx, 0) + min(count, name_count)
+
+        if 3 * self.threshold < 200:
+            # The bound gives no guarantee below 2/3, score everything
+            candidates = [(idx, shared.get(idx, 0)) for idx in range(len(self.name_list))]
+        else:
+            key_len    = len(key)
+            candidates = [(idx, count) for idx, count in shared.items()
+                          if 200 * (count - 1) >= (3 * self.threshold - 200) * (key_len + self.lengths[idx])]
+
+        candidates.sort(key=lambda candidate: (-candidate[1], candidate[0]))
+        return candidates
+
+    def sequence_matcher(self, idx : int) -> SM:
+        '''Return the SequenceMatcher of a name, with the name as seq2'''
+        matcher = self.matchers[idx]
+        if matcher is None:
+            matcher = self.matchers[idx] = SM(None, '', self.name_list[idx])
+        return matcher
+
+    def best_match(self, key : str) -> tuple[str, float]:
+        '''Return the most similar name and its score, exact whenever the score reaches the threshold
+
+        As with the full scan, ties go to the name that comes first.
+        '''
+        key      = key.lower()
+        key_len  = len(key)
+        value    = ''
+        score    = 0.0
+        best_idx = len(self.name_list)
+
+        for idx, shared in self.candidates(key):
+            total = key_len + self.lengths[idx]
+            if total == 0:
+                continue
+
+            # Upper bounds on the matching characters, cheapest first
+            bound = min(key_len, self.lengths[idx], (shared + total - 1) // 3)
+            if self.beaten(2.0 * bound / total * 100, score, idx, best_idx):
+                continue
+
+            matcher = self.sequence_matcher(idx)
+            matcher.set_seq1(key)
+            if self.beaten(matcher.quick_ratio() * 100, score, idx, best_idx):
+                continue
+
+            tmpscore = matcher.ratio() * 100
+            if not self.beaten(tmpscore, score, idx, best_idx):
+                value    = self.name_list[idx]
+                score    = tmpscore
+                best_idx = idx
+
+        return value, score
+
+    def beaten(self, upper : float, score : float, idx : int, best_idx : int) -> bool:
+        '''Whether a name scoring at most upper misses the threshold or loses to the best so far'''
+        return upper < self.threshold or upper < score or (upper == score and idx > best_idx)
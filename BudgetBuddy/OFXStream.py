@@ -0,0 +1,104 @@
+import codecs
+import io
+import re
+
+class OFXStream(io.RawIOBase):
+    '''Read an OFX/QFX/QBO file as well formed XML, one block at a time
+
+    OFX 2.x files are XML and pass through untouched. OFX 1.x files are SGML:
+    a plain text header before <OFX> and leaf tags such as <TRNAMT>-5.00 that
+    are never closed. Those come out as the bare <OFX> element with every
+    leaf closed and stray '&' escaped, encoded as UTF-8. Either way the
+    result can be fed to ElementTree.iterparse without reading it all.
+    '''
+    BLOCK_SIZE = 1 << 20
+
+    # A tag, its value up to the last non blank (kept whole by the lookahead) and no closing tag of its own
+    LEAF       = re.compile(r'<([A-Za-z0-9._]+)>(?=([^<]*[^<\s]))\2(?!\s*</\1>)')
+    AMPERSAND  = re.compile(r'&(?!(?:amp|lt|gt|quot|apos|#[0-9]+|#x[0-9A-Fa-f]+);)')
+    CHARSET    = re.compile(rb'CHARSET:\s*([A-Za-z0-9-]+)')
+
+    def __init__(self, in_file, block_size : int = None):
+        self.in_file    = in_file
+        self.block_size = block_size or self.BLOCK_SIZE
+        self.decoder    = None
+        self.xml        = None
+        self.header     = True
+        self.pending    = ''
+        self.output     = b''
+        self.position   = 0
+        self.done       = False
+
+    @classmethod
+    def encoding(cls, header : bytes) -> str:
+        '''Pick the text encoding from the SGML header'''
+        if header.startswith(codecs.BOM_UTF8):
+            return 'utf-8-sig'
+
+        match = cls.CHARSET.search(header)
+        if match is None or match[1].upper() == b'NONE':
+            return 'utf-8'
+        charset = match[1].decode('ascii')
+        return f'cp{charset}' if charset.isdigit() else charset
+
+    def convert(self, text : str) -> bytes:
+        '''Turn complete SGML tags into XML'''
+        text = self.AMPERSAND.sub('&amp;', text)
+        return self.LEAF.sub(self.close_leaf, text).encode('utf-8')
+
+    @staticmethod
+    def close_leaf(match : re.Match) -> str:
+        '''Append the closing tag to an unclosed leaf'''
+        return f'{match[0]}</{match[1]}>'
+
+    def fill(self) -> bytes:
+        '''Return the next block of the file as XML'''
+        if self.xml is None:
+            # Read enough of the header to tell the format and encoding
+            block    = self.in_file.read(max(self.block_size, 4096))
+            self.xml = block.lstrip(codecs.BOM_UTF8 + b' \t\r\n').startswith(b'<?xml')
+            if not self.xml:
+                self.decoder = codecs.getincrementaldecoder(self.encoding(block))(errors='replace')
+        else:
+            block = self.in_file.read(self.block_size)
+
+        if self.xml:
+            self.done = not block
+            return block
+        self.pending += self.decoder.decode(block, final=not block)
+
+        # Everything before <OFX> is header
+        if self.header:
+            start = self.pending.find('<OFX>')
+            if start < 0:
+                self.pending = self.pending[-4:]
+                self.done    = not block
+                return b''
+            self.header  = False
+            self.pending = self.pending[start:]
+
+        if not block:
+            self.done = True
+            text, self.pending = self.pending, ''
+            return self.convert(text)
+
+        # The last opening tag may be cut off or its closing tag may be in the next block
+        end = self.pending.rfind('<')
+        while end > 0 and (self.pending.startswith('</', end) or end == len(self.pending) - 1):
+            end = self.pending.rfind('<', 0, end)
+        end = max(end, 0)
+        text, self.pending = self.pending[:end], self.pending[end:]
+        return self.convert(text)
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while self.position == len(self.output) and not self.done:
+            self.output   = self.fill()
+            self.position = 0
+
+        size = min(len(buffer), len(self.output) - self.position)
+        buffer[:size]  = self.output[self.position:self.position + size]
+        self.position += size
+        return size
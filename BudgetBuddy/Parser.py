@@ -1,5 +1,8 @@
-from difflib import SequenceMatcher as SM
-from .CategoryMap import CATEGORY_MAP, CITY_LIST_FL
+from . import CategoryMap, Profiler
+from .Matcher import Matcher, NGramMatcher, MATCH_THRESHOLD
+from .Cache import CategoryCache, map_version
+from .CityStripper import CityStripper
+from .OFXStream import OFXStream
 import xml.etree.ElementTree as ET
 import PyPDF2
 import logging
@@ -7,21 +10,48 @@ import json
 import csv
 import re
 
+from concurrent.futures import ProcessPoolExecutor
 from abc import ABC, abstractmethod
+from itertools import chain, islice, repeat
+from functools import lru_cache
+from collections.abc import Iterator
 
-from .Defines import Types, Expense
+from .Defines import Types, Expense, ExpenseBatch, SymbolTable
 
 class FileParser(ABC):
-    ''' Abstract class for the File Parser '''
-    def __init__(self, file_path):
+    ''' Abstract class for the File Parser
+
+    The file is parsed into expense_list on construction. Pass lazy=True to
+    skip that and stream the file with iter_expenses instead.
+
+    Descriptions and categories go through the parser's SymbolTable, so
+    repeated merchants of a file are a single string. Dates are left out of
+    it, they are mostly distinct and would only grow the table.
+    '''
+    # Digits and punctuation (except the backslash) removed by clean_description
+    CLEAN_TABLE = str.maketrans('', '', '0123456789!"#$%&\'()*+,-./:;<=>?@[]^_`{|}~')
+
+    def __init__(self, file_path, lazy : bool = False):
+        self.file_path    = file_path
+        self.lazy         = lazy
         self.expense_list = []
+        self.symbols      = SymbolTable()
         self.logger       = logging.getLogger('BudgetBuddy.Parser')
-        self.parse_budget_file(file_path)
+        if not lazy:
+            self.parse_budget_file(file_path)
 
     def get_expense_list(self) -> list[Expense]:
         '''Return the expense list'''
         return self.expense_list
 
+    def get_expense_batch(self, symbols : SymbolTable = None) -> ExpenseBatch:
+        '''Return the expenses packed into an ExpenseBatch, streamed from the file when lazy
+
+        Pass symbols to share one table between the batches of several files.
+        '''
+        return ExpenseBatch(self.iter_expenses() if self.lazy else self.expense_list,
+                            self.symbols if symbols is None else symbols)
+
     @staticmethod
     def str_to_float(num_str : str) -> float:
         '''Convert string to int, deal with whitespace'''
@@ -38,51 +68,204 @@ class FileParser(ABC):
         if in_str is None:
             return ''
 
-        cleaned_str = re.sub(r'[0-9!"#$%&\'()*+,-./:;<=>?@[\]^_`{|}~]', '', in_str)
-        cleaned_str = re.sub(r'\s+', ' ', cleaned_str)
-        return cleaned_str.strip()
+        return FileParser.clean_description_cached(in_str)
+
+    @staticmethod
+    @lru_cache(maxsize=65536)
+    def clean_description_cached(in_str : str) -> str:
+        '''One translate pass and a whitespace collapse, memoized since raw merchant strings recur'''
+        return ' '.join(in_str.translate(FileParser.CLEAN_TABLE).split())
 
-    @abstractmethod
     def parse_budget_file(self, file_path : str) -> list[Expense]:
         '''Parse a file, return a list of expenses'''
+        self.file_path = file_path
+        self.expense_list.extend(self.iter_expenses())
+        return self.expense_list
+
+    @abstractmethod
+    def iter_expenses(self) -> Iterator[Expense]:
+        '''Yield the expenses of the file one at a time'''
 
 class FileCategoryParser(FileParser):
-    '''Accounts for formats with no category data'''
-    def __init__(self, file_path):
-        self.category_map  = CATEGORY_MAP
-        self.name_list = list(self.category_map.keys())
-        super().__init__(file_path)
+    '''Accounts for formats with no category data
+
+    Subclasses yield their expenses from iter_uncategorized, with category
+    None where the file has none. iter_expenses fills those in a chunk at a
+    time through categorize_many, so each distinct description is resolved
+    once per parser. With match_workers > 1, large sets of fuzzy matches are
+    spread over a process pool, started on first use and kept until
+    iter_expenses finishes (call close_match_pool when using categorize_many
+    directly).
+    '''
+    matcher_class   = NGramMatcher
+    _matchers       = {}
+    _worker_matcher = None
+
+    # Expenses categorized together, and the fewest fuzzy matches worth a process pool
+    CATEGORIZE_CHUNK = 2048
+    PARALLEL_MATCHES = 64
+
+    def __init__(self, file_path, matcher : Matcher = None, cache : CategoryCache = None, lazy : bool = False,
+                 match_workers : int = 1):
+        self.category_map  = CategoryMap.CATEGORY_MAP
+        self.matcher       = matcher if matcher is not None else self.default_matcher()
+        self.cache         = cache
+        self.match_workers = match_workers
+        self.match_pool    = None
+        self.resolved      = {}
+        super().__init__(file_path, lazy)
+
+    @staticmethod
+    def open_cache(path : str, max_entries : int = 50000) -> CategoryCache:
+        '''Open the resolution cache for the current category map'''
+        return CategoryCache(path, map_version(CategoryMap.CATEGORY_MAP), max_entries)
+
+    @classmethod
+    def default_matcher(cls) -> Matcher:
+        '''Build the matcher over the category map once per process and matcher class
+
+        Rebuilt when the category map changes, see CategoryMap.generation.
+        '''
+        generation = CategoryMap.generation()
+        built      = FileCategoryParser._matchers.get(cls.matcher_class)
+        if built is None or built[0] != generation:
+            built = FileCategoryParser._matchers[cls.matcher_class] = \
+                (generation, cls.matcher_class(CategoryMap.CATEGORY_MAP.keys()))
+        return built[1]
+
+    @staticmethod
+    def init_match_worker(matcher : Matcher):
+        '''Keep the parser's matcher in a worker process, without the profiling forked from its parent'''
+        Profiler.detach()
+        FileCategoryParser._worker_matcher = matcher
+
+    @staticmethod
+    def match_names(keys : list[str]) -> list[tuple[str, float]]:
+        '''Return the best (name, score) of each key, runs in a worker process'''
+        return [FileCategoryParser._worker_matcher.best_match(key) for key in keys]
+
+    def match_executor(self) -> ProcessPoolExecutor:
+        '''Return the parser's match pool, starting it and sending it the matcher on first use'''
+        if self.match_pool is None:
+            self.match_pool = ProcessPoolExecutor(max_workers=self.match_workers, initializer=self.init_match_worker,
+                                                  initargs=(self.matcher,))
+        return self.match_pool
+
+    def close_match_pool(self):
+        '''Shut down the match pool, a later match starts a new one'''
+        if self.match_pool is not None:
+            self.match_pool.shutdown(wait=True, cancel_futures=True)
+            self.match_pool = None
+
+    @abstractmethod
+    def iter_uncategorized(self) -> Iterator[Expense]:
+        '''Yield the expenses of the file, category None where it has to be matched'''
+
+    def iter_expenses(self) -> Iterator[Expense]:
+        '''Yield the expenses of the file one at a time'''
+        expenses = self.iter_uncategorized()
+        try:
+            while True:
+                chunk = list(islice(expenses, self.CATEGORIZE_CHUNK))
+                if not chunk:
+                    break
+
+                uncategorized = [expense for expense in chunk if expense.category is None]
+                Profiler.count('categories.from_file', len(chunk) - len(uncategorized))
+                with Profiler.stage('categorize', len(uncategorized)):
+                    categories = self.categorize_many([expense.description for expense in uncategorized])
+                for expense, category in zip(uncategorized, categories):
+                    expense.category = category
+                yield from chunk
+        finally:
+            # Every chunk shares the pool, it goes when the file is done or abandoned
+            self.close_match_pool()
+
+        # Decisions are written once the whole file is read
+        if self.cache is not None:
+            self.cache.commit()
+
+    def categorize_many(self, descriptions : list[str]) -> list[str]:
+        '''Return the category of each description, resolving every distinct one once
+
+        Descriptions already seen by this parser are reused, then the exact
+        map is checked, then the cache, and the remaining ones are fuzzy
+        matched together.
+        '''
+        resolved = self.resolved
+        distinct = dict.fromkeys(descriptions)
+        misses   = []
+        reused   = exact = 0
+        for key in distinct:
+            if key in resolved:
+                reused += 1
+                continue
+
+            category = self.category_map.get(key)
+            if category is not None:
+                exact += 1
+            elif self.cache is not None:
+                # Earlier runs may have already resolved this description
+                category = self.cache.get(key)
+
+            if category is None:
+                misses.append(key)
+            else:
+                resolved[key] = category
+
+        with Profiler.stage('fuzzy_match', len(misses)):
+            categories = self.fuzzy_categories(misses)
+        for key, category in zip(misses, categories):
+            resolved[key] = category
+            if self.cache is not None:
+                self.cache.put(key, category)
+
+        if Profiler.active() is not None:
+            unknown = categories.count('Unknown')
+            Profiler.count('categories.rows', len(descriptions))
+            Profiler.count('categories.reused', reused)
+            Profiler.count('categories.exact', exact)
+            Profiler.count('categories.cached', len(distinct) - reused - exact - len(misses))
+            Profiler.count('categories.fuzzy', len(misses) - unknown)
+            Profiler.count('categories.unknown', unknown)
+
+        return [resolved[key] for key in descriptions]
 
     def key_category_map(self, key : str) -> str:
         '''Check if the key is in the map, otherwise, fuzzy check and confirm with user'''
-        if key in self.category_map:
-            return self.category_map[key]
-        else:
-            # Iterate through the name list, return the most similar string (This is expensive ...)
-            value = ''
-            score = 0.0
-            for name in self.name_list:
-                tmpscore = SM(None, key.lower(), name).ratio()*100
-
-                if tmpscore > score:
-                    value = name
-                    score = tmpscore
-
-            if score < 70:
-                return 'Unknown'
-
-            if value != '':
-                category = self.category_map[value]
-                self.logger.debug("Match correct? %s vs. %s Category: %s Score: %f", key.lower(), value, category, score)
-                return category
+        return self.categorize_many([key])[0]
+
+    def fuzzy_categories(self, keys : list[str]) -> list[str]:
+        '''Fuzzy match the keys, across a process pool when there are enough of them'''
+        if self.match_workers <= 1 or len(keys) < self.PARALLEL_MATCHES:
+            return [self.fuzzy_category(key) for key in keys]
+
+        chunk_size = -(-len(keys) // (self.match_workers * 4))
+        chunks     = [keys[start:start + chunk_size] for start in range(0, len(keys), chunk_size)]
+        matches    = [match for chunk in self.match_executor().map(self.match_names, chunks) for match in chunk]
+        return [self.match_category(key, value, score) for key, (value, score) in zip(keys, matches)]
+
+    def fuzzy_category(self, key : str) -> str:
+        '''Return the category of the most similar name from the matcher'''
+        value, score = self.matcher.best_match(key)
+        return self.match_category(key, value, score)
+
+    def match_category(self, key : str, value : str, score : float) -> str:
+        '''Return the category of a matched name, Unknown when the match is too weak'''
+        if score < MATCH_THRESHOLD:
             return 'Unknown'
 
+        if value != '':
+            category = self.category_map[value]
+            self.logger.debug("Match correct? %s vs. %s Category: %s Score: %f", key.lower(), value, category, score)
+            return category
+        return 'Unknown'
 
 class CSVParser(FileParser):
     '''Parser for CSV Files'''
-    def parse_budget_file(self, file_path : str) -> list[Expense]:
-        '''Parse a file, return a list of expenses'''
-        with open(file_path, newline='', encoding="utf-8") as in_file:
+    def iter_expenses(self) -> Iterator[Expense]:
+        '''Yield the expenses of the file one at a time'''
+        with open(self.file_path, newline='', encoding="utf-8") as in_file:
 
             # Open the file and skip the header row
             reader = csv.reader(in_file, delimiter=',')
@@ -93,100 +276,372 @@ class CSVParser(FileParser):
                 if not row:
                     continue
 
-                description = FileParser.clean_description(str(row[Types.DESCRIPTION.value]))
+                description = self.symbols.intern(FileParser.clean_description(str(row[Types.DESCRIPTION.value])))
                 expense     = Expense(description,
-                                      str(row[Types.CATEGORY.value]),
+                                      self.symbols.intern(str(row[Types.CATEGORY.value])),
                                       FileParser.str_to_float(row[Types.CREDIT.value]),
-                                      FileParser.str_to_float(row[Types.DEBIT.value]))
-
-                self.expense_list.append(expense)
+                                      FileParser.str_to_float(row[Types.DEBIT.value]),
+                                      str(row[Types.DATE.value]))
 
-        return self.expense_list
+                yield expense
 
 class QIFParser(FileCategoryParser):
-    '''Parser for QIF Files'''
-    def parse_budget_file(self, file_path : str) -> list[Expense]:
-        '''Parse a file, return a list of expenses'''
+    '''Parser for QIF Files
+
+    The file is read in large chunks and each line is dispatched on its
+    field code, so fields may come in any order and blank lines, headers
+    and unknown codes are skipped. A record ends at '^'. Its L category is
+    used as is, only records without one (or with a [transfer]) are matched.
+
+    Only the records of transaction sections (!Type:Bank, CCard, ...) are
+    read. Account lists, categories, classes and memorized transactions of
+    multi-account exports are skipped, and !Option/!Clear lines leave the
+    section as it is. Records before any header count as transactions.
+    '''
+    CHUNK_SIZE = 1 << 20
+
+    # Lowercased !Type: names of the sections holding transactions
+    TRANSACTION_TYPES = {'bank', 'cash', 'ccard', 'oth a', 'oth l', 'invst'}
+
+    @classmethod
+    def in_transactions(cls, header : str, current : bool) -> bool:
+        '''Return whether the records after a ! header line are transactions'''
+        name = header[1:].strip().lower()
+        if name.startswith(('option:', 'clear:')):
+            return current
+        if name.startswith('type:'):
+            return name[5:].strip() in cls.TRANSACTION_TYPES
+        # !Account and any other section
+        return False
+
+    def iter_uncategorized(self) -> Iterator[Expense]:
+        '''Yield the expenses of the file, category None where it has to be matched'''
+        intern = self.symbols.intern
         try:
-            with open(file_path, 'r', encoding="UTF-8") as in_file:
-                tmp_str = [] # List of strings
-                for line in in_file:
-                    line = line.rstrip()
-
-                    # Remove Comments
-                    if line[0] == '!':
-                        continue
-
-                    # Build string until carrot
-                    tmp_str.append(line)
-
-                    # Hit the end of entry
-                    if '^' in line:
-                        name = tmp_str[3].replace('P','', 1)
-                        expense = Expense(name,
-                                        self.key_category_map(name),
-                                        0.0,
-                                        abs(self.str_to_float(tmp_str[1].replace('T-','', 1))))
-
-                        self.expense_list.append(expense)
-                        tmp_str = []
+            with open(self.file_path, 'r', encoding="UTF-8") as in_file:
+                date = amount = payee = memo = category = None
+                rest = ''
+                transactions = True
+                # A final newline ends the last line of files without one
+                for chunk in chain(iter(lambda: in_file.read(self.CHUNK_SIZE), ''), ['\n']):
+                    # Whole lines only, the partial last line waits for the next chunk
+                    lines = (rest + chunk).split('\n')
+                    rest  = lines.pop()
+
+                    for line in lines:
+                        code = line[:1]
+                        if code == '!':
+                            # A section header starts a new record
+                            transactions = self.in_transactions(line, transactions)
+                            date = amount = payee = memo = category = None
+                            continue
+                        if not transactions:
+                            continue
+
+                        if code == 'D':
+                            date = line[1:]
+                        elif code == 'T':
+                            amount = line[1:]
+                        elif code == 'P':
+                            payee = line[1:]
+                        elif code == 'L':
+                            category = line[1:].strip()
+                        elif code == '^':
+                            # End of the record, blank records are dropped
+                            name = (payee or memo or '').strip()
+                            if name or amount is not None:
+                                name = intern(name)
+                                # Records without a category (or with a [transfer]) are matched later
+                                category = intern(category) if category and category[0] != '[' else None
+
+                                expense = Expense(name,
+                                                  category,
+                                                  0.0,
+                                                  abs(self.str_to_float((amount or '').replace(',', ''))),
+                                                  date.strip() if date is not None else None)
+
+                                yield expense
+                            date = amount = payee = memo = category = None
+                        elif code == 'M':
+                            memo = line[1:]
+                        elif code == 'U' and amount is None:
+                            amount = line[1:]
         except FileNotFoundError as ex:
             raise FileNotFoundError('Unable to find QIF File') from ex
 
-
 class QFXParser(FileCategoryParser):
-    '''Parser for QFX, OFX, QBO Files'''
-    def parse_budget_file(self, file_path : str) -> list[Expense]:
-        '''Parse a file, return a list of expenses'''
+    '''Parser for QFX, OFX, QBO Files
+
+    The file is streamed through OFXStream into iterparse, so SGML and XML
+    OFX both work. Each transaction is cleared once read and each account's
+    transaction list once it ends, leaving only an empty element per
+    transaction of the current account in memory.
+    '''
+    def iter_uncategorized(self) -> Iterator[Expense]:
+        '''Yield the expenses of the file, category None where it has to be matched'''
+        with open(self.file_path, 'rb') as in_file:
+            for _, element in ET.iterparse(OFXStream(in_file)):
+                if element.tag != 'STMTTRN':
+                    if element.tag == 'BANKTRANLIST':
+                        element.clear()
+                    continue
 
-        root = ET.parse(file_path).getroot()
+                # One pass over the fields of the transaction
+                fields = {field.tag : field.text for field in element}
+                element.clear()
 
-        for transaction in root.iter('STMTTRN'):
-            if transaction.find('TRNTYPE').text != 'DEBIT':
-                continue
+                if fields.get('TRNTYPE') != 'DEBIT':
+                    continue
 
-            name = self.clean_description(transaction.find('MEMO').text)
-            expense = Expense(name,
-                              self.key_category_map(name),
-                              0.0,
-                              abs(self.str_to_float(transaction.find('TRNAMT').text)))
+                name = self.symbols.intern(self.clean_description(fields.get('MEMO') or fields.get('NAME')))
+                expense = Expense(name,
+                                  None,
+                                  0.0,
+                                  abs(self.str_to_float(fields.get('TRNAMT') or '')),
+                                  fields.get('DTPOSTED'))
 
-            self.expense_list.append(expense)
+                yield expense
 
 class PDFParser(FileCategoryParser):
-    '''Parser for PDF Files'''
+    '''Parser for PDF Files
+
+    Only the selected pages have their text extracted. By default that is
+    every page after the summary pages, minus pages whose raw content shows
+    they cannot hold transactions. Parsing stops once stop_after pages in a
+    row after the transaction section have no transactions (0 reads to the
+    end); pages left out of the selection do not count. With workers > 1 the text is extracted in a process pool, each
+    worker opening the file itself; pages are still handled in page order.
+    '''
+    _city_stripper = (None, None)
+
+    # Leading pages with the account summary, never holding transactions
+    SUMMARY_PAGES = 3
+
+    # Posted and transaction dates, the description up to the first '$' and the amount after it
+    DATE                = r'(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s[0-9]{1,2}'
+    TRANSACTION_PATTERN = re.compile(r'(?P<date>' + DATE + r')\s' + DATE + r'\s'
+                                     r'(?P<description>[^$\n]*)\$\s*(?P<amount>-?[0-9,]*\.[0-9]{2})')
+
+    # Dates with a year on the summary pages: the statement period (12/05/23 - 01/04/24) or its closing date
+    MONTHS           = ('jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec')
+    FULL_DATE        = (r'(?:[0-9]{1,2}/[0-9]{1,2}/(?:[0-9]{4}|[0-9]{2})|'
+                        r'(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?\s[0-9]{1,2},\s[0-9]{4})')
+    STATEMENT_PERIOD = re.compile(r'(' + FULL_DATE + r')\s*(?:-|\u2013|to|through)\s*(' + FULL_DATE + ')', re.IGNORECASE)
+    CLOSING_DATE     = re.compile(r'closing\s+date:?\s*(' + FULL_DATE + ')', re.IGNORECASE)
+
+    # Raw content stream signals: text showing operators, XObject painting and the literal strings shown
+    TEXT_OPERATOR   = re.compile(rb'(?:Tj|TJ|\'|")(?=[\s()<>\[\]{}/%]|$)')
+    DO_OPERATOR     = re.compile(rb'(?:^|[\s)>\]}])Do(?=[\s()<>\[\]{}/%]|$)')
+    LITERAL_STRING  = re.compile(rb'\(((?:\\.|[^\\)])*)\)')
+    HEX_STRING      = re.compile(rb'<[0-9A-Fa-f\s]+>')
+    KERNING         = re.compile(rb'[)>]\s*[-+]?(?:[0-9]+\.?[0-9]*|\.[0-9]+)\s*[(<]')
+    RAW_DATE        = re.compile(rb'(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s[0-9]')
+
+    def __init__(self, file_path, matcher : Matcher = None, cache : CategoryCache = None, lazy : bool = False,
+                 workers : int = 1, pages = None, detect_pages : bool = True, stop_after : int = 2,
+                 match_workers : int = 1):
+        self.workers       = workers
+        self.pages         = pages
+        self.detect_pages  = detect_pages
+        self.stop_after    = stop_after
+        self.skipped_pages = set()
+        super().__init__(file_path, matcher, cache, lazy, match_workers)
+
+    @classmethod
+    def statement_end(cls, file_path : str) -> tuple[int, int]:
+        '''Return the (year, month) the statement period ends, read from the summary pages
+
+        None when the file cannot be read or no period or closing date is found.
+        '''
+        try:
+            with open(file_path, 'rb') as in_file:
+                for page in PyPDF2.PdfReader(in_file).pages[:cls.SUMMARY_PAGES]:
+                    text  = page.extract_text() or ''
+                    match = cls.STATEMENT_PERIOD.search(text) or cls.CLOSING_DATE.search(text)
+                    if match is not None:
+                        return cls.year_month(match.groups()[-1])
+        except Exception as ex:
+            logging.getLogger('BudgetBuddy.Parser').error('Unable to read the statement period of %s: %s', file_path, ex)
+        return None
+
+    @classmethod
+    def year_month(cls, date : str) -> tuple[int, int]:
+        '''Return the (year, month) of a FULL_DATE, two digit years are in the 2000s'''
+        if date[0].isdigit():
+            month, _, year = date.split('/')
+            year = int(year)
+            return (year + 2000 if year < 100 else year), int(month)
+        return int(date[-4:]), cls.MONTHS.index(date[:3].lower()) + 1
+
+    @classmethod
+    def city_stripper(cls) -> CityStripper:
+        '''Build the city/state stripper once per process, again when the category map changes'''
+        generation = CategoryMap.generation()
+        if PDFParser._city_stripper[0] != generation:
+            PDFParser._city_stripper = (generation, CityStripper(CategoryMap.load_maps()['cities'],
+                                                                 FileParser.clean_description))
+        return PDFParser._city_stripper[1]
+
     def remove_city_state_from_description(self, description : str):
-        '''Remove cities/state using regex'''
-        florida_cities_pattern = re.compile(r'((' + '|'.join(CITY_LIST_FL) + r')' + r'FL)', re.IGNORECASE)
+        '''Remove cities/state using the prebuilt city stripper'''
+        return self.city_stripper().strip(description)
 
-        return florida_cities_pattern.sub('', description)
+    @staticmethod
+    def parse_page_ranges(spec : str, page_count : int) -> list[int]:
+        '''Turn a 1-based spec such as "4-9,12,15-" into sorted 0-based page numbers'''
+        page_numbers = set()
+        for part in spec.split(','):
+            part = part.strip()
+            if not part:
+                continue
+            try:
+                if '-' in part:
+                    first, last = part.split('-', 1)
+                    first = int(first) if first.strip() else 1
+                    last  = int(last) if last.strip() else page_count
+                else:
+                    first = last = int(part)
+            except ValueError as ex:
+                raise ValueError(f"Invalid page range: {part}") from ex
+            page_numbers.update(range(max(first, 1) - 1, min(last, page_count)))
+        return sorted(page_numbers)
+
+    def page_numbers(self, page_count : int) -> list[int]:
+        '''Return the configured 0-based page numbers that exist in the file'''
+        if self.pages is None:
+            return list(range(self.SUMMARY_PAGES, page_count))
+        if isinstance(self.pages, str):
+            return self.parse_page_ranges(self.pages, page_count)
+        return sorted(page_num for page_num in set(self.pages) if 0 <= page_num < page_count)
 
-    def parse_budget_file(self, file_path : str) -> list[Expense]:
+    @staticmethod
+    def page_resources(page) -> dict:
+        '''Return the page's resource dictionary, inherited from its /Pages parents when it has none'''
+        node = page
+        while node is not None:
+            resources = node.get('/Resources')
+            if resources is not None:
+                return resources.get_object()
+            parent = node.get('/Parent')
+            node   = parent.get_object() if parent is not None else None
+        return {}
+
+    @classmethod
+    def may_have_transactions(cls, page) -> bool:
+        '''Check the raw content stream for text and dates before paying for extract_text
+
+        Only returns False when the answer is certain: no text at all, or only
+        plain literal strings in simple fonts without a single date in them.
+        Strings with escapes and TJ arrays with spacing offsets may show a
+        date the bytes do not spell out, so those pages are extracted.
+        Pages drawing form XObjects may have their text in those, so they are
+        always extracted.
+        '''
+        try:
+            contents  = page.get_contents()
+            raw       = contents.get_data() if contents is not None else b''
+            resources = cls.page_resources(page)
+            xobjects  = resources.get('/XObject')
+            xobjects  = xobjects.get_object() if xobjects is not None else {}
+            fonts     = resources.get('/Font')
+            fonts     = fonts.get_object() if fonts is not None else {}
+        except Exception:
+            return True
+
+        if xobjects or cls.DO_OPERATOR.search(raw):
+            return True
+        if not cls.TEXT_OPERATOR.search(raw):
+            return False
+
+        # Hex strings and composite or re-encoded fonts hide the characters from a byte search
+        if cls.HEX_STRING.search(raw):
+            return True
+        for font in fonts.values():
+            font = font.get_object()
+            if font.get('/Subtype') == '/Type0' or '/ToUnicode' in font or not isinstance(font.get('/Encoding', ''), str):
+                return True
+
+        # A date anywhere in the stream settles it, otherwise it may be split across strings
+        if cls.RAW_DATE.search(raw):
+            return True
+        # Spacing offsets between strings and escaped characters can stand for the gaps in a date
+        if cls.KERNING.search(raw):
+            return True
+        strings = cls.LITERAL_STRING.findall(raw)
+        if any(b'\\' in string for string in strings):
+            return True
+        return cls.RAW_DATE.search(b''.join(strings)) is not None
+
+    @staticmethod
+    def extract_pages(file_path : str, page_numbers : list[int]) -> list[str]:
+        '''Extract the text of the given pages, runs in a worker process'''
         with open(file_path, 'rb') as in_file:
             pdf_reader = PyPDF2.PdfReader(in_file)
-
-            for page_num, page in enumerate(pdf_reader.pages):
-                page = pdf_reader.pages[page_num]
-                text = page.extract_text()
-
-                if page_num > 2:
-                    # Use regular expressions to extract transaction details
-                    date_pattern = r'(((Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s([0-9]{1,2})\s){2}(.*)[0-9]*\.[0-9]{2})'
-
-                    dates = re.findall(date_pattern, text)
-                    
-                    # Use the first matching group
-                    for match in dates:
-                        cleaned_str = re.sub(r'((Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s([0-9]{1,2})\s){2}', ' ', match[0])
-
-                        split_string = cleaned_str.split('$')
-
-                        description = self.remove_city_state_from_description(self.clean_description(split_string[0]))
-                        cost        = self.str_to_float(split_string[1])
-
-                        expense = Expense(description,
-                                          self.key_category_map(description),
-                                          0.0,
-                                          abs(cost))
-
-                        self.expense_list.append(expense)
+            return [pdf_reader.pages[page_num].extract_text() for page_num in page_numbers]
+
+    def iter_page_text(self) -> Iterator[tuple[int, str]]:
+        '''Yield (page number, text) for the selected pages in order'''
+        with open(self.file_path, 'rb') as in_file:
+            pdf_reader   = PyPDF2.PdfReader(in_file)
+            pdf_pages    = pdf_reader.pages
+            selected     = self.page_numbers(len(pdf_pages))
+            page_numbers = [page_num for page_num in selected
+                            if not self.detect_pages or self.may_have_transactions(pdf_pages[page_num])]
+            self.skipped_pages = set(selected).difference(page_numbers)
+            self.logger.debug('Extracting %d of %d pages', len(page_numbers), len(pdf_pages))
+
+            if self.workers <= 1:
+                for page_num in page_numbers:
+                    yield page_num, pdf_pages[page_num].extract_text()
+                return
+
+        # Several chunks per worker keeps the pool busy when pages differ in cost
+        chunk_size = max(1, -(-len(page_numbers) // (self.workers * 4)))
+        chunks     = [page_numbers[start:start + chunk_size] for start in range(0, len(page_numbers), chunk_size)]
+
+        executor = ProcessPoolExecutor(max_workers=self.workers, initializer=Profiler.detach)
+        try:
+            for chunk, texts in zip(chunks, executor.map(self.extract_pages, repeat(self.file_path), chunks)):
+                yield from zip(chunk, texts)
+        finally:
+            # Stopping early drops the chunks that have not started
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def parse_page(self, text : str) -> Iterator[tuple[str, str, float]]:
+        '''Yield (date, description, amount) for every transaction on a page in a single scan'''
+        for match in self.TRANSACTION_PATTERN.finditer(text):
+            description = self.remove_city_state_from_description(self.clean_description(match['description']))
+            yield match['date'], description, abs(self.str_to_float(match['amount'].replace(',', '')))
+
+    def iter_uncategorized(self) -> Iterator[Expense]:
+        '''Yield the expenses of the file, category None where it has to be matched'''
+        last_page   = None
+        empty_pages = 0
+        for page_num, text in self.iter_page_text():
+            # Pages detected as empty count as pages without transactions, pages not selected do not
+            if last_page is not None:
+                empty_pages += sum(1 for skipped in range(last_page + 1, page_num) if skipped in self.skipped_pages)
+                if self.stop_after and empty_pages >= self.stop_after:
+                    break
+
+            found = False
+            for date, description, cost in self.parse_page(text):
+                found       = True
+                description = self.symbols.intern(description)
+                expense     = Expense(description,
+                                      None,
+                                      0.0,
+                                      cost,
+                                      ' '.join(date.split()))
+
+                yield expense
+
+            # The transaction section starts at the first page with transactions
+            if found:
+                last_page   = page_num
+                empty_pages = 0
+            elif last_page is not None:
+                empty_pages += 1
+                last_page    = page_num
+                if self.stop_after and empty_pages >= self.stop_after:
+                    break
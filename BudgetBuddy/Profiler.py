@@ -0,0 +1,209 @@
+'''Per stage timings and counters, to see where an import spends its time
+
+Nothing is measured unless a Profile is active:
+
+    with Profiler.Profile() as profile:
+        ...
+    report = profile.report()
+
+The code marks its stages with Profiler.stage and its counters with
+Profiler.count, both of which do nothing without an active Profile. Stages
+nest, so a parser's stage includes its categorize and fuzzy_match stages.
+
+Calls that are too frequent to mark by hand (clean_description and the
+SequenceMatcher methods) are timed by probes, wrappers that are installed
+while a Profile is active and removed afterwards. Only the current process
+is probed: the parse of statements in Batch worker processes is profiled
+there and merged back, but matches and pages spread over the parsers' own
+process pools only count toward the wall time of their stage.
+'''
+from collections import Counter
+from contextlib import nullcontext
+from difflib import SequenceMatcher
+from functools import wraps
+import cProfile
+import logging
+import time
+import tracemalloc
+
+REPORT_FORMAT = 1
+
+_active = None
+
+def active():
+    '''Return the active Profile, None when nothing is being measured'''
+    return _active
+
+def stage(name : str, rows : int = 0):
+    '''Context manager timing a stage, rows not known up front can be added to the timer it yields'''
+    if _active is None:
+        return nullcontext(StageTimer(None, rows))
+    return _active.stage(name, rows)
+
+def count(name : str, amount : int = 1):
+    '''Add to a counter of the active Profile'''
+    if _active is not None:
+        _active.counters[name] += amount
+
+def detach():
+    '''Turn off the profiling a forked worker process inherited from its parent'''
+    global _active
+    while _active is not None:
+        profile = _active
+        profile.remove_probes()
+        if profile.cprofile is not None:
+            profile.cprofile.disable()
+        if profile.memory_top and tracemalloc.is_tracing():
+            tracemalloc.stop()
+        _active = profile.previous
+
+class StageTimer:
+    '''Adds the wall time, CPU time and rows of one stage run to its record'''
+    def __init__(self, record : dict, rows : int):
+        self.record = record
+        self.rows   = rows
+        self.wall   = 0.0
+        self.cpu    = 0.0
+
+    def __enter__(self) -> 'StageTimer':
+        self.wall = time.perf_counter()
+        self.cpu  = time.process_time()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.record['wall']  += time.perf_counter() - self.wall
+        self.record['cpu']   += time.process_time() - self.cpu
+        self.record['rows']  += self.rows
+        self.record['calls'] += 1
+        return False
+
+class Profile:
+    '''Stage timings, counters and probes of one run
+
+    cprofile=True also runs cProfile over the whole profile, see
+    dump_cprofile. memory_top > 0 traces allocations with tracemalloc and
+    reports the peak and that many of the largest allocation sites.
+    '''
+    def __init__(self, cprofile : bool = False, memory_top : int = 0):
+        self.logger     = logging.getLogger('BudgetBuddy.Profiler')
+        self.stages     = {}
+        self.probes     = {}
+        self.counters   = Counter()
+        self.cprofile   = cProfile.Profile() if cprofile else None
+        self.memory_top = memory_top
+        self.memory     = None
+        self.patched    = []
+        self.wall       = 0.0
+        self.cpu        = 0.0
+        self.previous   = None
+
+    def stage(self, name : str, rows : int = 0) -> StageTimer:
+        '''Time a stage, runs of the same name add up'''
+        record = self.stages.get(name)
+        if record is None:
+            record = self.stages[name] = {'calls' : 0, 'rows' : 0, 'wall' : 0.0, 'cpu' : 0.0}
+        return StageTimer(record, rows)
+
+    def probe(self, name : str, function):
+        '''Wrap function so its calls and wall time add up under name'''
+        record = self.probes.setdefault(name, {'calls' : 0, 'wall' : 0.0})
+
+        @wraps(function)
+        def probed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                record['wall']  += time.perf_counter() - start
+                record['calls'] += 1
+        return probed
+
+    def install_probes(self):
+        '''Replace the probed functions with timed wrappers'''
+        from .Parser import FileParser
+
+        targets = [(FileParser, 'clean_description_cached', 'clean_description')]
+        # The methods Matcher calls on its SequenceMatchers, none of them calls another
+        targets.extend((SequenceMatcher, method, 'SequenceMatcher')
+                       for method in ('set_seq1', 'set_seq2', 'quick_ratio', 'ratio'))
+
+        for owner, attribute, name in targets:
+            original = owner.__dict__[attribute]
+            if isinstance(original, staticmethod):
+                setattr(owner, attribute, staticmethod(self.probe(name, original.__func__)))
+            else:
+                setattr(owner, attribute, self.probe(name, original))
+            self.patched.append((owner, attribute, original))
+
+    def remove_probes(self):
+        '''Put the original functions back'''
+        for owner, attribute, original in reversed(self.patched):
+            setattr(owner, attribute, original)
+        self.patched = []
+
+    def start(self) -> 'Profile':
+        '''Make this the active Profile and start measuring'''
+        global _active
+        self.previous, _active = _active, self
+        self.install_probes()
+        if self.memory_top:
+            tracemalloc.start()
+        if self.cprofile is not None:
+            self.cprofile.enable()
+        self.wall = time.perf_counter()
+        self.cpu  = time.process_time()
+        return self
+
+    def stop(self):
+        '''Stop measuring and restore the previously active Profile'''
+        global _active
+        self.wall = time.perf_counter() - self.wall
+        self.cpu  = time.process_time() - self.cpu
+        if self.cprofile is not None:
+            self.cprofile.disable()
+        if self.memory_top:
+            snapshot    = tracemalloc.take_snapshot()
+            self.memory = {'peak' : tracemalloc.get_traced_memory()[1],
+                           'top'  : [{'site' : str(stat.traceback), 'size' : stat.size, 'count' : stat.count}
+                                     for stat in snapshot.statistics('lineno')[:self.memory_top]]}
+            tracemalloc.stop()
+        self.remove_probes()
+        _active = self.previous
+
+    def __enter__(self) -> 'Profile':
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+        return False
+
+    def merge(self, report : dict):
+        '''Add the stages, probes and counters of another process's report'''
+        for section, records in (('stages', self.stages), ('probes', self.probes)):
+            for name, other in report.get(section, {}).items():
+                record = records.setdefault(name, {key : 0 for key in other if key != 'rows_per_second'})
+                for key in record:
+                    record[key] += other.get(key, 0)
+        self.counters.update(report.get('counters', {}))
+
+    def report(self) -> dict:
+        '''Return the measurements as JSON serializable dicts'''
+        stages = {}
+        for name, record in self.stages.items():
+            stages[name] = dict(record)
+            stages[name]['rows_per_second'] = (record['rows'] / record['wall']
+                                               if record['rows'] and record['wall'] else None)
+
+        report = {'version' : REPORT_FORMAT, 'wall' : self.wall, 'cpu' : self.cpu, 'stages' : stages,
+                  'probes' : {name : dict(record) for name, record in self.probes.items()},
+                  'counters' : dict(self.counters)}
+        if self.memory is not None:
+            report['memory'] = self.memory
+        return report
+
+    def dump_cprofile(self, file_path : str):
+        '''Write the cProfile statistics, read them with python -m pstats'''
+        if self.cprofile is None:
+            self.logger.error('cProfile was not enabled for this profile')
+            return
+        self.cprofile.dump_stats(file_path)
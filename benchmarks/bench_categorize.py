@@ -0,0 +1,49 @@
+'''Compare per row categorization with categorize_many
+
+A statement of --rows descriptions drawn from --unique merchants is
+categorized one row at a time as key_category_map used to do (no cache),
+then in one categorize_many call, serially and across --workers processes.
+
+Run from the repository root:
+    python -m benchmarks.bench_categorize [--rows N] [--unique N] [--workers N]
+'''
+import argparse
+import time
+
+from BudgetBuddy.Parser import QIFParser
+from benchmarks.synthetic import Transactions
+
+def per_row(parser : QIFParser, descriptions : list[str]) -> list[str]:
+    '''The previous path, an exact lookup then a fuzzy match for every row'''
+    return [parser.category_map[key] if key in parser.category_map else parser.fuzzy_category(key)
+            for key in descriptions]
+
+def timed(function, *args) -> tuple[float, list]:
+    '''Return elapsed seconds and the result'''
+    start  = time.perf_counter()
+    result = function(*args)
+    return time.perf_counter() - start, result
+
+if __name__ == '__main__':
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument('--rows', type=int, default=2000, help='Rows in the statement')
+    arg_parser.add_argument('--unique', type=int, default=150, help='Distinct merchants in the statement')
+    arg_parser.add_argument('--workers', type=int, default=2, help='Processes for the parallel fuzzy matching')
+    args = arg_parser.parse_args()
+
+    transactions = Transactions(merchants=args.unique)
+    descriptions = [f'{merchant} STORE' for _, _, merchant, _, _ in (next(transactions) for _ in range(args.rows))]
+    distinct     = len(set(descriptions))
+
+    row_time, expected = timed(per_row, QIFParser('', lazy=True), descriptions)
+    print(f'per row:               {row_time:7.3f} s ({args.rows} lookups)')
+
+    many_time, categories = timed(QIFParser('', lazy=True).categorize_many, descriptions)
+    print(f'categorize_many:       {many_time:7.3f} s ({distinct} lookups) {row_time / many_time:6.2f}x '
+          f'same: {categories == expected}')
+
+    pooled = QIFParser('', lazy=True, match_workers=args.workers)
+    pool_time, categories = timed(pooled.categorize_many, descriptions)
+    pooled.close_match_pool()
+    print(f'categorize_many, {args.workers:<2}p: {pool_time:7.3f} s ({distinct} lookups) {row_time / pool_time:6.2f}x '
+          f'same: {categories == expected}')
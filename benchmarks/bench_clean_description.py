@@ -0,0 +1,54 @@
+'''Compare the regex clean_description with the memoized translate pass
+
+Run from the repository root:
+    python -m benchmarks.bench_clean_description [--rows N] [--merchants N]
+'''
+import argparse
+import random
+import re
+import time
+
+from BudgetBuddy.CategoryMap import CATEGORY_MAP
+from BudgetBuddy.Parser import FileParser
+
+def regex_clean(in_str) -> str:
+    '''The previous two regex implementation'''
+    if in_str is None:
+        return ''
+
+    cleaned_str = re.sub(r'[0-9!"#$%&\'()*+,-./:;<=>?@[\]^_`{|}~]', '', in_str)
+    cleaned_str = re.sub(r'\s+', ' ', cleaned_str)
+    return cleaned_str.strip()
+
+def make_descriptions(rows : int, merchants : int, seed : int = 0) -> list[str]:
+    '''Raw statement descriptions, a limited set of merchants that repeat'''
+    rng   = random.Random(seed)
+    names = rng.sample(list(CATEGORY_MAP.keys()), min(merchants, len(CATEGORY_MAP)))
+    raw   = [f'{name.upper()} #{rng.randint(100, 9999)}  {rng.choice(["ORLANDO", "TAMPA", "MIAMI"])} FL'
+             for name in names]
+    return [rng.choice(raw) for _ in range(rows)]
+
+def time_clean(clean, descriptions : list[str]) -> tuple[float, list[str]]:
+    '''Return elapsed seconds and the cleaned descriptions'''
+    start   = time.perf_counter()
+    results = [clean(description) for description in descriptions]
+    return time.perf_counter() - start, results
+
+if __name__ == '__main__':
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument('--rows', type=int, default=500000, help='Number of descriptions to clean')
+    arg_parser.add_argument('--merchants', type=int, default=300, help='Number of distinct raw descriptions')
+    args = arg_parser.parse_args()
+
+    descriptions = make_descriptions(args.rows, args.merchants)
+
+    regex_time, regex_results = time_clean(regex_clean, descriptions)
+    FileParser.clean_description_cached.cache_clear()
+    cached_time, cached_results = time_clean(FileParser.clean_description, descriptions)
+
+    print(f'rows:       {args.rows}')
+    print(f'regex:      {regex_time:.3f} s ({args.rows / regex_time:.0f} rows/s)')
+    print(f'translate:  {cached_time:.3f} s ({args.rows / cached_time:.0f} rows/s)')
+    print(f'speedup:    {regex_time / cached_time:.1f}x')
+    print(f'identical:  {regex_results == cached_results}')
+    print(f'cache:      {FileParser.clean_description_cached.cache_info()}')
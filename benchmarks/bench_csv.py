@@ -0,0 +1,43 @@
+'''Compare CSVParser and Calculator with CSVLoader and PolarsCalculator
+
+Run from the repository root:
+    python -m benchmarks.bench_csv [--rows N]
+'''
+import argparse
+import os
+import tempfile
+import time
+
+from BudgetBuddy.Parser import CSVParser
+from BudgetBuddy.CSVLoader import CSVLoader
+from BudgetBuddy.Calculator import Calculator, PolarsCalculator
+from benchmarks.synthetic import generate_csv
+
+def timed(function) -> tuple[float, object]:
+    '''Return elapsed seconds and the result of function()'''
+    start  = time.perf_counter()
+    result = function()
+    return time.perf_counter() - start, result
+
+if __name__ == '__main__':
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument('--rows', type=int, default=1000000, help='Number of CSV rows')
+    args = arg_parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = os.path.join(tmp_dir, 'export.csv')
+        generate_csv(file_path, args.rows)
+        print(f'{args.rows} rows, {os.path.getsize(file_path) / 2**20:.1f} MiB')
+
+        parse_time, expense_list = timed(lambda: CSVParser(file_path).get_expense_list())
+        reduce_time, calculator  = timed(lambda: Calculator(expense_list))
+        print(f'CSVParser:        {parse_time:7.3f} s   Calculator:       {reduce_time:7.3f} s')
+
+        load_time, frame               = timed(lambda: CSVLoader(file_path).load())
+        frame_time, polars_calculator  = timed(lambda: PolarsCalculator(frame))
+        print(f'CSVLoader:        {load_time:7.3f} s   PolarsCalculator: {frame_time:7.3f} s')
+
+        speedup = (parse_time + reduce_time) / (load_time + frame_time)
+        same    = (polars_calculator.category_reduction() == calculator.category_reduction() and
+                   polars_calculator.expense_reduction() == calculator.expense_reduction())
+        print(f'total {speedup:5.2f}x faster, same reductions: {same}')
@@ -0,0 +1,53 @@
+'''Compare the memory used by expenses as plain objects, slotted objects and an ExpenseBatch
+
+Run from the repository root:
+    python -m benchmarks.bench_expense_memory [--rows N]
+'''
+import argparse
+import random
+import tracemalloc
+
+from BudgetBuddy.CategoryMap import CATEGORY_MAP
+from BudgetBuddy.Defines import Expense, ExpenseBatch
+
+class DictExpense():
+    '''The previous Expense layout, a per instance __dict__ and a type attribute'''
+    def __init__(self, description, category, credit, debit):
+        self.description = description
+        self.category = category
+        self.credit = credit
+        self.debit = debit
+        self.type = None
+
+def make_rows(count : int, seed : int = 0):
+    '''Yield statement rows, descriptions are rebuilt per row like a parser does'''
+    rng   = random.Random(seed)
+    items = list(CATEGORY_MAP.items())
+    for _ in range(count):
+        description, category = rng.choice(items)
+        yield description.upper(), category, 0.0, round(rng.uniform(1, 500), 2)
+
+def measure(build, count : int) -> int:
+    '''Return the bytes still allocated by the structure build returns'''
+    tracemalloc.start()
+    result = build(make_rows(count))
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return size
+
+if __name__ == '__main__':
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument('--rows', type=int, default=200000, help='Number of expenses')
+    args = arg_parser.parse_args()
+
+    results = {
+        'dict Expense'    : measure(lambda rows: [DictExpense(*row) for row in rows], args.rows),
+        'slotted Expense' : measure(lambda rows: [Expense(*row) for row in rows], args.rows),
+        'ExpenseBatch'    : measure(lambda rows: ExpenseBatch(Expense(*row) for row in rows), args.rows),
+    }
+
+    baseline = results['dict Expense']
+    print(f'rows: {args.rows}')
+    for name, size in results.items():
+        print(f'{name:16} {size / 2**20:8.1f} MiB {size / args.rows:7.1f} B/row {baseline / size:5.1f}x')
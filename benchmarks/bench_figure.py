@@ -0,0 +1,62 @@
+'''Compare building and serializing the sunburst through go.Figure and Figure.sunburst
+
+The Calculator holds one expense per description leaf, spread over the
+categories of the category map. Each builder is timed up to the JSON
+plotly.js receives, and the two JSONs are compared.
+
+Run from the repository root:
+    python -m benchmarks.bench_figure [--leaves 1000,10000,100000] [--repeat N]
+'''
+import argparse
+import json
+import random
+import time
+
+import plotly.io as pio
+from plotly import graph_objects as go
+
+from BudgetBuddy import CategoryMap, Figure
+from BudgetBuddy.Calculator import Calculator
+from BudgetBuddy.Defines import Expense
+
+def calculator(leaves : int, seed : int = 0) -> Calculator:
+    '''A Calculator with the given number of distinct descriptions'''
+    rng        = random.Random(seed)
+    categories = sorted(set(CategoryMap.CATEGORY_MAP.values()))
+    return Calculator([Expense(f'MERCHANT {leaf}', rng.choice(categories), 0.0, round(rng.uniform(1, 400), 2), '')
+                       for leaf in range(leaves)])
+
+def graph_objects(labels : list, parents : list, values : list) -> str:
+    '''The previous path, a validated go.Figure'''
+    fig = go.Figure(go.Sunburst(labels=labels, parents=parents, values=values))
+    fig.update_layout(margin = dict(t=0, l=0, r=0, b=0))
+    return pio.to_json(fig)
+
+def payload(labels : list, parents : list, values : list) -> str:
+    return pio.to_json(Figure.sunburst(labels, parents, values), validate=False)
+
+def best_of(function, repeat : int, *args) -> tuple[float, object]:
+    '''Return the best elapsed seconds and the result'''
+    best = float('inf')
+    for _ in range(repeat):
+        start  = time.perf_counter()
+        result = function(*args)
+        best   = min(best, time.perf_counter() - start)
+    return best, result
+
+if __name__ == '__main__':
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument('--leaves', default='1000,10000,100000', help='Comma separated leaf counts')
+    arg_parser.add_argument('--repeat', type=int, default=3, help='Runs per builder, the best is reported')
+    args = arg_parser.parse_args()
+
+    # The template is converted once per process, keep that out of the timings
+    Figure.template()
+
+    print(f'{"leaves":>8} {"go.Figure s":>12} {"dict s":>9} {"speedup":>8} {"MiB":>6}  same JSON')
+    for leaves in (int(leaves) for leaves in args.leaves.split(',')):
+        data = calculator(leaves).sunburst_data()
+        old_time, old_json = best_of(graph_objects, args.repeat, *data)
+        new_time, new_json = best_of(payload, args.repeat, *data)
+        print(f'{leaves:8d} {old_time:12.3f} {new_time:9.3f} {old_time / new_time:7.1f}x '
+              f'{len(new_json) / 2**20:6.1f}  {json.loads(old_json) == json.loads(new_json)}')
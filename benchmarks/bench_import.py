@@ -0,0 +1,51 @@
+'''Time the imports of main.py and the first load of the category map
+
+Runs `python -X importtime -c "import main"` a few times and reports the
+cumulative import time of the BudgetBuddy modules and the large third
+party packages (best of the runs), then times the first access to
+CategoryMap.CATEGORY_MAP in a fresh process.
+
+Run from the repository root:
+    python -m benchmarks.bench_import [--runs N]
+'''
+import argparse
+import subprocess
+import sys
+
+# Modules reported on their own, packages include everything they import
+TOP_MODULES = ('polars', 'plotly', 'PyPDF2', 'BudgetBuddy.Parser', 'BudgetBuddy.Calculator',
+               'BudgetBuddy.Interface', 'BudgetBuddy.CategoryMap', 'BudgetBuddy', 'main')
+
+LOAD_MAPS = ('import time; from BudgetBuddy import CategoryMap; start = time.perf_counter(); '
+             'CategoryMap.CATEGORY_MAP; print(time.perf_counter() - start)')
+
+def import_times(statement : str) -> dict:
+    '''Return {module : cumulative microseconds} from one -X importtime run'''
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', statement],
+                            capture_output=True, text=True, check=True)
+    times = {}
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        times[name.strip()] = int(cumulative)
+    return times
+
+if __name__ == '__main__':
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument('--runs', type=int, default=5, help='Runs to take the best time of')
+    args = arg_parser.parse_args()
+
+    runs = [import_times('import main') for _ in range(args.runs)]
+    print(f'{"module":<26} {"cumulative ms":>13}')
+    for module in TOP_MODULES:
+        times = [run[module] for run in runs if module in run]
+        if times:
+            print(f'{module:<26} {min(times) / 1000:13.1f}')
+        else:
+            print(f'{module:<26} {"not imported":>13}')
+
+    loads = [float(subprocess.run([sys.executable, '-c', LOAD_MAPS], capture_output=True,
+                                  text=True, check=True).stdout) for _ in range(args.runs)]
+    print(f'{"first CATEGORY_MAP access":<26} {min(loads) * 1000:13.1f}')
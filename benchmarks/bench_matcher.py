@@ -0,0 +1,69 @@
+'''Compare the linear fuzzy scan with the n-gram indexed matcher
+
+Run from the repository root:
+    python -m benchmarks.bench_matcher [--queries N]
+'''
+import argparse
+import random
+import string
+import time
+
+from BudgetBuddy.CategoryMap import CATEGORY_MAP
+from BudgetBuddy.Matcher import LinearMatcher, NGramMatcher, MATCH_THRESHOLD
+
+def make_queries(count : int, seed : int = 0) -> list[str]:
+    '''Build statement-like descriptions from the map keys with typos and noise'''
+    rng   = random.Random(seed)
+    names = list(CATEGORY_MAP.keys())
+    queries = []
+    for _ in range(count):
+        name = list(rng.choice(names).upper())
+        for _ in range(rng.randint(0, 2)):
+            pos = rng.randrange(len(name))
+            action = rng.choice(('drop', 'swap', 'insert'))
+            if action == 'drop' and len(name) > 1:
+                del name[pos]
+            elif action == 'swap' and pos + 1 < len(name):
+                name[pos], name[pos + 1] = name[pos + 1], name[pos]
+            else:
+                name.insert(pos, rng.choice(string.ascii_uppercase))
+        query = ''.join(name)
+        if rng.random() < 0.3:
+            query += ' ' + ''.join(rng.choices(string.ascii_uppercase, k=rng.randint(2, 8)))
+        queries.append(query)
+    return queries
+
+def time_matcher(matcher, queries : list[str]) -> tuple[float, list]:
+    '''Return elapsed seconds and the results for every query'''
+    start   = time.perf_counter()
+    results = [matcher.best_match(query) for query in queries]
+    return time.perf_counter() - start, results
+
+def accepted(result : tuple[str, float]) -> tuple[str, float]:
+    '''Reduce a result to what key_category_map acts on'''
+    value, score = result
+    return (value, score) if score >= MATCH_THRESHOLD else ('', 0.0)
+
+if __name__ == '__main__':
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument('--queries', type=int, default=2000, help='Number of descriptions to match')
+    args = arg_parser.parse_args()
+
+    queries = make_queries(args.queries)
+    names   = CATEGORY_MAP.keys()
+
+    start = time.perf_counter()
+    ngram = NGramMatcher(names)
+    build = time.perf_counter() - start
+
+    linear_time, linear_results = time_matcher(LinearMatcher(names), queries)
+    ngram_time,  ngram_results  = time_matcher(ngram, queries)
+
+    mismatches = sum(accepted(a) != accepted(b) for a, b in zip(linear_results, ngram_results))
+
+    print(f'queries:          {len(queries)}')
+    print(f'index build:      {build * 1000:.1f} ms')
+    print(f'linear scan:      {linear_time:.3f} s ({len(queries) / linear_time:.0f} queries/s)')
+    print(f'n-gram index:     {ngram_time:.3f} s ({len(queries) / ngram_time:.0f} queries/s)')
+    print(f'speedup:          {linear_time / ngram_time:.1f}x')
+    print(f'mismatches:       {mismatches}')
@@ -0,0 +1,43 @@
+'''Time PDFParser page text extraction: every page against the page selection,
+then serially against a worker pool
+
+Run from the repository root:
+    python -m benchmarks.bench_pdf [--pages N] [--trailer-pages N] [--workers N ...]
+'''
+import argparse
+import os
+import tempfile
+import time
+
+from BudgetBuddy.Parser import PDFParser
+from benchmarks.synthetic import generate_pdf
+
+def time_extract(file_path : str, workers : int, **kwargs) -> tuple[float, list]:
+    '''Return elapsed seconds and the (page number, text) of every extracted page'''
+    start  = time.perf_counter()
+    pages  = list(PDFParser(file_path, lazy=True, workers=workers, **kwargs).iter_page_text())
+    return time.perf_counter() - start, pages
+
+if __name__ == '__main__':
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument('--pages', type=int, default=300, help='Number of transaction pages')
+    arg_parser.add_argument('--trailer-pages', type=int, default=6, help='Boilerplate pages after the transactions')
+    arg_parser.add_argument('--rows-per-page', type=int, default=40, help='Transactions per page')
+    arg_parser.add_argument('--workers', type=int, nargs='+', default=[2, 4, os.cpu_count() or 1],
+                            help='Worker counts to compare with the serial parse')
+    args = arg_parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = os.path.join(tmp_dir, 'statement.pdf')
+        generate_pdf(file_path, args.pages * args.rows_per_page, rows_per_page=args.rows_per_page,
+                     trailer_pages=args.trailer_pages)
+
+        every_time, every_pages = time_extract(file_path, 1, pages='1-', detect_pages=False)
+        serial_time, serial_pages = time_extract(file_path, 1)
+        print(f'every page: {every_time:.3f} s ({len(every_pages)} pages)')
+        print(f'selected:   {serial_time:.3f} s ({len(serial_pages)} pages) {every_time / serial_time:5.2f}x')
+        print(f'serial:     {serial_time:.3f} s ({len(serial_pages) / serial_time:.1f} pages/s)')
+
+        for workers in sorted(set(args.workers)):
+            elapsed, pages = time_extract(file_path, workers)
+            print(f'workers {workers:<3} {elapsed:.3f} s {serial_time / elapsed:5.2f}x same order: {pages == serial_pages}')
@@ -0,0 +1,49 @@
+'''Compare the per page PDF transaction regexes with the single scan tokenizer
+
+Run from the repository root:
+    python -m benchmarks.bench_pdf_regex [--pages N] [--rows-per-page N]
+'''
+import argparse
+import re
+import time
+
+from BudgetBuddy.Parser import FileParser, PDFParser
+from benchmarks.synthetic import pdf_lines
+
+def legacy_parse_page(parser : PDFParser, text : str) -> list:
+    '''The previous implementation, a pattern built per page and three more regexes per match'''
+    results = []
+    date_pattern = r'(((Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s([0-9]{1,2})\s){2}(.*)[0-9]*\.[0-9]{2})'
+    for match in re.findall(date_pattern, text):
+        cleaned_str  = re.sub(r'((Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s([0-9]{1,2})\s){2}', ' ', match[0])
+        split_string = cleaned_str.split('$')
+        description  = parser.remove_city_state_from_description(parser.clean_description(split_string[0]))
+        results.append((' '.join(match[0].split()[:2]), description, abs(parser.str_to_float(split_string[1]))))
+    return results
+
+def time_pages(parse, pages : list[str]) -> tuple[float, list]:
+    '''Return elapsed seconds and the transactions of every page'''
+    start   = time.perf_counter()
+    results = [parse(page) for page in pages]
+    return time.perf_counter() - start, results
+
+if __name__ == '__main__':
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument('--pages', type=int, default=500, help='Number of pages')
+    arg_parser.add_argument('--rows-per-page', type=int, default=40, help='Transactions per page')
+    args = arg_parser.parse_args()
+
+    lines  = pdf_lines(args.pages * args.rows_per_page)
+    pages  = ['\n'.join(lines[start:start + args.rows_per_page]) for start in range(0, len(lines), args.rows_per_page)]
+    parser = PDFParser('', lazy=True)
+
+    FileParser.clean_description_cached.cache_clear()
+    legacy_time, legacy_results = time_pages(lambda page: legacy_parse_page(parser, page), pages)
+    FileParser.clean_description_cached.cache_clear()
+    single_time, single_results = time_pages(lambda page: list(parser.parse_page(page)), pages)
+
+    print(f'pages:        {len(pages)} ({len(lines)} transactions)')
+    print(f'legacy:       {legacy_time / len(pages) * 1e3:.3f} ms/page')
+    print(f'single scan:  {single_time / len(pages) * 1e3:.3f} ms/page')
+    print(f'speedup:      {legacy_time / single_time:.1f}x')
+    print(f'identical:    {legacy_results == single_results}')
@@ -0,0 +1,79 @@
+'''Compare the whole tree QFX parse with the streaming iterparse engine
+
+Categories are left out so only the file handling is timed. The previous
+engine needs XML, so it reads an XML copy of the SGML download.
+
+Run from the repository root:
+    python -m benchmarks.bench_qfx [--rows N] [--accounts N]
+'''
+import argparse
+import os
+import shutil
+import tempfile
+import time
+import tracemalloc
+import xml.etree.ElementTree as ET
+
+from BudgetBuddy.OFXStream import OFXStream
+from BudgetBuddy.Parser import QFXParser
+from BudgetBuddy.Defines import Expense
+from benchmarks.synthetic import generate_qfx
+
+class UncategorizedQFXParser(QFXParser):
+    '''QFXParser without the category lookup'''
+    def categorize_many(self, descriptions : list[str]) -> list[str]:
+        return ['Unknown'] * len(descriptions)
+
+def legacy_expenses(parser : QFXParser) -> list:
+    '''The previous implementation, the whole tree in memory and a find per field'''
+    expenses = []
+    root = ET.parse(parser.file_path).getroot()
+    for transaction in root.iter('STMTTRN'):
+        if transaction.find('TRNTYPE').text != 'DEBIT':
+            continue
+        name = parser.clean_description(transaction.find('MEMO').text)
+        expenses.append(Expense(name, 'Unknown', 0.0, abs(parser.str_to_float(transaction.find('TRNAMT').text)),
+                                transaction.findtext('DTPOSTED')))
+    return expenses
+
+def measure(parse) -> tuple[float, int, list]:
+    '''Return elapsed seconds, peak traced bytes and the (description, debit, date) rows
+
+    Memory is traced on a second run, tracing slows the parse down too much to time it.
+    '''
+    start    = time.perf_counter()
+    expenses = list(parse())
+    elapsed  = time.perf_counter() - start
+    rows     = [(expense.description, expense.debit, expense.date) for expense in expenses]
+    del expenses
+
+    # Consume the expenses without keeping them, like a streamed Calculator
+    tracemalloc.start()
+    for _ in parse():
+        pass
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak, rows
+
+if __name__ == '__main__':
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument('--rows', type=int, default=200000, help='Number of transactions')
+    arg_parser.add_argument('--accounts', type=int, default=4, help='Number of accounts in the download')
+    args = arg_parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        sgml_path = os.path.join(tmp_dir, 'download.qfx')
+        xml_path  = os.path.join(tmp_dir, 'download.xml.qfx')
+        generate_qfx(sgml_path, args.rows, accounts=args.accounts)
+        with open(sgml_path, 'rb') as in_file, open(xml_path, 'wb') as out_file:
+            out_file.write(b'<?xml version="1.0" encoding="UTF-8"?>\n<?OFX OFXHEADER="200" VERSION="211"?>\n')
+            shutil.copyfileobj(OFXStream(in_file), out_file)
+
+        legacy = measure(lambda: legacy_expenses(UncategorizedQFXParser(xml_path, lazy=True)))
+        print(f'{"engine":<18} {"seconds":>8} {"rows/s":>10} {"peak MiB":>9}')
+        print(f'{"tree (XML)":<18} {legacy[0]:8.3f} {len(legacy[2]) / legacy[0]:10.0f} {legacy[1] / 2**20:9.1f}')
+
+        for name, file_path in (('iterparse (XML)', xml_path), ('iterparse (SGML)', sgml_path)):
+            result = measure(lambda file_path=file_path: UncategorizedQFXParser(file_path, lazy=True).iter_expenses())
+            print(f'{name:<18} {result[0]:8.3f} {len(result[2]) / result[0]:10.0f} {result[1] / 2**20:9.1f}'
+                  f'  same rows: {result[2] == legacy[2]}')
@@ -0,0 +1,69 @@
+'''Compare the fixed position QIF reader with the buffered state machine
+
+The state machine takes the categories from the L field and never needs to
+match. The fixed position reader matches every record, so it is timed once
+without matching to compare the file handling alone, and once with matching
+on a sample of the records.
+
+Run from the repository root:
+    python -m benchmarks.bench_qif [--rows N]
+'''
+import argparse
+import os
+import tempfile
+import time
+
+from BudgetBuddy.Parser import QIFParser
+from BudgetBuddy.Defines import Expense
+from benchmarks.synthetic import generate_qif
+
+class UncategorizedQIFParser(QIFParser):
+    '''QIFParser without the category lookup'''
+    def categorize_many(self, descriptions : list[str]) -> list[str]:
+        return ['Unknown'] * len(descriptions)
+
+def legacy_expenses(parser : QIFParser):
+    '''The previous implementation, a list of lines per record read at fixed positions'''
+    with open(parser.file_path, 'r', encoding="UTF-8") as in_file:
+        tmp_str = []
+        for line in in_file:
+            line = line.rstrip()
+            if line[0] == '!':
+                continue
+            tmp_str.append(line)
+            if '^' in line:
+                name = parser.symbols.intern(tmp_str[3].replace('P', '', 1))
+                yield Expense(name, parser.key_category_map(name), 0.0,
+                              abs(parser.str_to_float(tmp_str[1].replace('T-', '', 1).replace(',', ''))),
+                              tmp_str[0].replace('D', '', 1))
+                tmp_str = []
+
+def time_expenses(expenses) -> tuple[float, list]:
+    '''Return elapsed seconds and the (description, debit, date) rows'''
+    start = time.perf_counter()
+    rows  = [(expense.description, expense.debit, expense.date) for expense in expenses]
+    return time.perf_counter() - start, rows
+
+if __name__ == '__main__':
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument('--rows', type=int, default=1000000, help='Number of records')
+    arg_parser.add_argument('--sample', type=int, default=1000, help='Records read with matching by the fixed position reader')
+    args = arg_parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = os.path.join(tmp_dir, 'export.qif')
+        generate_qif(file_path, args.rows)
+        print(f'{args.rows} records, {os.path.getsize(file_path) / 2**20:.1f} MiB')
+
+        sample_path = os.path.join(tmp_dir, 'sample.qif')
+        generate_qif(sample_path, args.sample)
+        sample_time, _ = time_expenses(legacy_expenses(QIFParser(sample_path, lazy=True, cache=None)))
+        print(f'fixed positions, matching:    {sample_time:7.3f} s {args.sample / sample_time:10.0f} records/s '
+              f'({args.sample} records)')
+
+        legacy_time, legacy_rows = time_expenses(legacy_expenses(UncategorizedQIFParser(file_path, lazy=True)))
+        print(f'fixed positions, no matching: {legacy_time:7.3f} s {args.rows / legacy_time:10.0f} records/s')
+
+        state_time, state_rows = time_expenses(QIFParser(file_path, lazy=True).iter_expenses())
+        print(f'state machine:                {state_time:7.3f} s {args.rows / state_time:10.0f} records/s '
+              f'{legacy_time / state_time:5.2f}x same rows: {state_rows == legacy_rows}')
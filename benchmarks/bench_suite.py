@@ -0,0 +1,169 @@
+'''Throughput of every stage on synthetic statements, as JSON
+
+For each format and size a deterministic statement is generated (or reused
+from --data-dir), then the parser, Calculator and the sunburst build (the
+figure up to its JSON) are timed separately. Categories are fuzzy matched
+without a cache, the matcher itself is built before any timing. Each
+stage's best time over --repeat runs is reported.
+
+Results go to --output (stdout by default) as JSON. With --baseline, an
+earlier output is compared stage by stage, a ratio above 1 is slower.
+QIF and QFX descriptions keep the city, so nearly every row is a distinct
+description to fuzzy match and those parsers run at a few thousand rows
+per second; 1M rows of them take a long time.
+
+Run from the repository root:
+    python -m benchmarks.bench_suite [--sizes 1000,100000] [--formats csv,qif] [--output results.json]
+                                     [--baseline previous.json] [--data-dir DIR] [--repeat N]
+'''
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+
+import plotly.io as pio
+
+from BudgetBuddy import Figure
+from BudgetBuddy.Parser import FileParser, FileCategoryParser, CSVParser, QIFParser, QFXParser, PDFParser
+from BudgetBuddy.CSVLoader import CSVLoader
+from BudgetBuddy.Calculator import Calculator
+from benchmarks.synthetic import generate_csv, generate_qif, generate_qfx, generate_pdf
+
+RESULTS_FORMAT = 1
+SIZES          = (1000, 100000, 1000000)
+
+# Generator, parser and file extension of each format. QIF files come
+# without categories so the matching is timed like the other formats.
+FORMATS = {
+    'csv' : (generate_csv, CSVParser, '.csv'),
+    'qif' : (lambda path, rows, seed: generate_qif(path, rows, seed, categorized=False), QIFParser, '.qif'),
+    'qfx' : (generate_qfx, QFXParser, '.qfx'),
+    'pdf' : (generate_pdf, PDFParser, '.pdf'),
+}
+
+def statement(data_dir : str, file_format : str, rows : int, seed : int) -> str:
+    '''Return the path of the synthetic statement, generating it if it is not there yet'''
+    generate, _, extension = FORMATS[file_format]
+    file_path = os.path.join(data_dir, f'{file_format}-{rows}-{seed}{extension}')
+    if not os.path.exists(file_path):
+        generate(file_path, rows, seed)
+    return file_path
+
+def best_of(function, repeat : int) -> tuple[float, float, object]:
+    '''Return the best wall and CPU seconds of function() and its last result
+
+    The description cleaning memo is cleared before each run so every run
+    starts cold.
+    '''
+    wall, cpu = float('inf'), float('inf')
+    for _ in range(repeat):
+        FileParser.clean_description_cached.cache_clear()
+        wall_start, cpu_start = time.perf_counter(), time.process_time()
+        result = function()
+        wall = min(wall, time.perf_counter() - wall_start)
+        cpu  = min(cpu, time.process_time() - cpu_start)
+    return wall, cpu, result
+
+def sunburst_figure(labels : list, parents : list, values : list) -> str:
+    '''The figure Interface.generate_sunburst_data shows, up to the JSON plotly.js receives'''
+    return pio.to_json(Figure.sunburst(labels, parents, values), validate=False)
+
+def run(file_format : str, rows : int, data_dir : str, seed : int = 0, repeat : int = 1) -> list[dict]:
+    '''Time each stage on one statement, return a result per stage'''
+    file_path = statement(data_dir, file_format, rows, seed)
+    parser    = FORMATS[file_format][1]
+    results   = []
+
+    def record(stage : str, timing : tuple, items : int):
+        wall, cpu, _ = timing
+        results.append({'format' : file_format, 'rows' : rows, 'stage' : stage, 'items' : items,
+                        'wall' : round(wall, 6), 'cpu' : round(cpu, 6),
+                        'rows_per_second' : round(rows / wall, 1) if wall else None})
+
+    parse = best_of(lambda: parser(file_path).get_expense_list(), repeat)
+    expenses = parse[2]
+    record(parser.__name__, parse, len(expenses))
+
+    if file_format == 'csv':
+        load = best_of(lambda: CSVLoader(file_path).load(), repeat)
+        record('CSVLoader', load, load[2].height)
+
+    reduce = best_of(lambda: Calculator(expenses), repeat)
+    record('Calculator', reduce, len(expenses))
+
+    data = best_of(reduce[2].sunburst_data, repeat)
+    record('sunburst_data', data, len(data[2][0]))
+
+    figure = best_of(lambda: sunburst_figure(*data[2]), repeat)
+    record('sunburst_figure', figure, len(data[2][0]))
+    return results
+
+def environment() -> dict:
+    '''Where the results were measured'''
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip() or None
+    except OSError:
+        commit = None
+    return {'commit' : commit, 'python' : platform.python_version(), 'platform' : platform.platform(),
+            'cpus' : os.cpu_count()}
+
+def compare(results : list[dict], baseline : dict) -> list[str]:
+    '''Return a line per stage also in the baseline, with the wall time ratio'''
+    earlier = {(result['format'], result['rows'], result['stage']) : result for result in baseline['results']}
+    lines   = []
+    for result in results:
+        before = earlier.get((result['format'], result['rows'], result['stage']))
+        if before is None or not before['wall']:
+            continue
+        lines.append(f'{result["format"]:<4} {result["rows"]:>8} {result["stage"]:<16} '
+                     f'{before["wall"]:9.3f} s -> {result["wall"]:9.3f} s  {result["wall"] / before["wall"]:5.2f}x')
+    return lines
+
+def parse_list(text : str) -> list[str]:
+    return [item.strip() for item in text.split(',') if item.strip()]
+
+if __name__ == '__main__':
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument('--sizes', default=','.join(map(str, SIZES)), help='Comma separated row counts')
+    arg_parser.add_argument('--formats', default=','.join(FORMATS), help='Comma separated formats')
+    arg_parser.add_argument('--repeat', type=int, default=1, help='Runs per stage, the best is reported')
+    arg_parser.add_argument('--seed', type=int, default=0, help='Seed of the synthetic statements')
+    arg_parser.add_argument('--data-dir', default=None, help='Keep the generated statements here for later runs')
+    arg_parser.add_argument('--output', default=None, help='Write the JSON here instead of stdout')
+    arg_parser.add_argument('--baseline', default=None, help='Earlier JSON output to compare against')
+    args = arg_parser.parse_args()
+
+    formats = parse_list(args.formats)
+    unknown = [file_format for file_format in formats if file_format not in FORMATS]
+    if unknown:
+        arg_parser.error(f'unknown formats {unknown}, choose from {list(FORMATS)}')
+
+    # Built once per process, like main.py does
+    FileCategoryParser.default_matcher()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        data_dir = args.data_dir or tmp_dir
+        os.makedirs(data_dir, exist_ok=True)
+        results = []
+        for rows in map(int, parse_list(args.sizes)):
+            for file_format in formats:
+                results.extend(run(file_format, rows, data_dir, args.seed, args.repeat))
+                print(f'{file_format} {rows} done', file=sys.stderr)
+
+    report = {'version' : RESULTS_FORMAT, 'environment' : environment(), 'seed' : args.seed,
+              'repeat' : args.repeat, 'results' : results}
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as out_file:
+            json.dump(report, out_file, indent=1)
+    else:
+        json.dump(report, sys.stdout, indent=1)
+        print()
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as in_file:
+            print('\n'.join(compare(results, json.load(in_file))), file=sys.stderr)
@@ -0,0 +1,149 @@
+'''Deterministic synthetic statements for the benchmarks'''
+import random
+import csv
+
+from BudgetBuddy.CategoryMap import CATEGORY_MAP, CITY_LIST_FL
+
+MONTHS = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+
+class Transactions:
+    '''Random but repeatable transactions, merchants drawn from CATEGORY_MAP'''
+    def __init__(self, seed : int = 0, merchants : int = 400):
+        self.rng       = random.Random(seed)
+        self.merchants = self.rng.sample(sorted(CATEGORY_MAP), min(merchants, len(CATEGORY_MAP)))
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> tuple[int, int, str, str, float]:
+        '''Return (month, day, merchant, city, amount)'''
+        rng = self.rng
+        return (rng.randrange(12), rng.randint(1, 28), rng.choice(self.merchants).upper(),
+                rng.choice(CITY_LIST_FL).upper(), round(rng.uniform(1, 400), 2))
+
+def pdf_escape(text : str) -> str:
+    '''Escape a string for a PDF literal'''
+    return text.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+
+def write_pdf(file_path : str, pages : list[list[str]], resources : str = 'inline', form_pages = (), raw_pages = ()):
+    '''Write a minimal PDF, one Helvetica text line per string
+
+    resources places the font: 'inline' in each page, 'indirect' in a shared
+    object the pages refer to, 'inherited' in the /Pages node only. Pages
+    numbered in form_pages draw their text through a form XObject, pages
+    numbered in raw_pages hold text showing operators written as given.
+    '''
+    objects = ['<< /Type /Catalog /Pages 2 0 R >>', None,
+               '<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>']
+    fonts   = '<< /Font << /F1 3 0 R >> >>'
+    if resources == 'indirect':
+        objects.append(fonts)
+    page_resources = {'inline' : f'/Resources {fonts} ', 'indirect' : f'/Resources {len(objects)} 0 R ',
+                      'inherited' : ''}[resources]
+
+    kids = []
+    for page_num, lines in enumerate(pages):
+        stream = ['BT /F1 9 Tf 11 TL 36 760 Td']
+        if page_num in raw_pages:
+            stream.extend(f'{line} T*' for line in lines)
+        else:
+            stream.extend(f'({pdf_escape(line)}) Tj T*' for line in lines)
+        stream.append('ET')
+        content = '\n'.join(stream)
+
+        page_entry = page_resources
+        if page_num in form_pages:
+            objects.append(f'<< /Type /XObject /Subtype /Form /BBox [0 0 612 792] /Resources {fonts} '
+                           f'/Length {len(content)} >>\nstream\n{content}\nendstream')
+            page_entry = f'/Resources << /Font << /F1 3 0 R >> /XObject << /Fm0 {len(objects)} 0 R >> >> '
+            content    = 'q /Fm0 Do Q'
+
+        objects.append(f'<< /Length {len(content)} >>\nstream\n{content}\nendstream')
+        objects.append(f'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] '
+                       f'{page_entry}/Contents {len(objects)} 0 R >>')
+        kids.append(f'{len(objects)} 0 R')
+    inherited  = f'/Resources {fonts} ' if resources == 'inherited' else ''
+    objects[1] = f'<< /Type /Pages {inherited}/Kids [{" ".join(kids)}] /Count {len(kids)} >>'
+
+    with open(file_path, 'wb') as out_file:
+        out_file.write(b'%PDF-1.4\n')
+        offsets = []
+        for number, body in enumerate(objects, 1):
+            offsets.append(out_file.tell())
+            out_file.write(f'{number} 0 obj\n{body}\nendobj\n'.encode('latin-1'))
+
+        xref = out_file.tell()
+        out_file.write(f'xref\n0 {len(objects) + 1}\n0000000000 65535 f \n'.encode('latin-1'))
+        for offset in offsets:
+            out_file.write(f'{offset:010d} 00000 n \n'.encode('latin-1'))
+        out_file.write(f'trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\n'
+                       f'startxref\n{xref}\n%%EOF\n'.encode('latin-1'))
+
+def pdf_lines(rows : int, seed : int = 0) -> list[str]:
+    '''Statement transaction lines: "Mon D Mon D MERCHANT CITYFL $amount"'''
+    transactions = Transactions(seed)
+    lines = []
+    for _ in range(rows):
+        month, day, merchant, city, amount = next(transactions)
+        lines.append(f'{MONTHS[month]} {day} {MONTHS[month]} {min(day + 2, 28)} '
+                     f'{merchant} {city}FL ${amount:.2f}')
+    return lines
+
+def generate_pdf(file_path : str, rows : int, seed : int = 0, rows_per_page : int = 60, trailer_pages : int = 0):
+    '''Statement PDF: three summary pages, pages of transaction lines, then boilerplate pages'''
+    summary = [[f'Account summary page {page + 1}', 'Previous balance $1,234.56', 'Payments and credits',
+                'Questions? Call the number on the back of your card'] for page in range(3)]
+
+    lines = pdf_lines(rows, seed)
+    pages = summary + [lines[start:start + rows_per_page] for start in range(0, len(lines), rows_per_page)]
+    pages.extend([f'Important information page {page + 1}', 'Interest charge calculation',
+                  'Annual percentage rate 24.99%', 'Billing rights summary'] for page in range(trailer_pages))
+    write_pdf(file_path, pages)
+
+OFX_HEADER = ('OFXHEADER:100\nDATA:OFXSGML\nVERSION:102\nSECURITY:NONE\nENCODING:USASCII\nCHARSET:1252\n'
+              'COMPRESSION:NONE\nOLDFILEUID:NONE\nNEWFILEUID:NONE\n\n')
+
+def generate_qfx(file_path : str, rows : int, seed : int = 0, accounts : int = 1):
+    '''SGML OFX download with unclosed leaf tags, rows split over several accounts, every fifth row a credit'''
+    transactions = Transactions(seed)
+    per_account  = -(-rows // accounts)
+    with open(file_path, 'w', encoding='cp1252') as out_file:
+        out_file.write(OFX_HEADER + '<OFX>\n<CREDITCARDMSGSRSV1>\n')
+        for account in range(accounts):
+            out_file.write(f'<CCSTMTTRNRS><CCSTMTRS><CCACCTFROM><ACCTID>{account:04d}</CCACCTFROM>\n'
+                           '<BANKTRANLIST><DTSTART>20240101<DTEND>20241231\n')
+            for row in range(account * per_account, min(rows, (account + 1) * per_account)):
+                month, day, merchant, city, amount = next(transactions)
+                trntype = 'CREDIT' if row % 5 == 4 else 'DEBIT'
+                out_file.write(f'<STMTTRN>\n<TRNTYPE>{trntype}\n<DTPOSTED>2024{month + 1:02d}{day:02d}120000\n'
+                               f'<TRNAMT>{-amount:.2f}\n<FITID>{row}\n<NAME>{merchant[:32]}\n'
+                               f'<MEMO>{merchant} {city} FL\n</STMTTRN>\n')
+            out_file.write('</BANKTRANLIST></CCSTMTRS></CCSTMTTRNRS>\n')
+        out_file.write('</CREDITCARDMSGSRSV1>\n</OFX>\n')
+
+def generate_qif(file_path : str, rows : int, seed : int = 0, categorized : bool = True):
+    '''Quicken credit card export, D/T/C/P/L records, with an L category from CATEGORY_MAP when categorized'''
+    transactions = Transactions(seed)
+    categories   = {merchant.upper() : category for merchant, category in CATEGORY_MAP.items()}
+    with open(file_path, 'w', encoding='utf-8') as out_file:
+        out_file.write('!Type:CCard\n')
+        for _ in range(rows):
+            month, day, merchant, city, amount = next(transactions)
+            category = f'L{categories[merchant]}\n' if categorized else ''
+            out_file.write(f'D{month + 1}/{day}/2024\nT-{amount:,.2f}\nC*\nP{merchant} {city} FL\n{category}^\n')
+
+def generate_csv(file_path : str, rows : int, seed : int = 0):
+    '''Capital One CSV export, every tenth row a payment credit'''
+    transactions = Transactions(seed)
+    categories   = {merchant.upper() : category for merchant, category in CATEGORY_MAP.items()}
+    with open(file_path, 'w', newline='', encoding='utf-8') as out_file:
+        writer = csv.writer(out_file)
+        writer.writerow(['Transaction Date', 'Posted Date', 'Card No.', 'Description', 'Category', 'Debit', 'Credit'])
+        for row in range(rows):
+            month, day, merchant, city, amount = next(transactions)
+            date = f'2024-{month + 1:02d}-{day:02d}'
+            if row % 10 == 9:
+                writer.writerow([date, date, '1234', 'CAPITAL ONE MOBILE PYMT', 'Payment/Credit', '', f'{amount:.2f}'])
+            else:
+                writer.writerow([date, date, '1234', f'{merchant} #{row % 9000} {city} FL', categories[merchant],
+                                 f'{amount:.2f}', ''])
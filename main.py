@@ -1,10 +1,16 @@
 import argparse
+import polars as pl
 import logging
+import json
 import os
 import sys
 
-from BudgetBuddy.Parser import CSVParser, QIFParser, QFXParser, PDFParser
-from BudgetBuddy.Calculator import Calculator
+from BudgetBuddy import CategoryMap, Profiler
+from BudgetBuddy.Batch import expand_paths, parser_for, ingest, ingest_each
+from BudgetBuddy.Calculator import Calculator, PolarsCalculator
+from BudgetBuddy.CSVLoader import PRESETS, load_csv
+from BudgetBuddy.Parser import CSVParser
+from BudgetBuddy.Ledger import Ledger
 from BudgetBuddy.Interface import Interface
 
 if __name__ == '__main__':
@@ -12,33 +18,125 @@ if __name__ == '__main__':
     logging.basicConfig(level=logging.DEBUG, format="%(asctime)s - %(levelname)s - %(message)s")
     logging.info('Current working directory: %s', os.getcwd())
 
-    # Get the file path from arguments
+    # Get the file paths from arguments
     arg_parser = argparse.ArgumentParser()
-    arg_parser.add_argument('file_path', help='File path to statement')
+    arg_parser.add_argument('file_path', nargs='+', help='File paths, directories or globs of statements')
+    arg_parser.add_argument('--workers', type=int, default=None,
+                            help='Number of processes parsing statements (default: one per core)')
+    arg_parser.add_argument('--pdf-workers', type=int, default=1,
+                            help='Number of processes extracting the pages of each PDF')
+    arg_parser.add_argument('--match-workers', type=int, default=1,
+                            help='Number of processes fuzzy matching the descriptions of each statement')
+    arg_parser.add_argument('--pdf-pages', default=None,
+                            help='1-based PDF pages to read, such as 4-9,12 (default: all after the summary)')
+    arg_parser.add_argument('--csv-preset', choices=['auto', *PRESETS], default=None,
+                            help='Load CSV exports by header name with Polars, auto picks the preset from the header')
+    arg_parser.add_argument('--category-map', default=None,
+                            help='JSON map of description to category used on top of the built-in map')
+    arg_parser.add_argument('--cache', default=os.path.join('~', '.budgetbuddy', 'category_cache.db'),
+                            help='File path to the category resolution cache')
+    arg_parser.add_argument('--no-cache', action='store_true', help='Do not read or write the category cache')
+    arg_parser.add_argument('--ledger', default=None,
+                            help='File path to a ledger, only new statements are parsed and all imports are shown')
+    arg_parser.add_argument('--top', type=int, default=None,
+                            help='Show at most this many descriptions per category, the rest are grouped as Other')
+    arg_parser.add_argument('--min-share', type=float, default=0.0,
+                            help='Group descriptions below this fraction of the total cost as Other, such as 0.001')
+    arg_parser.add_argument('--html', default=None,
+                            help='Write the sunburst to this HTML file instead of opening a browser')
+    arg_parser.add_argument('--plotlyjs', choices=['directory', 'cdn', 'inline'], default='directory',
+                            help='Where the HTML report loads plotly.js from (default: one shared file in its directory)')
+    arg_parser.add_argument('--json', default=None,
+                            help='Write the category and description totals to this JSON file instead of opening a browser')
+    arg_parser.add_argument('--profile', default=None,
+                            help='Write per stage timings and counters as JSON to this file, - for stdout')
+    arg_parser.add_argument('--cprofile', default=None,
+                            help='Also write cProfile statistics to this file (read with python -m pstats)')
+    arg_parser.add_argument('--profile-memory', type=int, default=0, metavar='N',
+                            help='Trace allocations, add the peak and the N largest allocation sites to the profile')
     args = arg_parser.parse_args()
-    file_path = args.file_path
-
-    if not os.path.exists(file_path):
-        logging.error('File does not exist %s', file_path)
-        sys.exit('File does not exist %s', file_path)
-
-    logging.info('Successfully loaded %s!', file_path)
-
-    # Choose parser based on extension
-    parser = None
-    if file_path.lower().endswith('csv'):
-        parser = CSVParser(file_path)
-    elif file_path.lower().endswith('qif'):
-        parser = QIFParser(file_path)
-    elif file_path.lower().endswith('qfx'):
-        parser = QFXParser(file_path)
-    elif file_path.lower().endswith('pdf'):
-        parser = PDFParser(file_path)
-    else:
-        logging.fatal('UNSUPPORTED FILE TYPE %s! Exiting...', file_path)
 
+    # Measure everything after the arguments, worker processes report back to this profile
+    profile = None
+    if args.profile is not None or args.cprofile is not None:
+        profile = Profiler.Profile(cprofile=args.cprofile is not None, memory_top=args.profile_memory).start()
+
+    # Set through the environment so parser worker processes load it too
+    if args.category_map is not None:
+        os.environ[CategoryMap.OVERRIDE_ENV] = os.path.abspath(os.path.expanduser(args.category_map))
+
+    # Category cache shared by the parsers that fuzzy match
+    cache_path = None
+    if not args.no_cache:
+        cache_path = os.path.expanduser(args.cache)
+        os.makedirs(os.path.dirname(cache_path) or '.', exist_ok=True)
+
+    file_paths = expand_paths(args.file_path)
+    for file_path in file_paths:
+        if not os.path.exists(file_path):
+            logging.error('File does not exist %s', file_path)
+            sys.exit(f'File does not exist {file_path}')
+
+        # Choose parser based on extension
+        if parser_for(file_path) is None:
+            logging.fatal('UNSUPPORTED FILE TYPE %s! Exiting...', file_path)
+            sys.exit(f'Unsupported file type {file_path}')
+
+    if not file_paths:
+        sys.exit('No statements found')
+
+    logging.info('Successfully loaded %d statements!', len(file_paths))
+    options = {name : {'match_workers' : args.match_workers} for name in ('QIFParser', 'QFXParser', 'PDFParser')}
+    options['PDFParser'].update(workers=args.pdf_workers, pages=args.pdf_pages)
+
+    if args.ledger is not None:
+        # Parse only the statements the ledger has not seen, then aggregate the whole ledger
+        ledger  = Ledger(os.path.expanduser(args.ledger))
+        pending = ledger.pending(file_paths)
+        for file_path, expenses, _ in ingest_each(list(pending), args.workers, cache_path, options):
+            with Profiler.stage('Ledger.record', len(expenses)):
+                ledger.record(file_path, pending[file_path], expenses)
+
+        with Profiler.stage('Calculator'):
+            calculator = Calculator(ledger.iter_expenses())
+        ledger.close()
+    elif args.csv_preset is not None:
+        # CSV exports go straight into a DataFrame, any other statements are parsed and added to it
+        csv_paths    = [file_path for file_path in file_paths if parser_for(file_path) is CSVParser]
+        other_paths  = [file_path for file_path in file_paths if parser_for(file_path) is not CSVParser]
+        expenses     = ingest(other_paths, args.workers, cache_path, options)[0] if other_paths else []
+
+        with Profiler.stage('CSVLoader') as timer:
+            frame      = load_csv(csv_paths, None if args.csv_preset == 'auto' else args.csv_preset)
+            timer.rows = frame.height
+        frame = pl.concat([frame, PolarsCalculator.to_frame(expenses)])
+        with Profiler.stage('PolarsCalculator', frame.height):
+            calculator = PolarsCalculator(frame)
+    else:
+        # One batch for the run, reduced on its integer codes
+        batch, _ = ingest(file_paths, args.workers, cache_path, options)
+        with Profiler.stage('Calculator', len(batch)):
+            calculator = Calculator(batch)
 
     # Create BudgetBuddy
-    calculator = Calculator(parser.get_expense_list())
-    interface = Interface(calculator)
-    interface.generate_sunburst_data()
+    interface = Interface(calculator, args.top, args.min_share)
+    if args.html is None and args.json is None:
+        interface.generate_sunburst_data()
+
+    # Headless reports, nothing is shown
+    if args.html is not None:
+        interface.write_html(os.path.expanduser(args.html), args.plotlyjs)
+    if args.json is not None:
+        interface.write_json(os.path.expanduser(args.json))
+
+    if profile is not None:
+        profile.stop()
+        if args.cprofile is not None:
+            profile.dump_cprofile(args.cprofile)
+        if args.profile == '-':
+            json.dump(profile.report(), sys.stdout, indent=1)
+            print()
+        elif args.profile is not None:
+            with open(args.profile, 'w', encoding='utf-8') as out_file:
+                json.dump(profile.report(), out_file, indent=1)
+            logging.info('Wrote the profile to %s', args.profile)
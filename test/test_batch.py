@@ -0,0 +1,78 @@
+import os
+from BudgetBuddy.Batch import expand_paths, ingest
+from BudgetBuddy.Calculator import Calculator
+from BudgetBuddy.Defines import ExpenseBatch
+
+QIF = '''!Type:CCard
+D01/05/2024
+T-{amount}
+PPUBLIX #1234
+^'''
+
+def write(file_path, text=''):
+    '''Write a file, creating its directory, and return its path'''
+    os.makedirs(os.path.dirname(file_path), exist_ok=True)
+    with open(file_path, 'w', encoding='utf-8') as out_file:
+        out_file.write(text)
+    return str(file_path)
+
+def test_expand_directory(tmp_path):
+    '''Directories are walked recursively and only supported extensions are kept'''
+    write(tmp_path / 'b.qif')
+    write(tmp_path / 'a.CSV')
+    write(tmp_path / 'notes.txt')
+    write(tmp_path / 'nested' / 'c.pdf')
+
+    assert expand_paths([str(tmp_path)]) == [str(tmp_path / 'a.CSV'), str(tmp_path / 'b.qif'),
+                                             str(tmp_path / 'nested' / 'c.pdf')]
+
+def test_expand_glob(tmp_path):
+    '''Globs are expanded in sorted order, skipping directories and unsupported files'''
+    write(tmp_path / 'jan.qfx')
+    write(tmp_path / 'feb.ofx')
+    write(tmp_path / 'mar.txt')
+    os.makedirs(tmp_path / 'apr.qfx')
+    write(tmp_path / 'nested' / 'may.qbo')
+
+    assert expand_paths([str(tmp_path / '*')]) == [str(tmp_path / 'feb.ofx'), str(tmp_path / 'jan.qfx')]
+    assert expand_paths([str(tmp_path / '**' / '*.qbo')]) == [str(tmp_path / 'nested' / 'may.qbo')]
+    assert expand_paths([str(tmp_path / '[j]an.qfx'), str(tmp_path / '?eb.ofx')]) == \
+           [str(tmp_path / 'jan.qfx'), str(tmp_path / 'feb.ofx')]
+
+def test_expand_plain_paths(tmp_path):
+    '''Plain paths are kept as given, even unsupported or missing ones, so they are reported'''
+    assert expand_paths(['missing.qif', 'notes.txt']) == ['missing.qif', 'notes.txt']
+
+def test_expand_removes_duplicates(tmp_path):
+    '''A file named more than once is parsed once, at its first position'''
+    jan = write(tmp_path / 'jan.qif')
+    feb = write(tmp_path / 'feb.qif')
+
+    assert expand_paths([jan, str(tmp_path), feb]) == [jan, feb]
+
+def test_ingest_skips_failed_file(tmp_path):
+    '''A file that fails to parse is left out and the other files are kept'''
+    jan = write(tmp_path / 'jan.qif', QIF.format(amount='45.67'))
+    feb = write(tmp_path / 'feb.qif', QIF.format(amount='30.00'))
+    bad = str(tmp_path / 'missing.qif')
+    txt = write(tmp_path / 'notes.txt')
+
+    for workers in (1, 2):
+        expenses, timings = ingest([jan, bad, txt, feb], workers=workers)
+        assert [expense.debit for expense in expenses] == [45.67, 30.00]
+        assert [(file_path, count) for file_path, count, _ in timings] == [(jan, 1), (feb, 1)]
+
+def test_ingest_shares_one_batch(tmp_path):
+    '''Every file goes into one batch whose table holds descriptions and categories, not dates'''
+    jan = write(tmp_path / 'jan.qif', QIF.format(amount='45.67'))
+    feb = write(tmp_path / 'feb.qif', QIF.format(amount='30.00').replace('01/05', '02/05'))
+
+    batch, _ = ingest([jan, feb], workers=1)
+    assert isinstance(batch, ExpenseBatch)
+    assert batch.description_codes[0] == batch.description_codes[1]
+    assert [expense.date for expense in batch] == ['01/05/2024', '02/05/2024']
+    assert not {'01/05/2024', '02/05/2024'} & set(batch.symbols.symbols)
+
+    calculator = Calculator(batch)
+    assert calculator.parsed_budget is batch
+    assert calculator.category_reduction() == {batch.categories[0] : 45.67 + 30.00}
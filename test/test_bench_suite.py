@@ -0,0 +1,31 @@
+import json
+
+from benchmarks.bench_suite import FORMATS, run, compare
+
+def test_every_format(tmp_path):
+    '''Every stage of every format is timed on the same expenses'''
+    results = [result for file_format in FORMATS for result in run(file_format, 60, str(tmp_path))]
+    stages  = {(result['format'], result['stage']) : result for result in results}
+
+    assert {stage for _, stage in stages} == {'CSVParser', 'CSVLoader', 'QIFParser', 'QFXParser', 'PDFParser',
+                                              'Calculator', 'sunburst_data', 'sunburst_figure'}
+    for file_format, (_, parser, _) in FORMATS.items():
+        assert stages[(file_format, parser.__name__)]['items'] == stages[(file_format, 'Calculator')]['items'] > 0
+    assert all(result['wall'] >= 0 and result['rows'] == 60 for result in results)
+    json.dumps(results)
+
+def test_statements_are_reused(tmp_path):
+    '''A statement already in the data directory is not generated again'''
+    run('csv', 20, str(tmp_path))
+    (statement,) = tmp_path.iterdir()
+    modified = statement.stat().st_mtime_ns
+    run('csv', 20, str(tmp_path))
+    assert statement.stat().st_mtime_ns == modified
+
+def test_compare():
+    '''Stages are matched by format, rows and stage name'''
+    baseline = {'results' : [{'format' : 'csv', 'rows' : 10, 'stage' : 'Calculator', 'wall' : 2.0}]}
+    results  = [{'format' : 'csv', 'rows' : 10, 'stage' : 'Calculator', 'wall' : 1.0},
+                {'format' : 'csv', 'rows' : 20, 'stage' : 'Calculator', 'wall' : 1.0}]
+    (line,) = compare(results, baseline)
+    assert line.endswith('0.50x')
@@ -0,0 +1,72 @@
+from itertools import count
+
+import pytest
+
+from BudgetBuddy import Cache
+from BudgetBuddy.Cache import CategoryCache, map_version
+from BudgetBuddy.Parser import FileCategoryParser, QIFParser
+
+@pytest.fixture
+def clock(monkeypatch):
+    '''A clock that moves one second on every reading, so usage times are ordered'''
+    ticks = count(1000)
+    monkeypatch.setattr(Cache.time, 'time', lambda: float(next(ticks)))
+
+def test_map_version():
+    '''Any change to the map gives a new version'''
+    assert map_version({'publix' : 'grocery'}) == map_version({'publix' : 'grocery'})
+    assert map_version({'publix' : 'grocery'}) != map_version({'publix' : 'supermarket'})
+
+def test_decisions_persist(tmp_path):
+    '''Committed decisions are found by the next cache on the same file'''
+    path  = str(tmp_path / 'cache.db')
+    cache = CategoryCache(path, 'v1')
+    cache.put('PUBLX SUPER', 'grocery')
+    assert cache.get('PUBLX SUPER') == 'grocery'
+    cache.close()
+
+    assert CategoryCache(path, 'v1').get('PUBLX SUPER') == 'grocery'
+
+def test_new_map_version_invalidates(tmp_path):
+    '''Opening the cache for another map version drops the old decisions'''
+    path  = str(tmp_path / 'cache.db')
+    cache = CategoryCache(path, 'v1')
+    cache.put('PUBLX SUPER', 'grocery')
+    cache.close()
+
+    cache = CategoryCache(path, 'v2')
+    assert cache.get('PUBLX SUPER') is None
+    assert cache.connection.execute('SELECT COUNT(*) FROM resolutions').fetchone()[0] == 0
+
+def test_least_recently_used_evicted(tmp_path, clock):
+    '''Past max_entries the entries used longest ago are removed, a get counts as a use'''
+    cache = CategoryCache(str(tmp_path / 'cache.db'), 'v1', max_entries=3)
+    for description in ('A', 'B', 'C'):
+        cache.put(description, 'grocery')
+        cache.commit()
+
+    assert cache.get('A') == 'grocery'
+    cache.put('D', 'fuel')
+    cache.commit()
+
+    descriptions = {row[0] for row in cache.connection.execute('SELECT description FROM resolutions')}
+    assert descriptions == {'A', 'C', 'D'}
+
+class CountingParser(QIFParser):
+    '''QIFParser that records the keys it fuzzy matches'''
+    def fuzzy_category(self, key):
+        self.matched.append(key)
+        return super().fuzzy_category(key)
+
+def test_cache_hit_skips_fuzzy_match(tmp_path):
+    '''A description resolved in an earlier run is not fuzzy matched again'''
+    path = str(tmp_path / 'cache.db')
+    for expected in (['PUBLX SUPER'], []):
+        cache  = FileCategoryParser.open_cache(path)
+        parser = CountingParser('', cache=cache, lazy=True)
+        parser.matched = []
+        category = parser.categorize_many(['PUBLX SUPER'])[0]
+        cache.close()
+        assert parser.matched == expected
+
+    assert category == QIFParser('', lazy=True).fuzzy_category('PUBLX SUPER')
@@ -0,0 +1,119 @@
+import random
+from BudgetBuddy.Calculator import Calculator, PolarsCalculator
+from BudgetBuddy.Defines import Expense, ExpenseBatch, SymbolTable
+
+EXPENSES = [Expense('PUBLIX', 'supermarket', 0.0, 12.50),
+            Expense('SHELL', 'fuel', 0.0, 30.00),
+            Expense('PUBLIX', 'supermarket', 0.0, 7.25),
+            Expense('WINN DIXIE', 'supermarket', 0.0, 3.10)]
+
+def test_category_reduction():
+    '''Debits are summed per category'''
+    assert Calculator(EXPENSES).category_reduction() == {'supermarket': 22.85, 'fuel': 30.00}
+
+def test_expense_reduction():
+    '''Debits are summed per description within a category'''
+    assert Calculator(EXPENSES).expense_reduction() == {'supermarket': {'PUBLIX': 19.75, 'WINN DIXIE': 3.10},
+                                                        'fuel': {'SHELL': 30.00}}
+
+def test_stream_matches_list():
+    '''A generator reduces to the same summaries as a list'''
+    calculator = Calculator(expense for expense in EXPENSES)
+    assert calculator.category_reduction() == Calculator(EXPENSES).category_reduction()
+    assert calculator.expense_reduction() == Calculator(EXPENSES).expense_reduction()
+    assert calculator.category_list == ['fuel', 'supermarket']
+
+def test_stream_expenses_per_category():
+    '''Streamed expenses are only listed when retained'''
+    assert Calculator(iter(EXPENSES)).expenses_per_category('fuel') is None
+    assert Calculator(iter(EXPENSES), retain=True).expenses_per_category('fuel') == [('SHELL', 30.00)]
+
+def test_polars_matches_calculator():
+    '''The Polars engine returns identical dicts, including float sums and key order'''
+    rng      = random.Random(0)
+    expenses = [Expense(rng.choice(['PUBLIX', 'SHELL', 'TARGET', 'CVS']), rng.choice(['supermarket', 'fuel']),
+                        0.0, round(rng.uniform(0, 500), 2)) for _ in range(1000)]
+    calculator = Calculator(expenses)
+    polars     = PolarsCalculator(expenses)
+
+    assert repr(polars.category_reduction()) == repr(calculator.category_reduction())
+    assert repr(polars.expense_reduction()) == repr(calculator.expense_reduction())
+    assert polars.category_list == calculator.category_list
+    assert polars.expenses_per_category('fuel') == calculator.expenses_per_category('fuel')
+
+def test_polars_from_frame():
+    '''A DataFrame is reduced without converting it back to expenses'''
+    frame = PolarsCalculator.to_frame(EXPENSES)
+    assert PolarsCalculator(frame).category_reduction() == Calculator(EXPENSES).category_reduction()
+
+def test_sunburst_data():
+    '''Root, categories and descriptions are emitted with their parents'''
+    labels, parents, values = Calculator(EXPENSES).sunburst_data()
+    assert labels  == ['Total Cost', 'supermarket', 'fuel', 'PUBLIX', 'WINN DIXIE', 'SHELL']
+    assert parents == ['', 'Total Cost', 'Total Cost', 'supermarket', 'supermarket', 'fuel']
+    assert values  == [22.85 + 30.00, 22.85, 30.00, 19.75, 3.10, 30.00]
+
+def test_batch_matches_list():
+    '''An ExpenseBatch reduces and lists expenses like the list it was built from'''
+    batch      = ExpenseBatch(EXPENSES)
+    calculator = Calculator(batch)
+    assert len(batch) == len(EXPENSES)
+    assert calculator.expense_reduction() == Calculator(EXPENSES).expense_reduction()
+    assert calculator.expenses_per_category('supermarket') == Calculator(EXPENSES).expenses_per_category('supermarket')
+    assert PolarsCalculator(batch).category_reduction() == Calculator(EXPENSES).category_reduction()
+
+def test_batch_interns_strings():
+    '''Equal descriptions share a single string'''
+    batch = ExpenseBatch([Expense(''.join(['PUB', 'LIX']), 'supermarket', 0.0, 1.0),
+                          Expense(''.join(['PUBL', 'IX']), 'supermarket', 0.0, 2.0)])
+    assert batch.descriptions[0] is batch.descriptions[1]
+    assert [expense.debit for expense in batch] == [1.0, 2.0]
+
+def test_batch_shared_symbols():
+    '''Batches sharing a symbol table encode equal strings to the same code'''
+    symbols = SymbolTable()
+    first   = ExpenseBatch(EXPENSES[:2], symbols)
+    second  = ExpenseBatch(EXPENSES[2:], symbols)
+    assert first.description_codes[0] == second.description_codes[0]
+    assert len(symbols) == 5    # 3 descriptions and 2 categories, dates are coded per batch
+    assert repr(Calculator(second).expense_reduction()) == repr(Calculator(EXPENSES[2:]).expense_reduction())
+
+def test_sunburst_tree_unpruned():
+    '''Without limits the tree has the sunburst_data arrays and a path id per node'''
+    ids, labels, parents, values = Calculator(EXPENSES).sunburst_tree()
+    assert (labels, values) == Calculator(EXPENSES).sunburst_data()[::2]
+    assert ids     == ['Total Cost', 'supermarket', 'fuel', 'supermarket/PUBLIX', 'supermarket/WINN DIXIE', 'fuel/SHELL']
+    assert parents == Calculator(EXPENSES).sunburst_data()[1]
+
+def test_sunburst_tree_top():
+    '''Each category keeps its largest leaves, the others add up to an Other leaf'''
+    expenses = [Expense(f'SHOP {amount}', 'shopping', 0.0, float(amount)) for amount in range(1, 11)]
+    expenses.extend(Expense(f'GAS {amount}', 'fuel', 0.0, float(amount)) for amount in range(1, 4))
+    ids, labels, parents, values = Calculator(expenses).sunburst_tree(top=3)
+
+    # Categories within the limit keep their order
+    assert labels[3:] == ['SHOP 10', 'SHOP 9', 'SHOP 8', 'Other', 'GAS 1', 'GAS 2', 'GAS 3']
+    assert ids[6]     == 'shopping/Other' and parents[6] == 'shopping'
+    assert values[6]  == sum(range(1, 8))
+    assert len(set(ids)) == len(ids)
+
+def test_sunburst_tree_min_share():
+    '''Leaves below the share of the total are folded, a category may fold entirely'''
+    expenses = EXPENSES + [Expense('GAS STATION', 'fuel', 0.0, 0.10), Expense('KIOSK', 'snacks', 0.0, 0.20)]
+    ids, labels, parents, values = Calculator(expenses).sunburst_tree(min_share=0.1)
+
+    assert labels[4:] == ['PUBLIX', 'Other', 'SHELL', 'Other', 'Other']
+    assert ids[4:]    == ['supermarket/PUBLIX', 'supermarket/Other', 'fuel/SHELL', 'fuel/Other', 'snacks/Other']
+    assert values[5]  == 3.10
+    assert sum(values[4:]) == sum(values[1:4])
+
+def test_sunburst_tree_other_description():
+    '''A description named Other goes into the folded leaf instead of repeating its id'''
+    expenses = [Expense('Other', 'misc', 0, 5), Expense('A', 'misc', 0, 9), Expense('B', 'misc', 0, 1), Expense('C', 'misc', 0, 1)]
+    ids, labels, parents, values = Calculator(expenses).sunburst_tree(top=2)
+
+    assert ids    == ['Total Cost', 'misc', 'misc/A', 'misc/Other']
+    assert values == [16, 16, 9, 7]
+
+    ids, _, _, values = Calculator(expenses).sunburst_tree(top=4)
+    assert ids == ['Total Cost', 'misc', 'misc/Other', 'misc/A', 'misc/B', 'misc/C']
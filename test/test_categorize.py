@@ -0,0 +1,88 @@
+from BudgetBuddy.Matcher import LinearMatcher, NGramMatcher
+from BudgetBuddy import Parser
+from BudgetBuddy.Parser import FileCategoryParser, QIFParser
+
+class CountingMatcher(NGramMatcher):
+    '''NGramMatcher that records the keys it is asked about'''
+    def __init__(self, names):
+        super().__init__(names)
+        self.keys = []
+
+    def best_match(self, key):
+        self.keys.append(key)
+        return super().best_match(key)
+
+def parser(**kwargs):
+    '''A QIF parser without a file, only categorization is used'''
+    matcher = CountingMatcher(FileCategoryParser.default_matcher().name_list)
+    return QIFParser('', matcher=matcher, lazy=True, **kwargs)
+
+def test_categorize_many_dedupes():
+    '''Each distinct description is matched once, exact keys never'''
+    qif = parser()
+    descriptions = ['PUBLX SUPER', 'publix', 'SHELL OIL', 'PUBLX SUPER'] * 50
+    categories   = qif.categorize_many(descriptions)
+
+    assert qif.matcher.keys == ['PUBLX SUPER', 'SHELL OIL']
+    assert categories == [qif.fuzzy_category('PUBLX SUPER'), qif.category_map['publix'],
+                          qif.fuzzy_category('SHELL OIL'), qif.fuzzy_category('PUBLX SUPER')] * 50
+
+def test_categorize_many_memo():
+    '''Descriptions resolved in an earlier chunk are not matched again'''
+    qif = parser()
+    first = qif.categorize_many(['SHELL OIL'])
+    assert qif.categorize_many(['SHELL OIL', 'SHELL OIL']) == first * 2
+    assert qif.matcher.keys == ['SHELL OIL']
+
+def test_categorize_many_parallel(monkeypatch):
+    '''The process pool gives the same categories in the same order'''
+    monkeypatch.setattr(FileCategoryParser, 'PARALLEL_MATCHES', 2)
+    descriptions = ['PUBLX SUPER', 'SHELL OIL', 'BURGER KNG', 'dfgaoduih', 'HOMEDEPOT', 'PUBLX SUPER']
+    pooled = parser(match_workers=2)
+    assert pooled.categorize_many(descriptions) == parser().categorize_many(descriptions)
+    pooled.close_match_pool()
+
+def test_iter_expenses_fills_categories(tmp_path, monkeypatch):
+    '''Records are categorized a chunk at a time, file categories are kept'''
+    monkeypatch.setattr(FileCategoryParser, 'CATEGORIZE_CHUNK', 2)
+    file_path = tmp_path / 'export.qif'
+    file_path.write_text('PSHELL OIL\nT-1\n^\nPPUBLIX\nT-2\nLFood\n^\nPSHELL OIL\nT-3\n^\n', encoding='utf-8')
+
+    qif = QIFParser(str(file_path), matcher=parser().matcher, lazy=True)
+    assert [(expense.description, expense.category) for expense in qif.iter_expenses()] == \
+           [('SHELL OIL', qif.fuzzy_category('SHELL OIL')), ('PUBLIX', 'Food'), ('SHELL OIL', qif.fuzzy_category('SHELL OIL'))]
+    assert qif.matcher.keys.count('SHELL OIL') == 3
+
+def test_match_pool_shared_by_chunks(tmp_path, monkeypatch):
+    '''One match pool serves every chunk of a file and is shut down when the file is done'''
+    pools = []
+    class CountingPool(Parser.ProcessPoolExecutor):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            pools.append(self)
+
+    monkeypatch.setattr(Parser, 'ProcessPoolExecutor', CountingPool)
+    monkeypatch.setattr(FileCategoryParser, 'CATEGORIZE_CHUNK', 3)
+    monkeypatch.setattr(FileCategoryParser, 'PARALLEL_MATCHES', 2)
+    file_path = tmp_path / 'export.qif'
+    file_path.write_text(''.join(f'P{name}\nT-1\n^\n' for name in ['PUBLX SUPER', 'SHELL OIL', 'BURGER KNG',
+                                                                     'HOMEDEPOT', 'dfgaoduih', 'WINN DIXY']),
+                         encoding='utf-8')
+
+    qif = QIFParser(str(file_path), lazy=True, match_workers=2)
+    categories = [expense.category for expense in qif.iter_expenses()]
+    assert categories == parser().categorize_many(['PUBLX SUPER', 'SHELL OIL', 'BURGER KNG',
+                                                   'HOMEDEPOT', 'dfgaoduih', 'WINN DIXY'])
+    assert len(pools) == 1
+    assert qif.match_pool is None
+
+class LinearQIFParser(QIFParser):
+    '''QIFParser matching with the linear scan'''
+    matcher_class = LinearMatcher
+
+def test_default_matcher_per_class():
+    '''Parsers with another matcher class get a matcher of that class, each built once'''
+    linear = LinearQIFParser('', lazy=True).matcher
+    ngram  = QIFParser('', lazy=True).matcher
+    assert type(linear) is LinearMatcher and type(ngram) is NGramMatcher
+    assert LinearQIFParser('', lazy=True).matcher is linear and QIFParser('', lazy=True).matcher is ngram
@@ -0,0 +1,66 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+from BudgetBuddy import CategoryMap
+from BudgetBuddy.Parser import PDFParser, QIFParser
+
+@pytest.fixture
+def override(tmp_path):
+    '''Write a map file and use it as the override, the built-in map is restored afterwards'''
+    def use(data):
+        path = tmp_path / 'map.json'
+        path.write_text(json.dumps(data))
+        CategoryMap.set_override(str(path))
+        return CategoryMap.load_maps()
+    yield use
+    CategoryMap.set_override(None)
+
+def test_import_is_lazy():
+    '''Importing the parsers does not read the map file'''
+    statement = ('from BudgetBuddy import CategoryMap, Parser; assert CategoryMap._maps is None; '
+                 'Parser.CSVParser("statement.csv", lazy=True); assert CategoryMap._maps is None; '
+                 'assert CategoryMap.CATEGORY_MAP and CategoryMap._maps is not None')
+    subprocess.run([sys.executable, '-c', statement], check=True)
+
+def test_builtin_map():
+    '''The shipped file has the current format'''
+    maps = CategoryMap.load_maps()
+    assert CategoryMap.read_map(CategoryMap.DATA_PATH)['version'] == CategoryMap.MAP_FORMAT
+    assert CategoryMap.CATEGORY_MAP is maps['categories']
+    assert CategoryMap.CITY_LIST_FL == maps['cities']['FL']
+
+def test_override(override):
+    '''Override categories replace and extend the built-in ones, cities are added once'''
+    key, category = next(iter(CategoryMap.load_maps()['categories'].items()))
+    size          = len(CategoryMap.CATEGORY_MAP)
+    city          = CategoryMap.CITY_LIST_FL[0]
+    maps = override({'version' : 1,
+                     'categories' : {key.upper() : 'Replaced', 'My Corner Store' : 'Groceries'},
+                     'cities' : {'FL' : [city, 'Springfield'], 'GA' : ['Macon']}})
+
+    assert maps['categories'][key] == 'Replaced' != category
+    assert maps['categories']['my corner store'] == 'Groceries'
+    assert len(maps['categories']) == size + 1
+    assert maps['cities']['FL'].count(city) == 1 and 'Springfield' in maps['cities']['FL']
+    assert maps['cities']['GA'] == ['Macon']
+
+def test_override_bare_object(override):
+    '''A plain description to category object is accepted'''
+    assert override({'Corner Store' : 'Groceries'})['categories']['corner store'] == 'Groceries'
+
+def test_override_newer_version(override):
+    '''A map written for a newer format is refused'''
+    with pytest.raises(ValueError):
+        override({'version' : CategoryMap.MAP_FORMAT + 1, 'categories' : {}})
+
+def test_override_after_parsers_built(override):
+    '''Parsers built after set_override match its descriptions and strip its cities'''
+    assert QIFParser('', lazy=True).fuzzy_category('QWERTY CORNER STOR') == 'Unknown'
+    assert PDFParser('', lazy=True).remove_city_state_from_description('SHOP QWERTYVILLEFL') == 'SHOP QWERTYVILLEFL'
+
+    override({'categories' : {'Qwerty Corner Store' : 'Groceries'}, 'cities' : {'FL' : ['Qwertyville']}})
+    assert QIFParser('', lazy=True).fuzzy_category('QWERTY CORNER STOR') == 'Groceries'
+    assert PDFParser('', lazy=True).remove_city_state_from_description('SHOP QWERTYVILLEFL').strip() == 'SHOP'
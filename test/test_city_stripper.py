@@ -0,0 +1,28 @@
+import re
+from BudgetBuddy.CityStripper import CityStripper
+
+CITIES = ['Orlando', 'Palm Bay', 'Palm', 'Bay', 'Winter Park', 'Winter', 'Miami', 'Miami Beach']
+
+# The per transaction regex the stripper replaces
+pattern  = re.compile(r'((' + '|'.join(CITIES) + r')' + r'FL)', re.IGNORECASE)
+stripper = CityStripper({'FL': CITIES})
+
+DESCRIPTIONS = ['PUBLIX ORLANDOFL', 'SHELL OIL PALM BAYFL', 'TARGET WINTER PARKFL', 'WINTERFL WINTER PARKFL',
+                'MIAMI BEACHFL BURGER KING', 'publix orlandofl', 'FLORIDA FLOWERS', 'MIAMIFLMIAMIFL',
+                'BAYFLPALM BAYFL', 'NO CITY HERE', '', 'FL']
+
+def test_strip_matches_regex():
+    '''Stripper removes the same locations as the regex alternation'''
+    for description in DESCRIPTIONS:
+        assert stripper.strip(description) == pattern.sub('', description)
+
+def test_strip_normalized_city():
+    '''City names are normalized before they are added'''
+    normalized = CityStripper({'FL': ['Opa-locka']}, lambda city: city.replace('-', ''))
+    assert normalized.strip('WALGREENS OPALOCKAFL') == 'WALGREENS '
+
+def test_strip_other_state():
+    '''Other states can be added without rebuilding'''
+    multi = CityStripper({'FL': CITIES})
+    multi.add_state('GA', ['Atlanta'])
+    assert multi.strip('WAFFLE HOUSE ATLANTAGA ORLANDOFL') == 'WAFFLE HOUSE  '
@@ -0,0 +1,65 @@
+import polars as pl
+from BudgetBuddy.CSVLoader import CSVLoader, load_csv
+from BudgetBuddy.Calculator import Calculator, PolarsCalculator
+from BudgetBuddy.Parser import CSVParser
+
+CAPITAL_ONE = '''Transaction Date,Posted Date,Card No.,Description,Category,Debit,Credit
+2024-01-05,2024-01-06,1234,PUBLIX #1234,Groceries,45.67,
+2024-01-06,2024-01-07,1234,"AMAZON.COM*AB12  SEATTLE",Merchandise,12.00,
+2024-01-07,2024-01-07,1234,CAPITAL ONE MOBILE PYMT,Payment/Credit,,500.00
+'''
+
+CHASE = '''Transaction Date,Post Date,Description,Category,Type,Amount,Memo
+01/05/2024,01/06/2024,STARBUCKS STORE 88,Food & Drink,Sale,-5.25,
+01/06/2024,01/06/2024,Payment Thank You,,Payment,300.00,
+'''
+
+AMEX = '''Date,Description,Amount
+01/05/2024,UBER *TRIP,"1,023.10"
+01/06/2024,ONLINE PAYMENT,-100.00
+'''
+
+def write(tmp_path, name, text):
+    '''Write a CSV export and return its path'''
+    file_path = tmp_path / name
+    file_path.write_text(text, encoding='utf-8')
+    return str(file_path)
+
+def test_detect_preset():
+    '''Presets are picked from the header names'''
+    assert CSVLoader.detect_preset(CAPITAL_ONE.splitlines()[0].split(',')) == 'capital_one'
+    assert CSVLoader.detect_preset(CHASE.splitlines()[0].split(',')) == 'chase'
+    assert CSVLoader.detect_preset(['Date', 'Description', 'Amount']) == 'amex'
+    assert CSVLoader.detect_preset(['Date', 'Payee']) is None
+
+def test_loader_matches_csv_parser(tmp_path):
+    '''Same rows and reductions as CSVParser and Calculator'''
+    file_path = write(tmp_path, 'capital_one.csv', CAPITAL_ONE)
+    frame     = CSVLoader(file_path).load()
+    expenses  = CSVParser(file_path).get_expense_list()
+
+    assert frame.rows() == [(expense.description, expense.category, expense.credit, expense.debit)
+                            for expense in expenses]
+    assert PolarsCalculator(frame).expense_reduction() == Calculator(expenses).expense_reduction()
+
+def test_signed_amounts(tmp_path):
+    '''Single amount columns are split into debits and credits by the preset's sign'''
+    chase = CSVLoader(write(tmp_path, 'chase.csv', CHASE)).load()
+    assert chase.rows() == [('STARBUCKS STORE', 'Food & Drink', 0.0, 5.25), ('Payment Thank You', '', 300.0, 0.0)]
+
+    amex = CSVLoader(write(tmp_path, 'amex.csv', AMEX), 'amex').load()
+    assert amex.rows() == [('UBER TRIP', 'Unknown', 0.0, 1023.1), ('ONLINE PAYMENT', 'Unknown', 100.0, 0.0)]
+
+def test_load_csv_skips_unknown(tmp_path):
+    '''Files without a preset are left out of the combined frame'''
+    frame = load_csv([write(tmp_path, 'chase.csv', CHASE), write(tmp_path, 'other.csv', 'Date,Payee\n1,2\n')])
+    assert frame.height == 2
+    assert frame.schema == pl.Schema(PolarsCalculator.SCHEMA)
+
+def test_wrong_preset(tmp_path):
+    '''A preset whose columns are not in the header is logged and the file left out'''
+    capital_one = write(tmp_path, 'capital_one.csv', CAPITAL_ONE)
+    assert CSVLoader(capital_one, 'chase').load() is None
+
+    frame = load_csv([capital_one, write(tmp_path, 'chase.csv', CHASE)], 'chase')
+    assert frame.height == 2
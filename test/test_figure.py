@@ -0,0 +1,69 @@
+import base64
+import json
+
+import numpy as np
+import plotly.express as px
+import plotly.io as pio
+import polars as pl
+from plotly import graph_objects as go
+
+from BudgetBuddy import Figure
+from BudgetBuddy.Calculator import Calculator
+from BudgetBuddy.Defines import Expense
+from BudgetBuddy.Interface import Interface
+from benchmarks.synthetic import Transactions
+
+def plain(value):
+    '''The JSON of a figure with typed arrays ({dtype, bdata}) decoded to lists'''
+    if isinstance(value, dict):
+        if set(value) == {'dtype', 'bdata'}:
+            return np.frombuffer(base64.b64decode(value['bdata']), dtype=value['dtype']).tolist()
+        return {key : plain(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [plain(item) for item in value]
+    return value
+
+def rendered(fig, validate : bool = True) -> dict:
+    return plain(json.loads(pio.to_json(fig, validate=validate)))
+
+def interface() -> Interface:
+    transactions = Transactions(seed=3)
+    expenses     = [Expense(merchant, merchant[:2], 0.0, amount, f'{month}/{day}')
+                    for month, day, merchant, _, amount in (next(transactions) for _ in range(500))]
+    return Interface(Calculator(expenses))
+
+def test_sunburst_matches_graph_objects():
+    '''The dict serializes to the same JSON as the validated go.Figure'''
+    labels, parents, values = interface().calculator.sunburst_data()
+    fig = go.Figure(go.Sunburst(labels=labels, parents=parents, values=values))
+    fig.update_layout(margin = dict(t=0, l=0, r=0, b=0))
+
+    assert rendered(interface().sunburst_figure(), validate=False) == rendered(fig)
+
+def test_pie_matches_plotly_express():
+    '''The dict serializes to the same JSON as px.pie'''
+    summary = interface().calculator.category_reduction()
+    frame   = pl.DataFrame({'Category' : list(summary.keys()), 'Cost' : list(summary.values())})
+    fig     = px.pie(frame, values='Cost', names='Category', title=f'Statement Overview: {sum(summary.values())}')
+
+    assert rendered(interface().pie_figure(), validate=False) == rendered(fig)
+
+def test_template_follows_default(monkeypatch):
+    '''Figures use whichever template is the default, or none'''
+    monkeypatch.setattr(pio.templates, 'default', 'plotly_dark')
+    assert Figure.sunburst(['a'], [''], [1.0])['layout']['template'] == pio.templates['plotly_dark'].to_plotly_json()
+
+    monkeypatch.setattr(pio.templates, 'default', None)
+    assert 'template' not in Figure.sunburst(['a'], [''], [1.0])['layout']
+
+def test_pruned_sunburst():
+    '''With a top, every category has at most top leaves and an Other, and the figure is valid'''
+    calculator = interface().calculator
+    fig        = Interface(calculator, top=2).sunburst_figure()
+    trace      = fig['data'][0]
+    categories = len(calculator.category_reduction())
+
+    assert len(trace['labels']) - 1 - categories <= 3 * categories
+    assert len(set(trace['ids'])) == len(trace['ids'])
+    assert set(trace['parents'][1:]) <= set(trace['ids'])
+    go.Figure(fig)
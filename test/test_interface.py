@@ -0,0 +1,43 @@
+import json
+
+import pytest
+import plotly.io as pio
+
+from BudgetBuddy.Calculator import Calculator
+from BudgetBuddy.Defines import Expense
+from BudgetBuddy.Interface import Interface
+
+@pytest.fixture
+def interface(monkeypatch):
+    '''An Interface over a few expenses that fails if it tries to open a browser'''
+    def show(*args, **kwargs):
+        raise AssertionError('a headless report opened a browser')
+    monkeypatch.setattr(pio, 'show', show)
+
+    expenses = [Expense('PUBLIX', 'grocery', 0.0, 10.10, '01/02'), Expense('PUBLIX', 'grocery', 0.0, 5.05, '01/03'),
+                Expense('SHELL', 'gas', 0.0, 30.00, '01/04'), Expense('PAYMENT', 'Payment', 100.0, 0.0, '01/05')]
+    return Interface(Calculator(expenses))
+
+def test_write_html_shares_plotlyjs(interface, tmp_path):
+    '''Reports in one directory load a single plotly.min.js written next to them'''
+    for name in ('a.html', 'b.html'):
+        assert interface.write_html(str(tmp_path / 'reports' / name)) is not None
+        assert 'src="plotly.min.js"' in (tmp_path / 'reports' / name).read_text()
+
+    assert sorted(path.name for path in (tmp_path / 'reports').iterdir()) == ['a.html', 'b.html', 'plotly.min.js']
+
+def test_write_html_pie(interface, tmp_path):
+    '''The pie chart can be written too, unknown charts are refused'''
+    assert interface.write_html(str(tmp_path / 'pie.html'), 'cdn', chart='pie') is not None
+    assert 'plotly.min.js' not in [path.name for path in tmp_path.iterdir()]
+    assert interface.write_html(str(tmp_path / 'bar.html'), chart='bar') is None
+
+def test_write_json(interface, tmp_path):
+    '''The totals of the reduction, rounded to the cent'''
+    interface.write_json(str(tmp_path / 'report.json'))
+    report = json.loads((tmp_path / 'report.json').read_text())
+
+    assert report == {'version' : 1, 'total' : 45.15,
+                      'categories' : {'grocery' : 15.15, 'gas' : 30.0, 'Payment' : 0.0},
+                      'expenses' : {'grocery' : {'PUBLIX' : 15.15}, 'gas' : {'SHELL' : 30.0},
+                                    'Payment' : {'PAYMENT' : 0.0}}}
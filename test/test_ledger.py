@@ -0,0 +1,79 @@
+from BudgetBuddy.Ledger import Ledger
+from BudgetBuddy.Defines import Expense
+from benchmarks.synthetic import write_pdf
+
+JANUARY  = [Expense('PUBLIX', 'supermarket', 0.0, 12.50, '01/02'),
+            Expense('SHELL', 'fuel', 0.0, 30.00, '01/15')]
+FEBRUARY = [Expense('SHELL', 'fuel', 0.0, 30.00, '01/15'),
+            Expense('SHELL', 'fuel', 0.0, 30.00, '01/15'),
+            Expense('PUBLIX', 'supermarket', 0.0, 8.00, '02/01')]
+
+def test_ledger_skips_imported_files(tmp_path):
+    '''A statement with the same contents is not pending twice'''
+    statement = tmp_path / 'january.qif'
+    statement.write_text('!Type:Bank\n')
+    ledger  = Ledger(str(tmp_path / 'ledger.db'))
+    pending = ledger.pending([str(statement)])
+    ledger.record(str(statement), pending[str(statement)], JANUARY)
+
+    copy = tmp_path / 'copy.qif'
+    copy.write_text('!Type:Bank\n')
+    assert ledger.pending([str(statement), str(copy)]) == {}
+
+def test_ledger_appends_new_transactions(tmp_path):
+    '''Overlapping statements only add the transactions the ledger has not seen'''
+    ledger = Ledger(str(tmp_path / 'ledger.db'))
+    assert ledger.record('jan2024.qif', 'a', JANUARY) == 2
+    assert ledger.record('feb2024.qif', 'b', FEBRUARY) == 2
+    assert [(expense.description, expense.debit) for expense in ledger.iter_expenses()] == \
+        [('PUBLIX', 12.50), ('SHELL', 30.00), ('SHELL', 30.00), ('PUBLIX', 8.00)]
+
+def test_ledger_keeps_yearly_charges(tmp_path):
+    '''A charge on the same day of another year is kept when the dates have no year'''
+    netflix = [Expense('NETFLIX COM', 'streaming', 0.0, 15.99, 'Jan 3')]
+    ledger  = Ledger(str(tmp_path / 'ledger.db'))
+    assert ledger.record(str(tmp_path / 'jan2024.pdf'), 'a', netflix) == 1
+    assert ledger.record(str(tmp_path / 'jan2025.pdf'), 'b', netflix) == 1
+    assert ledger.record('statement.pdf', 'c', netflix, year=2025) == 0
+    assert ledger.record('statement.pdf', 'd', netflix, year=2026) == 1
+    assert sum(expense.debit for expense in ledger.iter_expenses()) == 15.99 * 3
+
+def test_ledger_full_dates_ignore_statement_year(tmp_path):
+    '''Dates with a year are deduplicated across statements of any year'''
+    ledger = Ledger(str(tmp_path / 'ledger.db'))
+    for date in ('2024-12-30', '12/30/24', '20241230120000'):
+        expense = [Expense('SHELL', 'fuel', 0.0, 30.00, date)]
+        assert ledger.record('dec2024.qif', date, expense) == 1
+        assert ledger.record('jan2025.qif', date + 'b', expense) == 0
+    assert Ledger.dated('2024-12-30', None) == '2024-12-30'
+
+def test_ledger_statement_end_from_name(tmp_path):
+    '''A year in the file name is only used next to its month'''
+    assert Ledger.statement_end('statements/jan2024.pdf') == (2024, 1)
+    assert Ledger.statement_end('Statement_2023-12-04.pdf') == (2023, 12)
+    assert Ledger.statement_end('visa_11-2024.qif') == (2024, 11)
+    assert Ledger.statement_end('visa_2034.pdf') is None
+    assert Ledger.statement_end(str(tmp_path / 'statement.qif')) is None
+    assert Ledger.dated('Dec 30', (2024, 1)) == 'Dec 30 2023'
+    assert Ledger.dated('01/03', (2024, 1)) == '01/03 2024'
+
+def test_ledger_year_from_statement_period(tmp_path):
+    '''The period on a PDF's summary page dates the charges of same named statements of different years'''
+    netflix = [Expense('NETFLIX COM', 'streaming', 0.0, 15.99, 'Jan 3'),
+               Expense('NETFLIX COM', 'streaming', 0.0, 15.99, 'Dec 3')]
+    ledger  = Ledger(str(tmp_path / 'ledger.db'))
+    for name, year, added in (('a', 2023, 2), ('b', 2024, 2), ('c', 2024, 0)):
+        file_path = tmp_path / name / 'statement.pdf'
+        file_path.parent.mkdir()
+        write_pdf(str(file_path), [[f'Opening/Closing Date 12/05/{year - 2001} - 01/04/{year - 2000}']])
+        assert Ledger.statement_end(str(file_path)) == (year, 1)
+        assert ledger.record(str(file_path), name, netflix) == added
+    assert [expense.date for expense in ledger.iter_expenses()] == ['Jan 3', 'Dec 3'] * 2
+
+def test_ledger_unknown_year_dedupes_within_file(tmp_path):
+    '''Without a known year, charges are only deduplicated within their own statement'''
+    netflix = [Expense('NETFLIX COM', 'streaming', 0.0, 15.99, 'Jan 3')] * 2
+    ledger  = Ledger(str(tmp_path / 'ledger.db'))
+    assert ledger.record(str(tmp_path / 'a' / 'statement.pdf'), 'a', netflix) == 2
+    assert ledger.record(str(tmp_path / 'b' / 'statement.pdf'), 'b', netflix) == 2
+    assert ledger.record(str(tmp_path / 'a' / 'statement.pdf'), 'a', netflix) == 0
@@ -0,0 +1,46 @@
+import pytest
+from BudgetBuddy.CategoryMap import CATEGORY_MAP
+from BudgetBuddy.Matcher import LinearMatcher, NGramMatcher, MATCH_THRESHOLD
+from BudgetBuddy.Parser import QIFParser
+from benchmarks.bench_matcher import make_queries
+
+# Build the matchers once, the index is shared by every test
+linear = LinearMatcher(CATEGORY_MAP.keys())
+ngram  = NGramMatcher(CATEGORY_MAP.keys())
+
+QUERIES = ['PUBLIX', 'PUBLX SUPER', 'WINN DIXIE', 'WINNDIXIE', 'SHELL OIL', 'MCDONALD',
+           'BURGER KNG', 'THE HOME DEPOT', 'HOMEDEPOT', 'PAPPA JOHNS', 'CVS PHARMACY',
+           'AMAZON MKTPLACE', 'SPOTIFY USA', 'dfgaoduih', 'X', '']
+
+def accepted(result):
+    '''Reduce a result to what key_category_map acts on'''
+    value, score = result
+    return (value, score) if score >= MATCH_THRESHOLD else ('', 0.0)
+
+@pytest.mark.parametrize('query', QUERIES)
+def test_ngram_matches_linear(query):
+    '''Indexed matcher returns the same name and score as the full scan'''
+    assert accepted(ngram.best_match(query)) == accepted(linear.best_match(query))
+
+def test_ngram_exact_key():
+    '''A key from the map matches itself with a perfect score'''
+    assert ngram.best_match('PUBLIX') == ('publix', 100.0)
+
+def test_ngram_no_candidates():
+    '''Nothing similar returns an empty match'''
+    assert ngram.best_match('qqqqqqqqqqqqqqqq') == ('', 0.0)
+
+def test_bounded_scoring_keeps_categories():
+    '''Pruned scoring picks the same category as the full scan on noisy descriptions'''
+    linear_parser = QIFParser('', matcher=linear, lazy=True)
+    ngram_parser  = QIFParser('', matcher=NGramMatcher(CATEGORY_MAP.keys()), lazy=True)
+    for query in make_queries(60, seed=7):
+        expected = linear.best_match(query)
+        assert accepted(ngram_parser.matcher.best_match(query)) == accepted(expected)
+        assert ngram_parser.fuzzy_category(query) == linear_parser.match_category(query, *expected)
+
+def test_bounded_scoring_ties_keep_first_name():
+    '''Equal scores keep the name that comes first, as the full scan does'''
+    names = ['abcx', 'abcy', 'abcz']
+    assert NGramMatcher(names).best_match('ABC') == LinearMatcher(names).best_match('ABC')
+    assert NGramMatcher(names[::-1]).best_match('ABC') == ('abcz', LinearMatcher(names).best_match('ABC')[1])
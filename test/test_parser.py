@@ -1,8 +1,6 @@
+import re
 import pytest
-from BudgetBuddy.Parser import Parser
-
-# Create a single instance of the parser
-parser = Parser()
+from BudgetBuddy.Parser import FileParser as Parser
 
 # Tests for str_to_float
 def test_str_to_float_correct():
@@ -58,4 +56,13 @@ def test_clean_description_bad_string():
 
 def test_clean_description_bad_spaces():
     '''Spaced out string data, verify cleaned string'''
-    assert Parser.clean_description('\t   dfgaoduih436   \t') == 'dfgaoduih'
\ No newline at end of file
+    assert Parser.clean_description('\t   dfgaoduih436   \t') == 'dfgaoduih'
+
+def test_clean_description_matches_regex():
+    '''Translate pass gives the same output as the original regular expressions'''
+    def regex_clean(in_str):
+        cleaned_str = re.sub(r'[0-9!"#$%&\'()*+,-./:;<=>?@[\]^_`{|}~]', '', in_str)
+        return re.sub(r'\s+', ' ', cleaned_str).strip()
+
+    for in_str in ['PUBLIX #1234', 'back\\slash', 'TAB\tAND\u00a0NBSP', '\u3000WIDE\u2028LINE', 'ÉCLAIR 12']:
+        assert Parser.clean_description(in_str) == regex_clean(in_str)
@@ -0,0 +1,129 @@
+import re
+import PyPDF2
+from BudgetBuddy.Parser import PDFParser
+from benchmarks.synthetic import write_pdf
+
+# Parser without a file, only the page tokenizer is used
+parser = PDFParser('', lazy=True)
+
+PAGE = '\n'.join(['Jan 3 Jan 5 PUBLIX #1234 ORLANDOFL $45.67',
+                  'Feb 11 Feb 12 SHELL OIL 5732 PALM BAYFL $30.00',
+                  'Mar 1\nMar 2 WINN-DIXIE #12 $-7.10',
+                  'Trans Date Post Date Description Amount',
+                  'Apr 9 Apr 10 STARBUCKS STORE 88 - $5.25',
+                  'Total fees charged $0.00'])
+
+def legacy_parse_page(text):
+    '''The per page regexes the tokenizer replaces'''
+    date_pattern = r'(((Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s([0-9]{1,2})\s){2}(.*)[0-9]*\.[0-9]{2})'
+    for match in re.findall(date_pattern, text):
+        cleaned_str  = re.sub(r'((Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s([0-9]{1,2})\s){2}', ' ', match[0])
+        split_string = cleaned_str.split('$')
+        description  = parser.remove_city_state_from_description(parser.clean_description(split_string[0]))
+        yield ' '.join(match[0].split()[:2]), description, abs(parser.str_to_float(split_string[1]))
+
+def test_parse_page_matches_legacy():
+    '''Single scan tokenizer gives the same transactions as the previous regexes'''
+    tokens = [(' '.join(date.split()), description, cost) for date, description, cost in parser.parse_page(PAGE)]
+    assert tokens == list(legacy_parse_page(PAGE))
+    assert tokens[0] == ('Jan 3', 'PUBLIX ', 45.67)
+
+def test_parse_page_thousands():
+    '''Amounts with thousands separators are parsed'''
+    assert list(parser.parse_page('May 1 May 2 BEST BUY $1,299.99')) == [('May 1', 'BEST BUY', 1299.99)]
+
+def test_parse_page_ranges():
+    '''Page specs are 1-based and inclusive, open ends run to the first or last page'''
+    assert PDFParser.parse_page_ranges('4-6,9', 10) == [3, 4, 5, 8]
+    assert PDFParser.parse_page_ranges('-2, 8-', 10) == [0, 1, 7, 8, 9]
+    assert PDFParser.parse_page_ranges('9-30,2,2', 10) == [1, 8, 9]
+
+def test_page_numbers_default_skips_summary():
+    '''Without a page selection the summary pages are left out'''
+    assert PDFParser('', lazy=True).page_numbers(5) == [3, 4]
+    assert PDFParser('', lazy=True, pages=[7, 0, 2, 0]).page_numbers(5) == [0, 2]
+
+def test_page_selection(tmp_path):
+    '''Pages without dates are never extracted and parsing stops after the transaction section'''
+    file_path = str(tmp_path / 'statement.pdf')
+    write_pdf(file_path, [['Account summary'], ['Jan 3 Jan 5 PUBLIX #1234 ORLANDOFL $45.67'], ['Payments'],
+                          ['Jan 3 Jan 5 PUBLIX #1234 ORLANDOFL $45.67'], [], ['Feb 1 Feb 2 SHELL OIL $30.00'],
+                          ['Interest charge calculation'], ['Terms'], ['Mar 1 Mar 2 SHELL OIL $9.00']])
+
+    reader = PyPDF2.PdfReader(file_path)
+    assert [PDFParser.may_have_transactions(page) for page in reader.pages] == \
+           [False, True, False, True, False, True, False, False, True]
+
+    selected = PDFParser(file_path, lazy=True)
+    assert [page_num for page_num, _ in selected.iter_page_text()] == [3, 5, 8]
+    assert [expense.debit for expense in selected.iter_expenses()] == [45.67, 30.00]
+
+    everything = PDFParser(file_path, lazy=True, pages='1-', detect_pages=False, stop_after=0)
+    assert [expense.debit for expense in everything.iter_expenses()] == [45.67, 45.67, 30.00, 9.00]
+
+STATEMENT = [['Account summary'], ['Payments'], ['Fees'], ['Jan 3 Jan 5 PUBLIX #1234 ORLANDOFL $45.67'],
+             ['Interest charge calculation'], ['Terms'], ['Notices'], ['Feb 1 Feb 2 SHELL OIL $30.00']]
+
+def test_indirect_and_inherited_resources(tmp_path):
+    '''Resources held in another object or only on the /Pages node are resolved'''
+    for resources in ('indirect', 'inherited'):
+        file_path = str(tmp_path / f'{resources}.pdf')
+        write_pdf(file_path, STATEMENT, resources=resources)
+
+        reader = PyPDF2.PdfReader(file_path)
+        assert [PDFParser.may_have_transactions(page) for page in reader.pages] == \
+               [False, False, False, True, False, False, False, True]
+        assert [expense.debit for expense in PDFParser(file_path, lazy=True, stop_after=0).iter_expenses()] == \
+               [45.67, 30.00]
+
+def test_form_xobject_pages(tmp_path):
+    '''Text drawn through a form XObject is extracted like text in the page'''
+    file_path = str(tmp_path / 'forms.pdf')
+    write_pdf(file_path, STATEMENT[:4], form_pages={3})
+
+    assert PDFParser.may_have_transactions(PyPDF2.PdfReader(file_path).pages[3])
+    assert [expense.debit for expense in PDFParser(file_path, lazy=True).iter_expenses()] == [45.67]
+
+def test_text_operator_before_delimiter():
+    '''Tj and TJ directly followed by a delimiter still count as text'''
+    assert PDFParser.TEXT_OPERATOR.search(b'(Jan 3 Jan 5 SHOP $1.00)Tj/F1 9 Tf')
+    assert PDFParser.TEXT_OPERATOR.search(b'[(Jan 3)]TJ[(x)]TJ')
+    assert not PDFParser.TEXT_OPERATOR.search(b'/Tjx 1 Tf')
+
+def test_selection_gap_is_not_empty(tmp_path):
+    '''Pages left out of an explicit selection do not end the transaction section'''
+    file_path = str(tmp_path / 'statement.pdf')
+    write_pdf(file_path, STATEMENT)
+
+    for workers in (1, 2):
+        parser = PDFParser(file_path, lazy=True, pages='4,8', workers=workers)
+        assert [expense.debit for expense in parser.iter_expenses()] == [45.67, 30.00]
+
+def test_workers_match_serial(tmp_path):
+    '''A pooled parse returns the same pages and expenses, in order, as a serial one'''
+    file_path = str(tmp_path / 'statement.pdf')
+    lines     = [f'Jan {day} Jan {day} SHOP {day} ORLANDOFL ${day}.00' for day in range(1, 29)]
+    write_pdf(file_path, STATEMENT[:3] + [lines[start:start + 2] for start in range(0, len(lines), 2)] +
+              [['Terms'], ['Notices'], ['Mar 1 Mar 2 LATE FEE $9.00']])
+
+    def parse(workers):
+        parser = PDFParser(file_path, lazy=True, workers=workers)
+        pages  = [(page_num, text) for page_num, text in parser.iter_page_text()]
+        return pages, [(expense.description, expense.debit, expense.date) for expense in parser.iter_expenses()]
+
+    serial = parse(1)
+    assert [page_num for page_num, _ in serial[0]] == list(range(3, 17)) + [19]
+    assert len(serial[1]) == 28
+    assert parse(3) == serial
+
+def test_kerned_and_escaped_dates(tmp_path):
+    '''Dates whose spaces are TJ offsets or octal escapes are not taken for pages without dates'''
+    for name, operator in (('kerned', '[(Jan)-300(3)-300(Jan)-300(5)-300(SHOP)-300($9.00)]TJ'),
+                           ('escaped', r'(Jan\0403 Jan\0405 SHOP $9.00)Tj')):
+        file_path = str(tmp_path / f'{name}.pdf')
+        write_pdf(file_path, [[operator]], raw_pages={0})
+
+        page = PyPDF2.PdfReader(file_path).pages[0]
+        assert list(parser.parse_page(page.extract_text())) == [('Jan 3', 'SHOP', 9.00)]
+        assert PDFParser.may_have_transactions(page)
+        assert [expense.debit for expense in PDFParser(file_path, lazy=True, pages='1').iter_expenses()] == [9.00]
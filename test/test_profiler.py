@@ -0,0 +1,84 @@
+import json
+import sys
+import tracemalloc
+from difflib import SequenceMatcher
+
+from BudgetBuddy import Profiler
+from BudgetBuddy.Batch import ingest_each
+from BudgetBuddy.Parser import FileParser, QIFParser, PDFParser
+from benchmarks.synthetic import generate_qif, write_pdf
+
+def test_inactive():
+    '''Stages and counters do nothing without an active profile'''
+    assert Profiler.active() is None
+    with Profiler.stage('parse') as timer:
+        timer.rows = 10
+    Profiler.count('rows', 10)
+
+def test_stages_and_probes():
+    '''Stages add up per name, probes are removed when the profile stops'''
+    ratio = SequenceMatcher.ratio
+    with Profiler.Profile() as profile:
+        assert Profiler.active() is profile and SequenceMatcher.ratio is not ratio
+        for rows in (3, 4):
+            with Profiler.stage('parse', rows):
+                SequenceMatcher(None, 'publix', 'publx').ratio()
+                FileParser.clean_description('PUBLIX #123')
+
+    assert Profiler.active() is None and SequenceMatcher.ratio is ratio
+    report = profile.report()
+    assert report['stages']['parse']['calls'] == 2 and report['stages']['parse']['rows'] == 7
+    assert report['probes']['clean_description']['calls'] == 2
+    # __init__ sets both sequences, then ratio
+    assert report['probes']['SequenceMatcher']['calls'] == 6
+    json.dumps(report)
+
+def test_category_counters():
+    '''Each distinct description is counted once by how it was resolved'''
+    parser = QIFParser('', lazy=True)
+    exact  = next(iter(parser.category_map))
+    with Profiler.Profile() as profile:
+        parser.categorize_many([exact, exact, exact + 's', 'zzzzqqqq'])
+        parser.categorize_many(['zzzzqqqq'])
+
+    assert dict(profile.counters) == {'categories.rows' : 5, 'categories.reused' : 1, 'categories.exact' : 1,
+                                      'categories.cached' : 0, 'categories.fuzzy' : 1, 'categories.unknown' : 1}
+    assert profile.stages['fuzzy_match']['rows'] == 2
+
+def test_worker_reports_are_merged(tmp_path):
+    '''Statements parsed in worker processes show up in the parent's profile'''
+    file_paths = []
+    for seed in range(2):
+        file_paths.append(str(tmp_path / f'{seed}.qif'))
+        generate_qif(file_paths[-1], 40, seed)
+
+    with Profiler.Profile() as profile:
+        results = list(ingest_each(file_paths, workers=2))
+
+    assert len(results) == 2
+    assert profile.stages['QIFParser']['calls'] == 2 and profile.stages['QIFParser']['rows'] == 80
+    assert profile.counters['categories.from_file'] == 80
+
+def profiling_state(*args) -> tuple:
+    '''What a process still measures: a profile, a profiler hook, traced memory and probes'''
+    return (Profiler.active() is not None, sys.getprofile() is not None, tracemalloc.is_tracing(),
+            hasattr(SequenceMatcher.ratio, '__wrapped__'))
+
+def state_pages(file_path : str, page_numbers : list[int]) -> list[str]:
+    '''Stands in for PDFParser.extract_pages, each page's text is the worker's profiling state'''
+    return [repr(profiling_state())] * len(page_numbers)
+
+def test_parser_pools_detach(tmp_path, monkeypatch):
+    '''The match and page pools of a profiled process do not profile themselves'''
+    file_path = str(tmp_path / 'statement.pdf')
+    write_pdf(file_path, [['Jan 3 Jan 5 SHOP $1.00']] * 2)
+    monkeypatch.setattr(PDFParser, 'extract_pages', staticmethod(state_pages))
+
+    with Profiler.Profile(cprofile=True, memory_top=1):
+        assert profiling_state() == (True, True, True, True)
+        qif = QIFParser('', lazy=True, match_workers=2)
+        assert qif.match_executor().submit(profiling_state).result() == (False, False, False, False)
+        qif.close_match_pool()
+
+        pdf = PDFParser(file_path, lazy=True, pages='1-', detect_pages=False, workers=2)
+        assert [text for _, text in pdf.iter_page_text()] == [repr((False, False, False, False))] * 2
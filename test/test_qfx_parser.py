@@ -0,0 +1,76 @@
+import io
+import xml.etree.ElementTree as ET
+from BudgetBuddy.OFXStream import OFXStream
+from BudgetBuddy.Parser import QFXParser
+
+SGML = b'''OFXHEADER:100
+DATA:OFXSGML
+VERSION:102
+ENCODING:USASCII
+CHARSET:1252
+
+<OFX>
+<SIGNONMSGSRSV1><SONRS><STATUS><CODE>0<SEVERITY>INFO</STATUS><DTSERVER>20240105</SONRS></SIGNONMSGSRSV1>
+<CREDITCARDMSGSRSV1>
+<CCSTMTTRNRS><CCSTMTRS><BANKTRANLIST><DTSTART>20240101<DTEND>20240131
+<STMTTRN><TRNTYPE>DEBIT<DTPOSTED>20240103<TRNAMT>-45.67<FITID>1<NAME>PUBLIX<MEMO>PUBLIX #1234</STMTTRN>
+<STMTTRN><TRNTYPE>CREDIT<DTPOSTED>20240104<TRNAMT>100.00<FITID>2<NAME>PAYMENT</STMTTRN>
+</BANKTRANLIST></CCSTMTRS></CCSTMTTRNRS>
+<CCSTMTTRNRS><CCSTMTRS><BANKTRANLIST>
+<STMTTRN>
+<TRNTYPE>DEBIT
+<DTPOSTED>20240105
+<TRNAMT>-5.25
+<FITID>3
+<NAME>AT&T CAF\xc9
+</STMTTRN>
+</BANKTRANLIST></CCSTMTRS></CCSTMTTRNRS>
+</CREDITCARDMSGSRSV1>
+</OFX>
+'''
+
+XML = b'''<?xml version="1.0" encoding="UTF-8"?>
+<?OFX OFXHEADER="200" VERSION="211" SECURITY="NONE"?>
+<OFX><CREDITCARDMSGSRSV1><CCSTMTTRNRS><CCSTMTRS><BANKTRANLIST>
+<STMTTRN><TRNTYPE>DEBIT</TRNTYPE><DTPOSTED>20240103</DTPOSTED><TRNAMT>-45.67</TRNAMT><MEMO>PUBLIX #1234</MEMO></STMTTRN>
+</BANKTRANLIST></CCSTMTRS></CCSTMTTRNRS></CREDITCARDMSGSRSV1></OFX>
+'''
+
+def test_ofx_stream_sgml_to_xml():
+    '''Unclosed leaves are closed, closed ones are left alone and the header is dropped'''
+    root = ET.fromstring(OFXStream(io.BytesIO(SGML)).read())
+    assert root.tag == 'OFX'
+    assert root.findtext('SIGNONMSGSRSV1/SONRS/STATUS/SEVERITY') == 'INFO'
+    assert [transaction.findtext('NAME') for transaction in root.iter('STMTTRN')] == ['PUBLIX', 'PAYMENT', 'AT&T CAFÉ']
+
+def test_ofx_stream_block_boundaries():
+    '''Any block size gives the same XML'''
+    expected = OFXStream(io.BytesIO(SGML)).read()
+    for block_size in (1, 2, 3, 5, 8, 13, 64):
+        assert OFXStream(io.BytesIO(SGML), block_size).read() == expected
+
+def test_ofx_stream_closed_on_next_line():
+    '''A leaf closed after whitespace is not closed a second time'''
+    text = b'<OFX><STMTTRN><NAME>SHOP\n</NAME><MEMO>CAFE \r\n\t</MEMO><TRNAMT>-1.00\n</STMTTRN></OFX>'
+    for block_size in (1, 7, 64):
+        root = ET.fromstring(OFXStream(io.BytesIO(text), block_size).read())
+        assert [root.findtext(f'STMTTRN/{tag}').strip() for tag in ('NAME', 'MEMO', 'TRNAMT')] == ['SHOP', 'CAFE', '-1.00']
+
+def test_ofx_stream_xml_passthrough():
+    '''OFX 2 files are already XML'''
+    assert OFXStream(io.BytesIO(XML), 7).read() == XML
+
+def test_qfx_parser_sgml(tmp_path):
+    '''Debits of every account, MEMO falling back to NAME'''
+    file_path = tmp_path / 'statement.qfx'
+    file_path.write_bytes(SGML)
+    expenses = QFXParser(str(file_path), lazy=True).iter_expenses()
+    assert [(expense.description, expense.debit, expense.date) for expense in expenses] == \
+           [('PUBLIX', 45.67, '20240103'), ('ATT CAFÉ', 5.25, '20240105')]
+
+def test_qfx_parser_xml(tmp_path):
+    '''XML OFX parses the same way'''
+    file_path = tmp_path / 'statement.ofx'
+    file_path.write_bytes(XML)
+    expenses = QFXParser(str(file_path), lazy=True).iter_expenses()
+    assert [(expense.description, expense.debit, expense.date) for expense in expenses] == [('PUBLIX', 45.67, '20240103')]
@@ -0,0 +1,98 @@
+from BudgetBuddy.Parser import QIFParser
+
+QIF = '''!Type:CCard
+D01/05/2024
+T-45.67
+C*
+PPUBLIX #1234
+LGroceries
+^
+
+D01/06/2024
+MRent payment
+U-1,205.00
+T-1,205.00
+PLANDLORD LLC
+^
+!Option:AutoSwitch
+D01/07/2024
+PAT&T
+T-5.25
+L[Checking]
+^
+D01/08/2024
+MNo payee
+T12.00
+^'''
+
+def parse(tmp_path, text):
+    '''Write the QIF text and return its (description, category, debit, date) rows'''
+    file_path = tmp_path / 'export.qif'
+    file_path.write_text(text, encoding='utf-8')
+    return [(expense.description, expense.category, expense.debit, expense.date)
+            for expense in QIFParser(str(file_path), lazy=True).iter_expenses()]
+
+def test_qif_fields_in_any_order(tmp_path):
+    '''Records are read by field code, blank and header lines are skipped'''
+    assert parse(tmp_path, QIF) == [('PUBLIX #1234', 'Groceries', 45.67, '01/05/2024'),
+                                    ('LANDLORD LLC', 'Unknown', 1205.0, '01/06/2024'),
+                                    ('AT&T', 'mobile_phone', 5.25, '01/07/2024'),
+                                    ('No payee', 'Unknown', 12.0, '01/08/2024')]
+
+def test_qif_chunk_boundaries(tmp_path, monkeypatch):
+    '''Lines split across chunks are put back together'''
+    expected = parse(tmp_path, QIF)
+    for chunk_size in (1, 3, 7):
+        monkeypatch.setattr(QIFParser, 'CHUNK_SIZE', chunk_size)
+        assert parse(tmp_path, QIF) == expected
+
+def test_qif_category_skips_matching(tmp_path, monkeypatch):
+    '''Records with an L category never reach the matcher'''
+    def fail(self, key):
+        raise AssertionError(key)
+    monkeypatch.setattr(QIFParser, 'fuzzy_category', fail)
+    assert parse(tmp_path, 'D01/05/2024\nT-1.00\nPPUBLIX\nLGroceries\n^\n') == [('PUBLIX', 'Groceries', 1.0, '01/05/2024')]
+
+AUTOSWITCH = '''!Option:AutoSwitch
+!Account
+NChecking
+TBank
+^
+NVisa
+TCCard
+^
+!Clear:AutoSwitch
+!Type:Cat
+NGroceries
+DFood
+E
+^
+!Type:Memorized
+KC
+T-9.99
+PNETFLIX
+^
+!Account
+NChecking
+TBank
+^
+!Type:Bank
+D01/05/2024
+T-45.67
+PPUBLIX #1234
+LGroceries
+^
+!Account
+NVisa
+TCCard
+^
+!Type:CCard
+D01/06/2024
+T-5.25
+PAT&T
+^'''
+
+def test_qif_multi_account_export(tmp_path):
+    '''Account lists, categories and memorized records are skipped, every account's transactions are read'''
+    assert parse(tmp_path, AUTOSWITCH) == [('PUBLIX #1234', 'Groceries', 45.67, '01/05/2024'),
+                                           ('AT&T', 'mobile_phone', 5.25, '01/06/2024')]